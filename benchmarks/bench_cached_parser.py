@@ -0,0 +1,64 @@
+"""
+Path: benchmarks/bench_cached_parser.py
+Tiempo de parseo en régimen estable con y sin CachedParser según la tasa de repetición
+de los cuerpos (mensajes idénticos, a veces con otros espacios).
+
+Uso: python -m benchmarks.bench_cached_parser [cantidad]
+"""
+
+import random
+import sys
+import time
+
+from benchmarks.corpus import generar_mensaje
+from src.entities.message_parser import MessageParser
+from src.entities.strategies import ObservacionTareaStrategy
+from src.uses_cases.cached_parser import CachedParser
+
+TASAS = (0.0, 0.5, 0.8, 0.95)
+LOTE = 200
+
+
+def corpus(n: int, tasa: float, semilla: int = 42) -> list[str]:
+    "n cuerpos donde una fracción `tasa` repite alguno de los 500 textos habituales."
+    rng = random.Random(semilla)
+    habituales = [generar_mensaje(rng) for _ in range(500)]
+    out = []
+    for _ in range(n):
+        if rng.random() < tasa:
+            texto = rng.choice(habituales)
+            out.append(texto if rng.random() < 0.8 else f" {texto}  ")
+        else:
+            out.append(generar_mensaje(rng))
+    return out
+
+
+def medir(parser, textos: list[str]) -> float:
+    "Segundos para parsear los textos en lotes de LOTE, como el monitor."
+    inicio = time.perf_counter()
+    for i in range(0, len(textos), LOTE):
+        parser.parse_many(textos[i:i + LOTE])
+    return time.perf_counter() - inicio
+
+
+def main():
+    "Ejecuta el benchmark e imprime los resultados."
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    estrategia = ObservacionTareaStrategy(MessageParser())
+    print(f"{'repetidos':>9} | {'sin caché (s)':>13} | {'con caché (s)':>13} | "
+          f"{'aciertos':>8} | {'ahorro':>6}")
+    for tasa in TASAS:
+        textos = corpus(n, tasa)
+        cache = CachedParser(estrategia)
+        # Régimen estable: la caché ya vio la primera mitad del día
+        cache.parse_many(textos[:n // 2])
+        cache.aciertos = cache.fallos = 0
+        t_sin = medir(estrategia, textos[n // 2:])
+        t_con = medir(cache, textos[n // 2:])
+        tasa_aciertos = cache.metricas()["tasa_aciertos"]
+        print(f"{tasa:>9.0%} | {t_sin:>13.3f} | {t_con:>13.3f} | "
+              f"{tasa_aciertos:>8.1%} | {1 - t_con / t_sin:>6.1%}")
+
+
+if __name__ == "__main__":
+    main()
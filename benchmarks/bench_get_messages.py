@@ -0,0 +1,62 @@
+"""
+Path: benchmarks/bench_get_messages.py
+Compara la extracción masiva contra la lectura por elemento de WhatsAppClient
+sobre un HTML estático local con 100, 1k y 10k burbujas.
+
+Uso: python -m benchmarks.bench_get_messages
+"""
+
+import html
+import tempfile
+import time
+from pathlib import Path
+
+from playwright.sync_api import sync_playwright
+
+from src.interface_adapters.gateways.whatsapp_client import WhatsAppClient
+
+TAMANIOS = (100, 1_000, 10_000)
+
+
+def generar_fixture(n: int) -> str:
+    "Genera un HTML que imita la estructura de burbujas de WhatsApp Web."
+    filas = []
+    for i in range(n):
+        meta = html.escape(f"[{i % 24:02d}:{i % 60:02d}, 11/8/2025] Operario {i % 7}: ")
+        body = html.escape(f"Maquina de bolsas formato 22x10x30 hicimos {1000 + i} bolsas")
+        filas.append(
+            f'<div role="row"><div data-id="false_grupo_{i:08d}">'
+            f'<div class="copyable-text" data-pre-plain-text="{meta}">'
+            f"<span>{body}</span></div></div></div>"
+        )
+    return "<html><body><div id='main'>" + "".join(filas) + "</div></body></html>"
+
+
+def medir(fn) -> tuple[float, int]:
+    "Ejecuta fn y retorna (segundos, cantidad de mensajes)."
+    inicio = time.perf_counter()
+    mensajes = fn()
+    return time.perf_counter() - inicio, len(mensajes)
+
+
+def main():
+    "Ejecuta el benchmark e imprime los resultados."
+    with tempfile.TemporaryDirectory() as tmp, sync_playwright() as p:
+        browser = p.chromium.launch(headless=True)
+        page = browser.new_page()
+        cliente = WhatsAppClient(user_data_dir=tmp)
+        cliente.page = page
+        print(f"{'burbujas':>9} | {'masivo (s)':>10} | {'por elemento (s)':>16} | {'speedup':>7}")
+        for n in TAMANIOS:
+            fixture = Path(tmp) / f"chat_{n}.html"
+            fixture.write_text(generar_fixture(n), encoding="utf-8")
+            page.goto(fixture.as_uri())
+            t_bulk, c_bulk = medir(cliente._get_messages_bulk)  # pylint: disable=protected-access
+            t_elem, c_elem = medir(cliente._get_messages_por_elemento)  # pylint: disable=protected-access
+            assert c_bulk == c_elem == n
+            print(f"{n:>9} | {t_bulk:>10.3f} | {t_elem:>16.3f} | {t_elem / t_bulk:>6.1f}x")
+        browser.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,81 @@
+"""
+Path: benchmarks/bench_ingest.py
+Payloads por segundo de IngestService contra un servidor HTTP local: envío uno a uno
+(send) contra envío en bloque (send_many), con y sin gzip.
+
+Uso: python -m benchmarks.bench_ingest [cantidad]
+"""
+
+import gzip
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from src.interface_adapters.gateways.ingest_service import IngestService
+
+
+class IngestaHandler(BaseHTTPRequestHandler):
+    "Servidor de ingesta mínimo: acepta un payload o un array y responde un id por payload."
+    protocol_version = "HTTP/1.1"
+    contador = 0
+
+    def do_POST(self):  # pylint: disable=invalid-name
+        "Recibe payloads y responde sus ids."
+        cuerpo = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.headers.get("Content-Encoding") == "gzip":
+            cuerpo = gzip.decompress(cuerpo)
+        datos = json.loads(cuerpo)
+        cantidad = len(datos) if isinstance(datos, list) else 1
+        inicio = IngestaHandler.contador
+        IngestaHandler.contador += cantidad
+        if isinstance(datos, list):
+            respuesta = json.dumps([{"id": inicio + i} for i in range(cantidad)])
+        else:
+            respuesta = str(inicio)
+        salida = respuesta.encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(salida)))
+        self.end_headers()
+        self.wfile.write(salida)
+
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        "Silencia el log de accesos."
+
+
+def payload(i: int) -> dict:
+    "Payload típico de MessageProcessor."
+    return {"fecha": "2025-08-11", "maquina": "bolsas", "formato": "22x10x30",
+            "cantidad": 6800 + i, "turno": "tarde", "personas": 3, "obs": ""}
+
+
+def main():
+    "Ejecuta el benchmark e imprime los resultados."
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 5_000
+    server = ThreadingHTTPServer(("127.0.0.1", 0), IngestaHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/ingesta"
+    payloads = [payload(i) for i in range(n)]
+
+    casos = [
+        ("send (uno a uno)", IngestService(url), False),
+        ("send_many x100", IngestService(url, batch_endpoint=url, batch_size=100), True),
+        ("send_many x500", IngestService(url, batch_endpoint=url, batch_size=500), True),
+        ("send_many x500 gzip", IngestService(url, batch_endpoint=url, batch_size=500, compress=True), True),
+    ]
+    for nombre, service, en_bloque in casos:
+        inicio = time.perf_counter()
+        if en_bloque:
+            estados = service.send_many(payloads)
+        else:
+            estados = [service.send(p) for p in payloads]
+        segundos = time.perf_counter() - inicio
+        assert len(estados) == n and not any(e.startswith("Error") for e in estados)
+        print(f"{nombre:<22} {n / segundos:>10,.0f} payloads/s")
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
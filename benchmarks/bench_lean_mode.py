@@ -0,0 +1,98 @@
+"""
+Path: benchmarks/bench_lean_mode.py
+Compara WhatsAppClient normal y en modo liviano (--lean): tiempo de carga y RSS del árbol
+de procesos del navegador sobre una página local con burbujas, avatares y una fuente web.
+
+Uso: python -m benchmarks.bench_lean_mode [burbujas]
+"""
+
+import functools
+import html
+import random
+import struct
+import sys
+import tempfile
+import threading
+import time
+import zlib
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+from src.interface_adapters.gateways.whatsapp_client import WhatsAppClient
+from src.shared.process_metrics import rss_arbol
+
+
+def png(lado: int) -> bytes:
+    "PNG RGB de lado x lado píxeles con ruido, para que no comprima a casi nada."
+    rng = random.Random(lado)
+    filas = b"".join(b"\x00" + rng.randbytes(lado * 3) for _ in range(lado))
+    def chunk(tipo, datos):
+        return (struct.pack(">I", len(datos)) + tipo + datos
+                + struct.pack(">I", zlib.crc32(tipo + datos) & 0xFFFFFFFF))
+    return (b"\x89PNG\r\n\x1a\n" + chunk(b"IHDR", struct.pack(">IIBBBBB", lado, lado, 8, 2, 0, 0, 0))
+            + chunk(b"IDAT", zlib.compress(filas)) + chunk(b"IEND", b""))
+
+
+def generar_sitio(raiz: Path, n: int):
+    "Escribe index.html con n burbujas (cada una con su avatar) y una fuente web."
+    (raiz / "avatar").mkdir()
+    imagen = png(96)
+    filas = []
+    for i in range(n):
+        (raiz / "avatar" / f"{i}.png").write_bytes(imagen)
+        meta = html.escape(f"[{i % 24:02d}:{i % 60:02d}, 11/8/2025] Operario {i % 7}: ")
+        body = html.escape(f"Maquina de bolsas formato 22x10x30 hicimos {1000 + i} bolsas")
+        filas.append(
+            f'<div role="row"><div data-id="false_grupo_{i:08d}"><img src="avatar/{i}.png">'
+            f'<div class="copyable-text" data-pre-plain-text="{meta}">'
+            f"<span>{body}</span></div></div></div>"
+        )
+    (raiz / "fuente.woff2").write_bytes(bytes(200_000))
+    estilo = ("<style>@font-face{font-family:F;src:url(fuente.woff2)}"
+              "body{font-family:F,sans-serif}</style>")
+    (raiz / "index.html").write_text(
+        f"<html><head>{estilo}</head><body><div id='main'>{''.join(filas)}</div></body></html>",
+        encoding="utf-8"
+    )
+
+
+class HandlerSilencioso(SimpleHTTPRequestHandler):
+    "Servidor de archivos sin log por request."
+    def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+        pass
+
+
+def medir(url: str, lean: bool) -> tuple[float, float, int]:
+    "Lanza el cliente, carga la página y retorna (segundos, MiB de RSS extra, bloqueados)."
+    base = rss_arbol() or 0
+    with tempfile.TemporaryDirectory() as perfil:
+        with WhatsAppClient(user_data_dir=perfil, headless=True, lean=lean) as cliente:
+            inicio = time.perf_counter()
+            cliente.page.goto(url, wait_until="load")
+            cliente.page.wait_for_selector("div.copyable-text")
+            segundos = time.perf_counter() - inicio
+            rss = ((rss_arbol() or 0) - base) / 2**20
+            return segundos, rss, cliente.recursos_bloqueados
+
+
+def main():
+    "Ejecuta el benchmark e imprime los resultados."
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    with tempfile.TemporaryDirectory() as tmp:
+        generar_sitio(Path(tmp), n)
+        handler = functools.partial(HandlerSilencioso, directory=tmp)
+        servidor = ThreadingHTTPServer(("127.0.0.1", 0), handler)
+        threading.Thread(target=servidor.serve_forever, daemon=True).start()
+        url = f"http://127.0.0.1:{servidor.server_address[1]}/index.html"
+        try:
+            print(f"{'modo':>8} | {'carga (s)':>9} | {'RSS (MiB)':>9} | {'bloqueados':>10}")
+            for lean in (False, True):
+                segundos, rss, bloqueados = medir(url, lean)
+                nombre = "lean" if lean else "normal"
+                print(f"{nombre:>8} | {segundos:>9.2f} | {rss:>9.0f} | {bloqueados:>10,}")
+        finally:
+            servidor.shutdown()
+
+
+if __name__ == "__main__":
+    main()
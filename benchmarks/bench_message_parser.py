@@ -0,0 +1,38 @@
+"""
+Path: benchmarks/bench_message_parser.py
+Throughput de MessageParser.parse en mensajes por segundo sobre el corpus sintético.
+
+Uso: python -m benchmarks.bench_message_parser [cantidad]
+"""
+
+import sys
+import time
+
+from benchmarks.corpus import generar_mensajes
+from src.entities.message_parser import MessageParser
+from src.entities.strategies import ObservacionTareaStrategy
+
+
+def medir(parse, mensajes: list[str], repeticiones: int = 3) -> float:
+    "Mejor throughput (mensajes/s) de varias pasadas."
+    mejor = 0.0
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        for texto in mensajes:
+            parse(texto)
+        mejor = max(mejor, len(mensajes) / (time.perf_counter() - inicio))
+    return mejor
+
+
+def main():
+    "Ejecuta el benchmark e imprime los resultados."
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 50_000
+    mensajes = generar_mensajes(n)
+    parser = MessageParser()
+    estrategia = ObservacionTareaStrategy(parser)
+    print(f"MessageParser.parse:            {medir(parser.parse, mensajes):>10,.0f} msg/s")
+    print(f"ObservacionTareaStrategy.parse: {medir(estrategia.parse, mensajes):>10,.0f} msg/s")
+
+
+if __name__ == "__main__":
+    main()
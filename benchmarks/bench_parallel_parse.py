@@ -0,0 +1,40 @@
+"""
+Path: benchmarks/bench_parallel_parse.py
+Speedup del parseo paralelo de historial (ProcessPoolExecutor) según la cantidad de workers.
+
+Uso: python -m benchmarks.bench_parallel_parse [cantidad] [chunk]
+"""
+
+import os
+import sys
+import time
+
+from benchmarks.corpus import generar_mensajes
+from src.entities.message_parser import MessageParser
+from src.entities.strategies import ObservacionTareaStrategy
+from src.uses_cases.parallel_parser import ParallelParser
+
+
+def main():
+    "Ejecuta el benchmark e imprime los resultados."
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    chunk = int(sys.argv[2]) if len(sys.argv) > 2 else 2000
+    mensajes = generar_mensajes(n)
+    estrategia = ObservacionTareaStrategy(MessageParser())
+    base = None
+    workers = 1
+    print(f"{'workers':>7} | {'segundos':>8} | {'msg/s':>10} | {'speedup':>7}")
+    while workers <= (os.cpu_count() or 1):
+        with ParallelParser(estrategia, workers=workers, chunk_size=chunk) as parser:
+            parser.parse_many(mensajes[:chunk * workers + 1])  # arranque del pool
+            inicio = time.perf_counter()
+            resultados = parser.parse_many(mensajes)
+            segundos = time.perf_counter() - inicio
+        assert len(resultados) == n
+        base = base or segundos
+        print(f"{workers:>7} | {segundos:>8.2f} | {n / segundos:>10,.0f} | {base / segundos:>6.1f}x")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+"""
+Path: benchmarks/bench_poll_scheduler.py
+Simula un día de mensajes (ráfagas en los cambios de turno, silencio de madrugada) y compara
+el polling fijo cada poll_sec con el PollScheduler adaptativo: lecturas, lecturas vacías y
+latencia desde la llegada del mensaje hasta su lectura.
+
+Uso: python -m benchmarks.bench_poll_scheduler [dias]
+"""
+
+import bisect
+import random
+import statistics
+import sys
+from datetime import datetime, timedelta
+
+from src.uses_cases.poll_scheduler import PollScheduler
+
+# Valores por defecto de AppConfig
+POLL_SEC = 5
+TURNOS = {"mañana": 6, "tarde": 14, "noche": 22}
+
+
+def llegadas(dias: int, turnos: dict, semilla: int = 42) -> list[float]:
+    "Instantes (s) de llegada: ~6 msg/min cerca de cada cambio de turno, ~2/h de día, nada de 0 a 5."
+    rng = random.Random(semilla)
+    out = []
+    t = 0.0
+    fin = dias * 86400
+    while t < fin:
+        minuto = (t % 86400) // 60
+        cerca = any(abs(minuto - hora * 60) <= 30 for hora in turnos.values())
+        if cerca:
+            tasa = 6 / 60
+        elif minuto < 5 * 60:
+            tasa = 0.0
+        else:
+            tasa = 2 / 3600
+        if tasa:
+            t += rng.expovariate(tasa)
+            out.append(t)
+        else:
+            t = (t // 60 + 1) * 60
+    return [x for x in out if x < fin]
+
+
+def simular(tiempos: list[float], fin: float, siguiente) -> tuple[int, int, list[float]]:
+    "Ejecuta el polling hasta `fin`; siguiente(nuevos, t) da el próximo intervalo."
+    lecturas = vacias = 0
+    latencias = []
+    t = 0.0
+    leidos = 0
+    while t < fin:
+        hasta = bisect.bisect_right(tiempos, t)
+        nuevos = tiempos[leidos:hasta]
+        latencias.extend(t - x for x in nuevos)
+        leidos = hasta
+        lecturas += 1
+        vacias += not nuevos
+        t += siguiente(len(nuevos), t)
+    return lecturas, vacias, latencias
+
+
+def main():
+    "Ejecuta la simulación e imprime los resultados."
+    dias = int(sys.argv[1]) if len(sys.argv) > 1 else 7
+    tiempos = llegadas(dias, TURNOS)
+    fin = dias * 86400
+    origen = datetime(2024, 5, 1)
+    scheduler = PollScheduler(min_sec=2, max_sec=60, factor=2.0, turnos=TURNOS,
+                              margen_turno_min=30, techo_turno_sec=POLL_SEC)
+    casos = {
+        f"fijo {POLL_SEC} s": lambda nuevos, t: POLL_SEC,
+        "adaptativo": lambda nuevos, t: scheduler.registrar(nuevos, origen + timedelta(seconds=t)),
+    }
+    print(f"{len(tiempos):,} mensajes en {dias} días")
+    for nombre, siguiente in casos.items():
+        lecturas, vacias, latencias = simular(tiempos, fin, siguiente)
+        cuantiles = statistics.quantiles(latencias, n=100)
+        print(f"{nombre:<12} lecturas: {lecturas:>8,}  vacías: {vacias:>8,}  "
+              f"latencia p50: {cuantiles[49]:5.1f} s  p95: {cuantiles[94]:5.1f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Path: benchmarks/bench_presenter.py
+Renderizado de la tabla Fecha/Autor/Mensaje de HistorialPresenter con 100k filas, comparado
+con escribir la misma tabla ya formateada (el costo de E/S puro), a un archivo temporal.
+
+Uso: python -m benchmarks.bench_presenter [filas]
+"""
+
+import io
+import os
+import random
+import sys
+import tempfile
+import time
+
+from benchmarks.corpus import generar_mensajes
+from src.entities.meta_parser import MetaParser
+from src.interface_adapters.presenters.historial_presenter import HistorialPresenter
+
+AUTORES = ("Juan Pérez", "María José Núñez", "Operario 3", "‎~ Lucía 🌼", "Supervisor Turno Noche")
+
+
+def filas(n: int, semilla: int = 42) -> list[list[str]]:
+    "Filas [fecha, autor, mensaje] con el corpus sintético (acentos y emojis incluidos)."
+    rng = random.Random(semilla)
+    mensajes = generar_mensajes(n, semilla)
+    return [[f"{rng.randint(1, 28)}/8/2025", rng.choice(AUTORES), mensaje] for mensaje in mensajes]
+
+
+def medir(tabla: list, salida) -> float:
+    "Segundos para renderizar la tabla completa en la salida."
+    presenter = HistorialPresenter(MetaParser(), salida=salida)
+    inicio = time.perf_counter()
+    presenter.mostrar_tabla_autor_cargo(tabla, "bench")
+    return time.perf_counter() - inicio
+
+
+def main():
+    "Ejecuta el benchmark e imprime los resultados."
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    tabla = filas(n)
+    ascii_ = [[f.encode("ascii", "ignore").decode() for f in fila] for fila in tabla]
+    with tempfile.TemporaryDirectory() as tmp:
+        ruta = os.path.join(tmp, "tabla.txt")
+        for nombre, datos in (("unicode", tabla), ("ascii", ascii_)):
+            with open(ruta, "w", encoding="utf-8") as salida:
+                t_render = medir(datos, salida)
+            memoria = io.StringIO()
+            medir(datos, memoria)
+            texto = memoria.getvalue()
+            inicio = time.perf_counter()
+            with open(ruta, "w", encoding="utf-8") as salida:
+                salida.write(texto)
+            t_io = time.perf_counter() - inicio
+            print(f"{nombre:>8}: {n / t_render:>10,.0f} filas/s  ({t_render:.3f} s; "
+                  f"solo escritura {t_io:.3f} s, {len(texto.encode()) / 2**20:.1f} MiB)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,75 @@
+"""
+Path: benchmarks/bench_records.py
+Memoria y asignaciones por mensaje con dicts frente a los registros con __slots__
+(RawMessage, MetaInfo, IngestPayload), medidas con tracemalloc.
+
+Uso: python -m benchmarks.bench_records [cantidad]
+"""
+
+import sys
+import tracemalloc
+
+from benchmarks.corpus import generar_mensajes
+from src.entities.records import IngestPayload, MetaInfo, RawMessage
+
+
+def insumos(n: int) -> list[tuple]:
+    "Textos ya creados (meta, body, fecha, autor, maquina): se comparten entre ambas variantes."
+    cuerpos = generar_mensajes(n)
+    out = []
+    for i, body in enumerate(cuerpos):
+        fecha = f"{1 + i % 28:02d}/06/2025"
+        autor = f"Operario {i % 40}"
+        meta = f"[{i % 24:02d}:{i % 60:02d}, {fecha}] {autor}: "
+        out.append((meta, body, fecha, autor, str(i % 12)))
+    return out
+
+
+def con_dicts(datos: list[tuple]) -> list:
+    "Representación anterior: un dict por mensaje crudo, meta y payload."
+    return [(
+        {"meta": meta, "body": body, "id": ""},
+        {"fecha": fecha, "autor": autor},
+        {"fecha": fecha, "maquina": maquina, "formato": "", "cantidad": 0,
+         "turno": "", "personas": "", "obs": ""},
+    ) for meta, body, fecha, autor, maquina in datos]
+
+
+def con_registros(datos: list[tuple]) -> list:
+    "Representación actual con registros inmutables."
+    return [(
+        RawMessage(meta, body),
+        MetaInfo(fecha, autor),
+        IngestPayload(fecha, maquina=maquina),
+    ) for meta, body, fecha, autor, maquina in datos]
+
+
+def medir(construir, datos: list[tuple]) -> tuple[int, int]:
+    "(bytes, bloques) que quedan asignados tras construir los registros de `datos`."
+    tracemalloc.start()
+    antes = tracemalloc.take_snapshot()
+    registros = construir(datos)
+    despues = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    diferencias = despues.compare_to(antes, "filename")
+    total = sum(d.size_diff for d in diferencias)
+    bloques = sum(d.count_diff for d in diferencias)
+    del registros
+    return total, bloques
+
+
+def main():
+    "Ejecuta el benchmark e imprime los resultados."
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    datos = insumos(n)
+    print(f"{'representación':>14} | {'bytes/msg':>9} | {'bloques/msg':>11} | {'total (MB)':>10}")
+    resultados = {}
+    for nombre, construir in (("dicts", con_dicts), ("registros", con_registros)):
+        total, bloques = medir(construir, datos)
+        resultados[nombre] = total
+        print(f"{nombre:>14} | {total / n:>9.0f} | {bloques / n:>11.2f} | {total / 1e6:>10.1f}")
+    print(f"ahorro de memoria: {1 - resultados['registros'] / resultados['dicts']:.1%}")
+
+
+if __name__ == "__main__":
+    main()
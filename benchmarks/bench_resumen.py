@@ -0,0 +1,61 @@
+"""
+Path: benchmarks/bench_resumen.py
+Carga y agrupación de ResumenProduccion con 1M payloads sintéticos: tiempo de agregar,
+de agrupar por día/máquina/turno (NumPy si está instalado, si no Python) y memoria de columnas.
+
+Uso: python -m benchmarks.bench_resumen [cantidad]
+"""
+
+import random
+import sys
+import time
+
+from src.uses_cases import resumen_produccion
+from src.uses_cases.resumen_produccion import ResumenProduccion
+
+TURNOS = ("mañana", "tarde", "noche", "")
+
+
+def payloads(n: int, semilla: int = 42):
+    "Genera n pares (payload, fecha del meta) como los del historial."
+    rng = random.Random(semilla)
+    for i in range(n):
+        yield ({
+            "maquina": str(rng.randint(1, 12)),
+            "formato": rng.choice(("22x10x30", "30x15x40", "")),
+            "turno": rng.choice(TURNOS),
+            "cantidad": rng.choice((0, rng.randint(100, 9000))),
+            "personas": rng.choice(("", 2, 3, 4)),
+        }, f"{1 + i % 28}/8/2025")
+
+
+def main():
+    "Ejecuta el benchmark e imprime los resultados."
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    datos = list(payloads(n))
+    resumen = ResumenProduccion()
+    inicio = time.perf_counter()
+    for payload, dia in datos:
+        resumen.agregar(payload, dia)
+    t_agregar = time.perf_counter() - inicio
+    columnas = sum(col.itemsize * len(col) for col in resumen._columnas.values())  # pylint: disable=protected-access
+    columnas += resumen._cantidad.itemsize * n + resumen._personas.itemsize * n  # pylint: disable=protected-access
+    print(f"agregar:           {t_agregar:>7.3f} s ({t_agregar / n * 1e6:.2f} µs/payload)")
+    print(f"columnas:          {columnas / 2**20:>7.1f} MiB")
+    caminos = [("python", None)]
+    if resumen_produccion.np is not None:
+        caminos.insert(0, ("numpy", resumen_produccion.np))
+    for nombre, modulo in caminos:
+        np_original = resumen_produccion.np
+        resumen_produccion.np = modulo
+        try:
+            inicio = time.perf_counter()
+            filas = resumen.agrupar()
+            t_agrupar = time.perf_counter() - inicio
+        finally:
+            resumen_produccion.np = np_original
+        print(f"agrupar ({nombre:<6}): {t_agrupar:>7.3f} s ({len(filas):,} grupos)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Path: benchmarks/bench_seen_compact.py
+Memoria y throughput del índice compacto de huellas contra el set de hashes hex actual.
+
+Uso: python -m benchmarks.bench_seen_compact [cantidad]
+"""
+
+import hashlib
+import sys
+import time
+import tracemalloc
+
+from src.infrastructure.seen_index import FingerprintSeenIndex
+
+
+def clave(i: int, prefijo: str = "m") -> str:
+    "Clave SHA-1 hex como la que calcula MessageProcessor."
+    return hashlib.sha1(f"{prefijo}{i}".encode("utf-8")).hexdigest()
+
+
+def memoria_por_mensaje(crear, n: int) -> float:
+    "Bytes retenidos por mensaje (claves incluidas) tras registrar n claves."
+    tracemalloc.start()
+    index = crear()
+    for i in range(n):
+        index.add(clave(i))
+    memoria, _pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del index
+    return memoria / n
+
+
+def throughput(crear, keys: list[str], ausentes: list[str]) -> tuple[float, float]:
+    "Altas/s y consultas/s de un índice."
+    index = crear()
+    inicio = time.perf_counter()
+    for key in keys:
+        index.add(key)
+    t_alta = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    aciertos = sum(1 for key in keys if key in index)
+    fallos = sum(1 for key in ausentes if key not in index)
+    t_consulta = time.perf_counter() - inicio
+    assert aciertos == len(keys) and fallos == len(ausentes)
+    return len(keys) / t_alta, (len(keys) + len(ausentes)) / t_consulta
+
+
+def main():
+    "Ejecuta el benchmark e imprime los resultados."
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    keys = [clave(i) for i in range(n)]
+    ausentes = [clave(i, "x") for i in range(n // 10)]
+    for nombre, crear in (("set[str]", set), ("huellas 64b", FingerprintSeenIndex)):
+        por_mensaje = memoria_por_mensaje(crear, n)
+        altas, consultas = throughput(crear, keys, ausentes)
+        print(f"{nombre:<12} | {por_mensaje:>8.1f} B/msg | {altas:>12,.0f} altas/s | "
+              f"{consultas:>12,.0f} consultas/s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Path: benchmarks/bench_seen_index.py
+Throughput de altas y consultas del índice persistente de vistos con 1M+ claves.
+
+Uso: python -m benchmarks.bench_seen_index [cantidad]
+"""
+
+import hashlib
+import os
+import sys
+import tempfile
+import time
+
+from src.infrastructure.seen_index import SqliteSeenIndex
+
+
+def claves(n: int, semilla: str):
+    "Genera n claves SHA-1 hex como las de MessageProcessor."
+    for i in range(n):
+        yield hashlib.sha1(f"{semilla}{i}".encode("utf-8")).hexdigest()
+
+
+def main():
+    "Ejecuta el benchmark e imprime los resultados."
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    consultas = min(n, 200_000)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "seen.sqlite3")
+        with SqliteSeenIndex(path, cache_size=100_000, commit_every=10_000) as index:
+            inicio = time.perf_counter()
+            for key in claves(n, "m"):
+                index.add(key)
+            index.flush()
+            t_alta = time.perf_counter() - inicio
+            print(f"altas:             {n / t_alta:>12,.0f} claves/s ({n:,} claves)")
+
+        # Reapertura: caché fría, como tras reiniciar el monitor
+        with SqliteSeenIndex(path, cache_size=100_000) as index:
+            inicio = time.perf_counter()
+            aciertos = sum(1 for key in claves(consultas, "m") if key in index)
+            t_hit = time.perf_counter() - inicio
+            inicio = time.perf_counter()
+            fallos = sum(1 for key in claves(consultas, "x") if key not in index)
+            t_miss = time.perf_counter() - inicio
+            inicio = time.perf_counter()
+            calientes = sum(1 for key in claves(consultas, "m") if key in index)
+            t_cache = time.perf_counter() - inicio
+        assert aciertos == calientes == consultas and fallos == consultas
+        print(f"consultas (disco): {consultas / t_hit:>12,.0f} claves/s")
+        print(f"ausentes (disco):  {consultas / t_miss:>12,.0f} claves/s")
+        print(f"consultas (LRU):   {consultas / t_cache:>12,.0f} claves/s")
+        print(f"tamaño en disco:   {os.path.getsize(path) / 2**20:>12,.1f} MiB")
+
+
+if __name__ == "__main__":
+    main()
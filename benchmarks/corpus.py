@@ -0,0 +1,89 @@
+"""
+Path: benchmarks/corpus.py
+Generador determinístico de mensajes sintéticos de operarios (para benchmarks y golden tests).
+"""
+
+import random
+
+from src.entities.records import RawMessage
+
+MAQUINAS = ["maquina de bolsas", "máquina de manijas", "Maquina bolsas",
+            "producción de maquina de manijas", "producción de máquina de bolsas", "MAQUINA DE BOLSAS"]
+FORMATOS = ["22x10x30", "30x12x32", "18x08x25", "40X15X45", "22x10x30x40", "2x10x30"]
+TURNOS = ["turno mañana", "turno tarde", "turno noche", "Turno Tarde", "turno   noche"]
+PERSONAS = ["con 3 personas", "trabajamos con tres personas", "con dos personas",
+            "con 10 personas", "Trabajamos con cinco personas", "con seis personas", "falcon 4 personas"]
+CANTIDADES = ["hicimos {n} bolsas", "saldo de bobina {n}", "{n} manijas", "se hizo un total {n}",
+              "produjimos {n}", "faltan {n} bolsas", "pedido {n}", "stock {n}", "{n}"]
+TAREAS = ["hay que cambiar la cuchilla", "pendiente revisar el motor", "falta cinta",
+          "para mañana queda el pedido", "por hacer: limpieza", "debería venir el técnico",
+          "recordar apagar el compresor", "no olvidar la planilla", "terminado", "listo",
+          "ok", "finalizado el pedido", "todo hecho", "resuelto el atasco", "OK 👍", "Listo!!"]
+CHARLA = ["Buen día", "Hola, ¿cómo están?", "gracias", "👍", "Buenas noches a todos",
+          "alguien sabe dónde está la llave?", "", "   ", "jajaja", "Falta poco",
+          "mañana no vengo", "la máquina hace ruido", "debe estar por llegar"]
+OPERARIOS = ["Mariano Montenegro Madygraf", "Laura Gómez", "José Peña", "Carla", "Ramón Díaz",
+             "+54 9 11 5555-0101", "Sofía Núñez", "Turno Noche Bolsas"]
+
+
+def _cantidad(rng: random.Random) -> str:
+    "Número con o sin separador de miles."
+    n = rng.choice([rng.randint(1, 99), rng.randint(100, 999), rng.randint(1000, 99999)])
+    estilo = rng.random()
+    if n >= 1000 and estilo < 0.3:
+        return f"{n:,}".replace(",", ".")
+    if n >= 1000 and estilo < 0.5:
+        return f"{n:,}"
+    return str(n)
+
+
+def generar_mensaje(rng: random.Random) -> str:
+    "Genera un mensaje combinando fragmentos típicos del chat de producción."
+    if rng.random() < 0.25:
+        return rng.choice(CHARLA + TAREAS)
+    partes = []
+    if rng.random() < 0.6:
+        partes.append(rng.choice(MAQUINAS))
+    if rng.random() < 0.5:
+        partes.append("formato " + rng.choice(FORMATOS))
+    if rng.random() < 0.6:
+        partes.append(rng.choice(CANTIDADES).format(n=_cantidad(rng)))
+    if rng.random() < 0.4:
+        partes.append(rng.choice(TURNOS))
+    if rng.random() < 0.4:
+        partes.append(rng.choice(PERSONAS))
+    if rng.random() < 0.3:
+        partes.append(rng.choice(TAREAS))
+    if rng.random() < 0.2:
+        partes.append(rng.choice(CHARLA))
+    rng.shuffle(partes)
+    separador = rng.choice([" ", ", ", "\n", "  ", ". "])
+    return separador.join(partes)
+
+
+def generar_mensajes(n: int, semilla: int = 42) -> list[str]:
+    "Genera n mensajes de forma reproducible."
+    rng = random.Random(semilla)
+    return [generar_mensaje(rng) for _ in range(n)]
+
+
+def generar_meta(rng: random.Random, dia: int, minuto: int) -> str:
+    """Meta como el data-pre-plain-text de WhatsApp Web en español:
+    '[1:47 p. m., 11/8/2025] Autor: ' (dia: día de agosto; minuto: minuto del día)."""
+    hora, minutos = divmod(minuto % (24 * 60), 60)
+    sufijo = "a. m." if hora < 12 else "p. m."
+    return f"[{(hora % 12) or 12}:{minutos:02d} {sufijo}, {dia}/8/2025] {rng.choice(OPERARIOS)}: "
+
+
+def generar_chat(n: int, semilla: int = 42, dias: int = 30) -> list[RawMessage]:
+    """Genera n mensajes de chat (meta y cuerpo) en orden cronológico, repartidos en `dias` días,
+    de forma reproducible."""
+    rng = random.Random(semilla)
+    por_dia = max(1, -(-n // dias))
+    mensajes = []
+    for i in range(n):
+        dia, orden = divmod(i, por_dia)
+        minuto = orden * 24 * 60 // por_dia
+        meta = generar_meta(rng, 1 + dia % 31, minuto)
+        mensajes.append(RawMessage(meta, generar_mensaje(rng), f"msg_{i:08d}"))
+    return mensajes
@@ -0,0 +1,74 @@
+"""
+Path: benchmarks/fakes.py
+Gateways en memoria para medir servicios y monitores sin navegador ni servidor de ingesta.
+"""
+
+from src.entities.ingest_service_interface import IIngestService
+from src.entities.records import a_dict
+from src.entities.whatsapp_client_interface import IWhatsAppClient
+
+
+class FakeWhatsAppClient(IWhatsAppClient):
+    """Cliente que entrega un chat ya generado. Las lecturas incrementales devuelven de a `lote`
+    mensajes; al agotarse el chat, wait_for_messages corta el monitor como un Ctrl+C."""
+    def __init__(self, messages: list, lote: int = 50):
+        self.messages = list(messages)
+        self.lote = lote
+        self.chat_actual = None
+        self._leidos = 0
+
+    def initialize(self):
+        "No hay navegador que iniciar."
+
+    def open_chat(self, chat_name: str):
+        "Marca el chat como abierto; el contenido es siempre el mismo."
+        self.chat_actual = chat_name
+
+    def get_messages(self) -> list:
+        "Todos los mensajes del chat."
+        return list(self.messages)
+
+    def get_new_messages(self) -> list:
+        "Los siguientes `lote` mensajes aún no leídos."
+        nuevos = self.messages[self._leidos:self._leidos + self.lote]
+        self._leidos += len(nuevos)
+        return nuevos
+
+    def iter_history(self, hasta=None, max_mensajes: int | None = None):
+        "Lotes de `lote` mensajes, del más nuevo al más viejo (hasta se ignora)."
+        messages = self.messages
+        if max_mensajes is not None:
+            messages = messages[-max_mensajes:] if max_mensajes > 0 else []
+        for fin in range(len(messages), 0, -self.lote):
+            yield messages[max(0, fin - self.lote):fin]
+
+    def start_push(self) -> bool:
+        return True
+
+    def wait_for_messages(self, timeout: float) -> list:
+        "Entrega el siguiente lote sin esperar; sin mensajes pendientes detiene el monitor."
+        nuevos = self.get_new_messages()
+        if not nuevos:
+            raise KeyboardInterrupt
+        return nuevos
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+class FakeIngestService(IIngestService):
+    "Ingesta que serializa y guarda los payloads, y responde un id por payload como el servidor."
+    def __init__(self):
+        self.enviados = []
+
+    def send(self, payload: dict) -> str:
+        self.enviados.append(a_dict(payload))
+        return str(len(self.enviados))
+
+    def send_many(self, payloads) -> list[str]:
+        inicio = len(self.enviados)
+        self.enviados.extend(a_dict(payload) for payload in payloads)
+        return [str(i) for i in range(inicio + 1, len(self.enviados) + 1)]
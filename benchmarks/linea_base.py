@@ -0,0 +1,43 @@
+"""
+Path: benchmarks/linea_base.py
+Líneas base JSON de la suite de benchmarks y detección de regresiones.
+"""
+
+import json
+import os
+import platform
+
+# Empeoramiento relativo tolerado por defecto antes de considerar regresión (25 %)
+UMBRAL_REGRESION = 0.25
+
+
+def guardar(resultados: dict, ruta: str):
+    "Guarda los resultados ({caso: µs por mensaje}) como línea base."
+    os.makedirs(os.path.dirname(ruta) or ".", exist_ok=True)
+    datos = {"python": platform.python_version(), "maquina": platform.machine(), "casos": resultados}
+    with open(ruta, "w", encoding="utf-8") as f:
+        json.dump(datos, f, indent=2, sort_keys=True, ensure_ascii=False)
+        f.write("\n")
+
+
+def cargar(ruta: str) -> dict | None:
+    "Resultados de la línea base, o None si todavía no hay una guardada."
+    try:
+        with open(ruta, encoding="utf-8") as f:
+            return json.load(f)["casos"]
+    except FileNotFoundError:
+        return None
+
+
+def comparar(actual: dict, base: dict, umbral: float = UMBRAL_REGRESION) -> list[tuple]:
+    """Casos que empeoraron más que `umbral` respecto de la base, como (caso, base, actual, variación).
+    Los casos que no están en ambos lados no se comparan."""
+    regresiones = []
+    for caso, valor in actual.items():
+        previo = base.get(caso)
+        if not previo:
+            continue
+        variacion = valor / previo - 1
+        if variacion > umbral:
+            regresiones.append((caso, previo, valor, variacion))
+    return regresiones
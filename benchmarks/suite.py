@@ -0,0 +1,177 @@
+"""
+Path: benchmarks/suite.py
+Suite de benchmarks sobre un chat sintético y gateways en memoria: micro (parseo de cuerpos y
+metas, deduplicación) y de punta a punta (historial y bucle del monitor). Compara el tiempo por
+mensaje de cada caso con la línea base JSON y termina con código 1 si alguno empeora más que
+el umbral.
+
+La línea base depende de la máquina y no se versiona: se guarda con --guardar en el commit de
+referencia y se compara contra ella en la misma máquina.
+
+Uso: python -m benchmarks.suite [cantidad] [--guardar] [--umbral 0.25] [--solo historial]
+"""
+
+import argparse
+import io
+import sys
+import time
+
+from benchmarks import linea_base
+from benchmarks.corpus import generar_chat
+from benchmarks.fakes import FakeIngestService, FakeWhatsAppClient
+from src.application.historial_service import HistorialService
+from src.application.whatsapp_monitor import WhatsAppMonitor
+from src.entities.message_parser import MessageParser
+from src.entities.meta_parser import MetaParser
+from src.entities.strategies import ObservacionTareaStrategy
+from src.interface_adapters.presenters.historial_presenter import HistorialPresenter
+from src.shared.app_config import AppConfig
+from src.uses_cases.message_processor import MessageProcessor
+
+LINEA_BASE = "benchmarks/baselines/suite.json"
+CASOS = {}
+
+
+def caso(nombre: str):
+    "Registra un caso: recibe el chat y retorna la función a medir."
+    def registrar(fn):
+        CASOS[nombre] = fn
+        return fn
+    return registrar
+
+
+def _fecha() -> str:
+    return "2025-08-11"
+
+
+def _config(output_mode: str) -> AppConfig:
+    config = AppConfig()
+    config.output_mode = output_mode
+    config.backfill = False
+    config.resumen = False
+    config.push_mode = True
+    return config
+
+
+def _procesador() -> MessageProcessor:
+    return MessageProcessor(_fecha, ObservacionTareaStrategy(MessageParser()))
+
+
+@caso("parser.parse_many")
+def parse_many(chat: list):
+    "Parseo de los cuerpos en un solo lote."
+    estrategia = ObservacionTareaStrategy(MessageParser())
+    textos = [msg.body for msg in chat]
+    return lambda: estrategia.parse_many(textos)
+
+
+@caso("meta_parser.parse")
+def meta_parse(chat: list):
+    "Fecha y autor de cada meta."
+    meta_parser = MetaParser()
+    metas = [msg.meta for msg in chat]
+    return lambda: [meta_parser.parse(meta) for meta in metas]
+
+
+@caso("processor.process_batch")
+def process_batch(chat: list):
+    "Deduplicación, parseo y payloads de un chat que no se había visto."
+    return lambda: _procesador().process_batch(chat)
+
+
+@caso("processor.dedup")
+def dedup(chat: list):
+    "Relectura de un chat ya visto: todos los mensajes se descartan por duplicados."
+    procesador = _procesador()
+    procesador.process_batch(chat)
+    return lambda: procesador.process_batch(chat)
+
+
+def _historial(chat: list, output_mode: str):
+    "Revisión completa del historial con el chat y la ingesta en memoria."
+    def ejecutar():
+        meta_parser = MetaParser()
+        servicio = HistorialService(
+            _config(output_mode), FakeWhatsAppClient(chat), FakeIngestService(),
+            HistorialPresenter(meta_parser, salida=io.StringIO()), meta_parser, _procesador()
+        )
+        servicio.revisar()
+    return ejecutar
+
+
+@caso("historial.api")
+def historial_api(chat: list):
+    "Historial enviado a la ingesta."
+    return _historial(chat, "api")
+
+
+@caso("historial.cli")
+def historial_cli(chat: list):
+    "Historial listado como tabla."
+    return _historial(chat, "cli")
+
+
+@caso("monitor.push")
+def monitor_push(chat: list):
+    "Bucle del monitor en modo push: el chat llega en lotes de 50 hasta agotarse."
+    def ejecutar():
+        monitor = WhatsAppMonitor(_config("api"), FakeIngestService(), FakeWhatsAppClient(chat),
+                                  processor=_procesador())
+        monitor.meta_parser = MetaParser()
+        monitor.run()
+    return ejecutar
+
+
+def medir(fn, repeticiones: int) -> float:
+    "Mejor tiempo en segundos entre `repeticiones` ejecuciones."
+    mejor = float("inf")
+    for _ in range(repeticiones):
+        inicio = time.perf_counter()
+        fn()
+        mejor = min(mejor, time.perf_counter() - inicio)
+    return mejor
+
+
+def main() -> int:
+    "Ejecuta la suite, imprime los resultados y retorna el código de salida."
+    parser = argparse.ArgumentParser(description="Suite de benchmarks con línea base")
+    parser.add_argument("cantidad", type=int, nargs="?", default=20_000, help="Mensajes del chat sintético")
+    parser.add_argument("--repeticiones", type=int, default=5, help="Ejecuciones por caso (se toma la mejor)")
+    parser.add_argument("--solo", default=None, help="Solo los casos cuyo nombre contiene este texto")
+    parser.add_argument("--linea-base", default=LINEA_BASE, help="Archivo JSON de la línea base")
+    parser.add_argument("--umbral", type=float, default=linea_base.UMBRAL_REGRESION,
+                        help="Empeoramiento relativo tolerado (0.25 = 25%%)")
+    parser.add_argument("--guardar", action="store_true", help="Guarda los resultados como nueva línea base")
+    args = parser.parse_args()
+
+    chat = generar_chat(args.cantidad)
+    base = linea_base.cargar(args.linea_base) or {}
+    resultados = {}
+    print(f"{'caso':<24} | {'µs/msg':>8} | {'msg/s':>10} | {'base µs/msg':>11} | {'variación':>9}")
+    for nombre, crear in CASOS.items():
+        if args.solo and args.solo not in nombre:
+            continue
+        segundos = medir(crear(chat), args.repeticiones)
+        resultados[nombre] = round(segundos / len(chat) * 1e6, 3)
+        previo = base.get(nombre)
+        comparacion = (f"{previo:>11.3f} | {resultados[nombre] / previo - 1:>+9.1%}"
+                       if previo else f"{'-':>11} | {'-':>9}")
+        print(f"{nombre:<24} | {resultados[nombre]:>8.3f} | {len(chat) / segundos:>10,.0f} | {comparacion}")
+
+    if args.guardar:
+        # Se conservan los casos no ejecutados (--solo) de la línea base anterior
+        linea_base.guardar({**base, **resultados}, args.linea_base)
+        print(f"Línea base guardada en {args.linea_base}")
+        return 0
+    faltantes = [nombre for nombre in resultados if not base.get(nombre)]
+    if faltantes:
+        print(f"Sin línea base en {args.linea_base} para: {', '.join(faltantes)}; "
+              "usar --guardar para crearla.")
+    regresiones = linea_base.comparar(resultados, base, args.umbral)
+    for nombre, previo, actual, variacion in regresiones:
+        print(f"REGRESIÓN {nombre}: {previo:.3f} -> {actual:.3f} µs/msg ({variacion:+.1%})")
+    return 1 if regresiones else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,7 +2,13 @@
 Path: run.py
 """
 
+# Primer import: el perfil de arranque mide desde aquí
+from src.shared.startup_profiler import profiler, marcar
+
+import sys
+import json
 import argparse
+from contextlib import nullcontext
 from datetime import datetime
 
 from src.shared.logging_config import setup_logging
@@ -12,90 +18,264 @@ from src.entities.message_parser import MessageParser
 from src.entities.strategies import ObservacionTareaStrategy
 from src.entities.meta_parser import MetaParser
 from src.uses_cases.message_processor import MessageProcessor
-from src.application.historial_service import HistorialService
-from src.application.whatsapp_monitor import WhatsAppMonitor
-from src.interface_adapters.gateways.ingest_service import IngestService
-from src.interface_adapters.gateways.whatsapp_client import WhatsAppClient
-from src.interface_adapters.presenters.historial_presenter import HistorialPresenter
+from src.uses_cases.cached_parser import CachedParser
+# Los gateways pesados (Playwright, requests, aiohttp, tabulate) se importan solo en su modo
+
+marcar("imports")
+
+def cargar_author_roles(path: str) -> dict:
+    "Carga los roles de autor desde archivo; sin archivo (o inválido) no hay roles."
+    try:
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Monitor y revisión de historial de WhatsApp")
     parser.add_argument("--monitor", action="store_true", help="Inicia el monitor en tiempo real")
     parser.add_argument("--historial", action="store_true", help="Revisa el historial de mensajes")
+    parser.add_argument("--async", dest="async_mode", action="store_true",
+                        help="Monitor asíncrono (async Playwright + aiohttp en un event loop)")
     parser.add_argument("--debug", action="store_true", help="Habilita logging DEBUG")
     parser.add_argument("--output-mode", choices=["cli", "api"],
                         default="cli", help="Modo de salida")
-    import sys
+    parser.add_argument("--backfill", action="store_true",
+                        help="Recorre el historial hacia atrás por lotes (implica --historial)")
+    parser.add_argument("--hasta", metavar="AAAA-MM-DD",
+                        help="Backfill: detenerse en mensajes anteriores a esta fecha")
+    parser.add_argument("--max-mensajes", type=int,
+                        help="Backfill: cantidad máxima de mensajes a revisar")
+    parser.add_argument("--export", metavar="RUTA",
+                        help="Historial: leer un .txt de 'Exportar chat' (o su carpeta) sin navegador")
+    parser.add_argument("--workers", type=int,
+                        help="Historial: procesos para parsear en paralelo (1 = sin paralelismo)")
+    parser.add_argument("--chunk", type=int,
+                        help="Historial: mensajes por fragmento enviado a cada worker")
+    parser.add_argument("--resumen", action="store_true",
+                        help="Historial: totales por día, máquina y turno (implica --historial)")
+    parser.add_argument("--csv", metavar="RUTA",
+                        help="Resumen: escribir en CSV ('-' = salida estándar) en lugar de la tabla")
+    parser.add_argument("--pagina", type=int, metavar="FILAS",
+                        help="Historial: repetir el encabezado de la tabla cada FILAS filas")
+    parser.add_argument("--lean", action="store_true",
+                        help="Navegador liviano: sin imágenes, media ni fuentes")
+    parser.add_argument("--chats", nargs="+", metavar="CHAT",
+                        help="Monitor: vigilar varios chats alternando en la misma página")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="Informa el tiempo de cada fase del arranque hasta el primer mensaje")
     args = parser.parse_args()
     # Si no se pasa ningún argumento, usar --historial por defecto
     if len(sys.argv) == 1:
         args.historial = True
 
     setup_logging(debug=args.debug)
+    profiler.activo = args.profile_startup
 
     config = AppConfig()
     config.output_mode = args.output_mode
+    if args.backfill:
+        args.historial = True
+        config.backfill = True
+        config.backfill_hasta = args.hasta
+        config.backfill_max = args.max_mensajes
+    if args.export:
+        args.historial = True
+        config.export_path = args.export
+    if args.resumen:
+        args.historial = True
+        config.resumen = True
+        config.resumen_csv = args.csv
+    if args.pagina is not None:
+        config.historial_pagina = args.pagina
+    if args.workers is not None:
+        config.historial_workers = args.workers
+    if args.chunk is not None:
+        config.historial_chunk = args.chunk
+    if args.chats:
+        config.chat_names = args.chats
+    if args.lean:
+        config.lean_browser = True
 
     # Instanciar la estrategia personalizada para análisis de mensajes
     base_parser = MessageParser()
     estrategia = ObservacionTareaStrategy(base_parser)
 
+    def con_cache(parser):
+        "Envuelve el parser con la caché de resultados si está habilitada."
+        if config.parse_cache_size > 0:
+            return CachedParser(parser, max_entradas=config.parse_cache_size)
+        return parser
+
     def get_fecha():
         "Obtiene la fecha actual formateada"
         return datetime.now(config.tz_local).strftime("%Y-%m-%d")
 
+    meta_parser = MetaParser(cargar_author_roles(config.author_roles_path))
+    marcar("config")
+
     try:
         if args.historial:
-            # Cargar roles de autor desde archivo
-            import json
-            try:
-                with open(config.author_roles_path, encoding="utf-8") as f:
-                    author_roles = json.load(f)
-            except (OSError, json.JSONDecodeError):
-                author_roles = {}
-
-            meta_parser = MetaParser(author_roles)
-            presenter = HistorialPresenter(meta_parser)
-            ingest_service = IngestService(config.ingest_url)
-            wa_client = WhatsAppClient(
-                user_data_dir=config.user_data,
-                headless=config.headless,
-                chat_archived=getattr(config, 'chat_archived', False)
+            from src.uses_cases.parallel_parser import ParallelParser
+            from src.application.historial_service import HistorialService
+            from src.interface_adapters.presenters.historial_presenter import HistorialPresenter
+            from src.infrastructure.seen_index import FingerprintSeenIndex
+            if config.export_path:
+                from src.interface_adapters.gateways.export_chat_client import ExportChatClient
+                wa_client = ExportChatClient(config.export_path)
+            else:
+                from src.interface_adapters.gateways.whatsapp_client import WhatsAppClient
+                wa_client = WhatsAppClient(
+                    user_data_dir=config.user_data,
+                    headless=config.headless,
+                    chat_archived=getattr(config, 'chat_archived', False),
+                    lean=config.lean_browser
+                )
+            marcar("imports_modo")
+
+            presenter = HistorialPresenter(meta_parser, filas_por_pagina=config.historial_pagina)
+            # La ingesta (requests, outbox en disco e hilos de envío) solo existe en modo api
+            outbox_ctx = nullcontext()
+            if config.output_mode == "api" and not config.resumen:
+                from src.application.ingest_pipeline import IngestPipeline
+                from src.interface_adapters.gateways.ingest_service import IngestService
+                from src.infrastructure.outbox import Outbox, OutboxIngestService
+                ingest_service = IngestService(
+                    config.ingest_url,
+                    batch_endpoint=config.ingest_batch_url,
+                    batch_size=config.ingest_batch_size,
+                    compress=config.ingest_gzip
+                )
+                # Outbox en disco: lo no confirmado se reenvía tras una caída de la ingesta
+                if config.outbox_dir:
+                    ingest_service = outbox_ctx = OutboxIngestService(
+                        ingest_service,
+                        Outbox(config.outbox_dir),
+                        batch_size=config.outbox_batch_size
+                    )
+                # Envío en segundo plano: la ingesta no frena la lectura del chat
+                ingest_pipeline = IngestPipeline(
+                    ingest_service,
+                    workers=config.ingest_workers,
+                    maxsize=config.ingest_queue_size,
+                    batch_size=config.ingest_batch_size
+                )
+            else:
+                from src.interface_adapters.gateways.null_ingest_service import NullIngestService
+                ingest_pipeline = NullIngestService()
+            # Parseo en paralelo: deduplicación e ingesta quedan en este proceso
+            parallel_parser = ParallelParser(
+                estrategia,
+                workers=config.historial_workers,
+                chunk_size=config.historial_chunk
+            )
+            processor = MessageProcessor(
+                get_fecha,
+                parser_strategy=con_cache(parallel_parser),
+                seen_index=FingerprintSeenIndex() if config.seen_compact else None
             )
-            processor = MessageProcessor(get_fecha, parser_strategy=estrategia)
-            HistorialService(
-                config,
-                wa_client=wa_client,
-                ingest_service=ingest_service,
-                presenter=presenter,
-                meta_parser=meta_parser,
-                processor=processor
-            ).revisar()
+            with parallel_parser, outbox_ctx, ingest_pipeline:
+                HistorialService(
+                    config,
+                    wa_client=wa_client,
+                    ingest_service=ingest_pipeline,
+                    presenter=presenter,
+                    meta_parser=meta_parser,
+                    processor=processor
+                ).revisar()
+        elif args.async_mode:
+            import asyncio
+            from src.application.async_whatsapp_monitor import AsyncWhatsAppMonitor
+            from src.interface_adapters.gateways.async_whatsapp_client import AsyncWhatsAppClient
+            from src.interface_adapters.gateways.async_ingest_service import AsyncIngestService
+            marcar("imports_modo")
+
+            async def run_async():
+                "Monitor asíncrono: lectura, parseo y envío en un mismo event loop"
+                async with AsyncIngestService(
+                    config.ingest_url,
+                    batch_endpoint=config.ingest_batch_url,
+                    batch_size=config.ingest_batch_size,
+                    compress=config.ingest_gzip
+                ) as async_ingest:
+                    await AsyncWhatsAppMonitor(
+                        config,
+                        ingest_service=async_ingest,
+                        wa_client=AsyncWhatsAppClient(
+                            user_data_dir=config.user_data,
+                            headless=config.headless,
+                            chat_archived=config.chat_archived,
+                            lean=config.lean_browser
+                        ),
+                        processor=MessageProcessor(get_fecha,
+                                                   parser_strategy=con_cache(estrategia)),
+                        chats=config.chat_names or None
+                    ).run()
+            asyncio.run(run_async())
         else:
-            ingest_service = IngestService(config.ingest_url)
+            from src.application.whatsapp_monitor import WhatsAppMonitor
+            from src.application.ingest_pipeline import IngestPipeline
+            from src.interface_adapters.gateways.ingest_service import IngestService
+            from src.interface_adapters.gateways.whatsapp_client import WhatsAppClient
+            from src.infrastructure.seen_index import SqliteSeenIndex, FingerprintSeenIndex
+            from src.infrastructure.outbox import Outbox, OutboxIngestService
+            marcar("imports_modo")
+
+            ingest_service = IngestService(
+                config.ingest_url,
+                batch_endpoint=config.ingest_batch_url,
+                batch_size=config.ingest_batch_size,
+                compress=config.ingest_gzip
+            )
+            # Outbox en disco: lo no confirmado se reenvía tras una caída de la ingesta
+            outbox_ctx = nullcontext()
+            if config.outbox_dir:
+                ingest_service = outbox_ctx = OutboxIngestService(
+                    ingest_service,
+                    Outbox(config.outbox_dir),
+                    batch_size=config.outbox_batch_size
+                )
             wa_client = WhatsAppClient(
                 user_data_dir=config.user_data,
                 headless=config.headless,
-                chat_archived=getattr(config, 'chat_archived', False)
+                chat_archived=getattr(config, 'chat_archived', False),
+                lean=config.lean_browser
             )
-            # Cargar roles de autor desde archivo
-            import json
-            try:
-                with open(config.author_roles_path, encoding="utf-8") as f:
-                    author_roles = json.load(f)
-            except (OSError, json.JSONDecodeError):
-                author_roles = {}
-
-            meta_parser = MetaParser(author_roles)
-            monitor = WhatsAppMonitor(
-                config,
-                ingest_service=ingest_service,
-                wa_client=wa_client,
-                processor=MessageProcessor(get_fecha, parser_strategy=estrategia)
+            # Índice de vistos persistente: un reinicio no vuelve a ingerir lo ya enviado
+            seen_index = None
+            if config.seen_index_path:
+                seen_index = SqliteSeenIndex(
+                    config.seen_index_path,
+                    cache_size=config.seen_cache_size,
+                    max_age_days=config.seen_max_age_days
+                )
+            elif config.seen_compact:
+                seen_index = FingerprintSeenIndex()
+            # Envío en segundo plano; al salir (incluso por Ctrl+C) se vacía la cola
+            ingest_pipeline = IngestPipeline(
+                ingest_service,
+                workers=config.ingest_workers,
+                maxsize=config.ingest_queue_size,
+                batch_size=config.ingest_batch_size
             )
-            monitor.meta_parser = meta_parser  # <--- Asignar MetaParser aquí
-            monitor.run()
+            try:
+                monitor = WhatsAppMonitor(
+                    config,
+                    ingest_service=ingest_pipeline,
+                    wa_client=wa_client,
+                    processor=MessageProcessor(get_fecha, parser_strategy=con_cache(estrategia),
+                                               seen_index=seen_index)
+                )
+                monitor.meta_parser = meta_parser  # <--- Asignar MetaParser aquí
+                with outbox_ctx, ingest_pipeline:
+                    monitor.run()
+            finally:
+                if isinstance(seen_index, SqliteSeenIndex):
+                    seen_index.close()
     except KeyboardInterrupt:
         print("\nAplicación detenida por el usuario")
     except (ImportError, AttributeError, RuntimeError) as e:
         print(f"Error crítico: {str(e)}")
+    finally:
+        # Si el arranque no llegó al primer mensaje, informa hasta donde llegó
+        profiler.reportar()
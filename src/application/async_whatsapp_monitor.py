@@ -0,0 +1,126 @@
+"""
+Path: src/application/async_whatsapp_monitor.py
+"""
+import time
+import asyncio
+import logging
+from datetime import datetime
+
+from src.shared.app_config import AppConfig
+from src.shared.startup_profiler import marcar
+
+from src.entities.async_ingest_service_interface import IAsyncIngestService
+from src.entities.async_whatsapp_client_interface import IAsyncWhatsAppClient
+from src.uses_cases.cached_parser import CachedParser
+from src.uses_cases.message_processor import MessageProcessor
+from src.uses_cases.poll_scheduler import PollScheduler
+
+class AsyncWhatsAppMonitor:
+    """Monitor de WhatsApp asíncrono: una tarea de lectura por chat y varias de envío,
+    comunicadas por una cola acotada, de modo que lectura, parseo y envío se solapan."""
+    def __init__(self, config: AppConfig, ingest_service: IAsyncIngestService,
+                 wa_client: IAsyncWhatsAppClient, processor: MessageProcessor,
+                 chats: list[str] | None = None):
+        self.config = config
+        self.ingest_service = ingest_service
+        self.wa_client = wa_client
+        self.processor = processor
+        self.chats = chats or [config.chat_name]
+        self.logger = logging.getLogger("wa_reader.async_monitor")
+        # Un intervalo adaptativo por chat
+        self.poll_schedulers = {
+            chat: PollScheduler(
+                min_sec=config.poll_min_sec,
+                max_sec=config.poll_max_sec,
+                factor=config.poll_backoff,
+                turnos=config.poll_turnos,
+                margen_turno_min=config.poll_margen_turno_min,
+                techo_turno_sec=config.poll_sec
+            )
+            for chat in self.chats
+        }
+        self._proximo_reporte = time.monotonic() + config.metricas_sec
+
+    def metricas(self) -> dict:
+        "Métricas del polling por chat: intervalo actual y lecturas."
+        return {chat: scheduler.metricas() for chat, scheduler in self.poll_schedulers.items()}
+
+    def _reportar_metricas(self):
+        "Registra periódicamente las métricas del polling y de la caché del parser."
+        if time.monotonic() < self._proximo_reporte:
+            return
+        self._proximo_reporte = time.monotonic() + self.config.metricas_sec
+        self.logger.info("Polling: %s", self.metricas())
+        if isinstance(self.processor.parser, CachedParser):
+            self.processor.parser.reportar()
+
+    async def run(self):
+        "Ejecuta el monitor hasta que se cancele; al salir envía lo que quedó en la cola."
+        self.logger.info("Iniciando monitor asíncrono de WhatsApp (%d chats)...", len(self.chats))
+        async with self.wa_client as wa_client:
+            marcar("lanzamiento")
+            await wa_client.initialize()
+            marcar("login")
+            for chat in self.chats:
+                self.logger.info("Abriendo chat: %s", chat)
+                await wa_client.open_chat(chat)
+            marcar("open_chat")
+            cola = asyncio.Queue(maxsize=self.config.ingest_queue_size)
+            envios = [asyncio.create_task(self._enviar(cola))
+                      for _ in range(self.config.ingest_workers)]
+            lecturas = [asyncio.create_task(self._vigilar(wa_client, chat, cola))
+                        for chat in self.chats]
+            try:
+                await asyncio.gather(*lecturas)
+            finally:
+                for tarea in lecturas:
+                    tarea.cancel()
+                self.logger.info("Enviando %d payloads pendientes antes de salir...", cola.qsize())
+                try:
+                    await asyncio.wait_for(cola.join(), timeout=60)
+                except asyncio.TimeoutError:
+                    self.logger.error("Timeout vaciando la cola: %d payloads sin enviar.",
+                                      cola.qsize())
+                for tarea in envios:
+                    tarea.cancel()
+
+    async def _vigilar(self, wa_client: IAsyncWhatsAppClient, chat: str, cola: asyncio.Queue):
+        "Lee el chat periódicamente y encola los payloads nuevos (bloquea si la cola está llena)."
+        while True:
+            try:
+                messages = await wa_client.get_new_messages(chat)
+            except RuntimeError as e:
+                self.logger.error("Error leyendo el chat %s: %s", chat, e)
+                messages = []
+            marcar("primer_mensaje")
+            self._reportar_metricas()
+            self.logger.debug("[%s] Total mensajes obtenidos: %d", chat, len(messages))
+            try:
+                # Con varios chats la deduplicación es por chat y el payload indica el origen
+                payloads = self.processor.process_batch(messages, chat if len(self.chats) > 1 else "")
+            except (ValueError, TypeError, KeyError) as e:
+                self.logger.error("Error procesando lote de %s: %s", chat, e)
+                payloads = []
+            for payload in payloads:
+                if payload:
+                    await cola.put(payload)
+            intervalo = self.poll_schedulers[chat].registrar(
+                len(messages), datetime.now(self.config.tz_local))
+            self.logger.debug("[%s] Próxima lectura en %.1f s", chat, intervalo)
+            await asyncio.sleep(intervalo)
+
+    async def _enviar(self, cola: asyncio.Queue):
+        "Toma lotes de la cola y los envía al servicio de ingesta."
+        while True:
+            lote = [await cola.get()]
+            while len(lote) < self.config.ingest_batch_size and not cola.empty():
+                lote.append(cola.get_nowait())
+            try:
+                estados = await self.ingest_service.send_many(lote)
+            except Exception as e:  # pylint: disable=broad-except
+                estados = [f"Error: {e}"] * len(lote)
+            for payload, estado in zip(lote, estados):
+                if estado is None or str(estado).startswith("Error"):
+                    self.logger.warning("Error de ingesta [%s] para: %s", estado, payload)
+            for _ in lote:
+                cola.task_done()
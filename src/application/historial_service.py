@@ -3,18 +3,24 @@ Path: src/application/historial_service.py
 """
 
 import logging
+from datetime import datetime
 
 from src.shared.app_config import AppConfig
 
+from src.shared.startup_profiler import marcar
+from src.application.ingest_pipeline import ENCOLADO
+
 from src.entities.meta_parser import MetaParser
+from src.entities.ingest_service_interface import IIngestService
+from src.entities.whatsapp_client_interface import IWhatsAppClient
+from src.uses_cases.cached_parser import CachedParser
 from src.uses_cases.message_processor import MessageProcessor
-from src.interface_adapters.gateways.whatsapp_client import WhatsAppClient
-from src.interface_adapters.gateways.ingest_service import IngestService
+from src.uses_cases.resumen_produccion import ResumenProduccion
 from src.interface_adapters.presenters.historial_presenter import HistorialPresenter
 
 class HistorialService:
     "Servicio para gestionar el historial de mensajes de WhatsApp"
-    def __init__(self, config: AppConfig, wa_client: WhatsAppClient, ingest_service: IngestService,
+    def __init__(self, config: AppConfig, wa_client: IWhatsAppClient, ingest_service: IIngestService,
                  presenter: HistorialPresenter, meta_parser: MetaParser, processor: MessageProcessor):
         self.config = config
         self.logger = logging.getLogger("wa_reader.historial")
@@ -23,63 +29,41 @@ class HistorialService:
         self.presenter = presenter
         self.meta_parser = meta_parser
         self.processor = processor
+        # Modo resumen: payloads por columnas en lugar de filas; no se envían ni se listan
+        self.resumen = ResumenProduccion() if config.resumen else None
 
     def revisar(self):
         "Revisa el historial de mensajes de WhatsApp y muestra por CLI o envía por API"
+        try:
+            self._revisar()
+        finally:
+            if isinstance(self.processor.parser, CachedParser):
+                self.processor.parser.reportar()
+
+    def _revisar(self):
+        "Abre el chat y procesa el historial completo o por lotes (backfill)."
         self.logger.debug("Inicializando cliente de WhatsApp...")
         with self.wa_client as wa_client:
+            marcar("lanzamiento")
             wa_client.initialize()
+            marcar("login")
             self.logger.debug("Abriendo chat: %s", self.config.chat_name)
             wa_client.open_chat(self.config.chat_name)
+            marcar("open_chat")
+            # Las exportaciones se leen por lotes desde el final, sin cargar el archivo entero
+            if self.config.backfill or self.config.export_path:
+                self._revisar_backfill(wa_client)
+                return
             self.logger.debug("Extrayendo historial de mensajes...")
             messages = wa_client.get_messages()
+            marcar("primer_mensaje")
             self.logger.debug("Total mensajes obtenidos: %d", len(messages))
-            procesados = 0
             tabla = []
             tabla_prev = []
-            for msg in reversed(messages):
-                meta = msg.get("meta", "")
-                body = msg.get("body", "")
-                meta_info = self.meta_parser.parse(meta)
-                fecha = meta_info["fecha"]
-                autor = meta_info["autor"]
-                tabla_prev.append([fecha, autor, body])
-                self.logger.debug("Procesando mensaje: %s %s", meta, body[:50])
-                try:
-                    payload = self.processor.process(msg)
-                except (ValueError, KeyError, TypeError) as e:
-                    self.logger.error("Error procesando mensaje: %s", e)
-                    continue
-                if payload:
-                    if self.config.output_mode == "cli":
-                        self.logger.debug("Mostrando resultados en CLI...")
-                        tabla.append([
-                            payload.get("fecha") or "s/d",
-                            payload.get("maquina") or "s/d",
-                            payload.get("formato") or "s/d",
-                            (
-                                payload.get("cantidad")
-                                if payload.get("cantidad") not in (None, "", 0)
-                                else "s/d"
-                            ),
-                            payload.get("turno") or "s/d",
-                            payload.get("personas") or "s/d",
-                            payload.get("obs") if payload.get("obs") else "sin clasificar",
-                            "TodoPlastic"  # Columna cliente
-                        ])
-                    else:
-                        try:
-                            status = self.ingest_service.send(payload)
-                            estado = status if status is not None else "ERROR_RED"
-                            if status == 200:
-                                self.logger.info("Enviado correctamente: %s", payload)
-                            else:
-                                self.logger.warning("Respuesta inesperada [%s] para: %s",
-                                                   estado, payload)
-                        except (ConnectionError, TimeoutError, ValueError) as e:
-                            self.logger.error("Error enviando payload: %s", e)
-                    procesados += 1
-            if self.config.output_mode == "cli":
+            procesados = self._procesar_lote(list(reversed(messages)), tabla, tabla_prev)
+            if self.resumen is not None:
+                self._mostrar_resumen()
+            elif self.config.output_mode == "cli":
                 self.logger.info("Mostrando resultados en CLI...")
                 self.presenter.mostrar_tabla_autor_cargo(tabla_prev, self.config.chat_name)
             self.logger.info(
@@ -87,3 +71,119 @@ class HistorialService:
                 procesados,
                 len(messages)
             )
+
+    def _revisar_backfill(self, wa_client):
+        "Recorre el historial hacia atrás por lotes, procesando y descartando cada uno."
+        hasta = None
+        if self.config.backfill_hasta:
+            hasta = datetime.strptime(self.config.backfill_hasta, "%Y-%m-%d").date()
+        self.logger.info("Backfill de historial (hasta=%s, max=%s)...",
+                         hasta, self.config.backfill_max)
+        listar = self.resumen is None and self.config.output_mode == "cli"
+        if listar:
+            self.presenter.mostrar_encabezado_autor_cargo(self.config.chat_name)
+        procesados = 0
+        revisados = 0
+        for lote in wa_client.iter_history(hasta=hasta, max_mensajes=self.config.backfill_max):
+            marcar("primer_mensaje")
+            tabla = []
+            tabla_prev = []
+            procesados += self._procesar_lote(list(reversed(lote)), tabla, tabla_prev)
+            revisados += len(lote)
+            if listar:
+                self.presenter.mostrar_filas_autor_cargo(tabla_prev)
+        if self.resumen is not None:
+            self._mostrar_resumen()
+        self.logger.info(
+            "Historial procesado: %d de %d mensajes revisados.",
+            procesados,
+            revisados
+        )
+
+    def _procesar_lote(self, messages: list, tabla: list, tabla_prev: list) -> int:
+        "Procesa un lote de mensajes en orden. Retorna la cantidad de mensajes procesados."
+        try:
+            payloads = self.processor.process_batch(messages)
+        except (ValueError, KeyError, TypeError) as e:
+            self.logger.error("Error procesando lote, se procesa mensaje a mensaje: %s", e)
+            payloads = [self._procesar_uno(msg) for msg in messages]
+        procesados = 0
+        envios = []
+        for msg, payload in zip(messages, payloads):
+            if self._procesar_mensaje(msg, payload, tabla, tabla_prev, envios):
+                procesados += 1
+        self._enviar(envios)
+        return procesados
+
+    def _procesar_uno(self, msg: dict) -> dict | None:
+        "Procesa un único mensaje, registrando el error si falla."
+        try:
+            return self.processor.process(msg)
+        except (ValueError, KeyError, TypeError) as e:
+            self.logger.error("Error procesando mensaje: %s", e)
+            return None
+
+    def _procesar_mensaje(self, msg: dict, payload: dict | None, tabla: list,
+                          tabla_prev: list, envios: list) -> bool:
+        "Agrega el mensaje a las tablas en CLI o encola su payload para enviar por API."
+        meta = msg.get("meta", "")
+        body = msg.get("body", "")
+        meta_info = self.meta_parser.parse(meta)
+        fecha = meta_info["fecha"]
+        autor = meta_info["autor"]
+        if self.resumen is not None:
+            if not payload:
+                return False
+            self.resumen.agregar(payload, fecha)
+            return True
+        tabla_prev.append((fecha, autor, body))
+        self.logger.debug("Procesando mensaje: %s %s", meta, body[:50])
+        if not payload:
+            return False
+        if self.config.output_mode == "cli":
+            self.logger.debug("Mostrando resultados en CLI...")
+            tabla.append([
+                payload.get("fecha") or "s/d",
+                payload.get("maquina") or "s/d",
+                payload.get("formato") or "s/d",
+                (
+                    payload.get("cantidad")
+                    if payload.get("cantidad") not in (None, "", 0)
+                    else "s/d"
+                ),
+                payload.get("turno") or "s/d",
+                payload.get("personas") or "s/d",
+                payload.get("obs") if payload.get("obs") else "sin clasificar",
+                "TodoPlastic"  # Columna cliente
+            ])
+        else:
+            envios.append(payload)
+        return True
+
+    def _mostrar_resumen(self):
+        "Agrupa por día, máquina y turno y muestra la tabla o escribe el CSV."
+        filas = self.resumen.agrupar()
+        self.logger.info("Resumen: %d mensajes con datos en %d grupos.", len(self.resumen), len(filas))
+        if self.config.resumen_csv:
+            self.presenter.escribir_resumen_csv(filas, self.config.resumen_csv)
+        else:
+            self.presenter.mostrar_resumen(filas, self.config.chat_name)
+
+    def _enviar(self, payloads: list):
+        "Envía los payloads del lote en bloque y registra el estado de cada uno."
+        if not payloads:
+            return
+        try:
+            estados = self.ingest_service.send_many(payloads)
+        except (ConnectionError, TimeoutError, ValueError) as e:
+            self.logger.error("Error enviando payloads: %s", e)
+            return
+        for payload, status in zip(payloads, estados):
+            estado = status if status is not None else "ERROR_RED"
+            if status == ENCOLADO:
+                # El pipeline informa enviados y errores al cerrarse
+                self.logger.debug("Encolado para envío: %s", payload)
+            elif status is not None and not str(status).startswith("Error"):
+                self.logger.info("Enviado correctamente: %s", payload)
+            else:
+                self.logger.warning("Respuesta inesperada [%s] para: %s", estado, payload)
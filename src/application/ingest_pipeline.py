@@ -0,0 +1,109 @@
+"""
+Path: src/application/ingest_pipeline.py
+"""
+
+import queue
+import logging
+import threading
+
+from src.entities.ingest_service_interface import IIngestService
+
+# Marca de fin para los workers
+_FIN = object()
+# Estado de send/send_many: el resultado real se conoce después, en los workers
+ENCOLADO = "Encolado"
+
+class IngestPipeline(IIngestService):
+    """Etapa de ingesta en segundo plano. send/send_many solo encolan en una cola acotada
+    (si está llena bloquean: contrapresión) y los workers envían en lotes con el servicio real,
+    de modo que la latencia HTTP no frena el scraping. close() vacía la cola antes de terminar."""
+    def __init__(self, ingest_service: IIngestService, workers: int = 2, maxsize: int = 1000,
+                 batch_size: int = 100, flush_timeout: float = 60):
+        self.ingest_service = ingest_service
+        self.workers = workers
+        self.batch_size = batch_size
+        self.flush_timeout = flush_timeout
+        self.logger = logging.getLogger("wa_reader.ingest_pipeline")
+        self._queue = queue.Queue(maxsize=maxsize)
+        self._threads = []
+        self._lock = threading.Lock()
+        self.enviados = 0
+        self.fallidos = 0
+
+    def start(self):
+        "Inicia los workers."
+        for i in range(self.workers):
+            hilo = threading.Thread(target=self._worker, name=f"ingest-{i}", daemon=True)
+            hilo.start()
+            self._threads.append(hilo)
+        self.logger.debug("Pipeline de ingesta iniciado con %d workers.", self.workers)
+
+    def send(self, payload: dict) -> str:
+        "Encola el payload; bloquea si la cola está llena."
+        if self._queue.full():
+            self.logger.debug("Cola de ingesta llena; esperando a los workers...")
+        self._queue.put(payload)
+        return ENCOLADO
+
+    def send_many(self, payloads) -> list[str]:
+        "Encola varios payloads; bloquea mientras la cola esté llena."
+        return [self.send(payload) for payload in payloads]
+
+    def close(self):
+        "Espera a que se envíe todo lo encolado y detiene los workers."
+        pendientes = self._queue.qsize()
+        if pendientes:
+            self.logger.info("Enviando %d payloads pendientes antes de salir...", pendientes)
+        for _ in self._threads:
+            self._queue.put(_FIN)
+        for hilo in self._threads:
+            hilo.join(timeout=self.flush_timeout)
+        if any(hilo.is_alive() for hilo in self._threads):
+            self.logger.error("Timeout vaciando la cola de ingesta: quedan %d payloads sin enviar.",
+                              self._queue.qsize())
+        self._threads = []
+        self.logger.log(logging.WARNING if self.fallidos else logging.INFO,
+                        "Pipeline de ingesta detenido (%d enviados, %d con error).",
+                        self.enviados, self.fallidos)
+
+    def _worker(self):
+        "Toma lotes de la cola y los envía con el servicio de ingesta."
+        fin = False
+        while not fin:
+            item = self._queue.get()
+            if item is _FIN:
+                self._queue.task_done()
+                return
+            lote = [item]
+            while len(lote) < self.batch_size:
+                try:
+                    item = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+                if item is _FIN:
+                    fin = True
+                    break
+                lote.append(item)
+            try:
+                estados = self.ingest_service.send_many(lote)
+            except Exception as e:  # pylint: disable=broad-except
+                estados = [f"Error: {e}"] * len(lote)
+            self._registrar(lote, estados)
+            for _ in range(len(lote) + (1 if fin else 0)):
+                self._queue.task_done()
+
+    def _registrar(self, lote: list, estados: list):
+        "Contabiliza y registra el resultado de un lote."
+        errores = [(p, e) for p, e in zip(lote, estados) if e is None or str(e).startswith("Error")]
+        with self._lock:
+            self.enviados += len(lote) - len(errores)
+            self.fallidos += len(errores)
+        for payload, estado in errores:
+            self.logger.warning("Error de ingesta [%s] para: %s", estado, payload)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -6,10 +6,14 @@ import logging
 from datetime import datetime
 
 from src.shared.app_config import AppConfig
+from src.shared.startup_profiler import marcar
 
 from src.entities.ingest_service_interface import IIngestService
 from src.entities.whatsapp_client_interface import IWhatsAppClient
+from src.uses_cases.cached_parser import CachedParser
 from src.uses_cases.message_processor import MessageProcessor
+from src.uses_cases.chat_scheduler import ChatScheduler
+from src.uses_cases.poll_scheduler import PollScheduler
 
 class WhatsAppMonitor:
     "Monitor de WhatsApp"
@@ -24,6 +28,15 @@ class WhatsAppMonitor:
         else:
             self.processor = processor
         self.logger = logging.getLogger("wa_reader.monitor")
+        self.poll_scheduler = PollScheduler(
+            min_sec=config.poll_min_sec,
+            max_sec=config.poll_max_sec,
+            factor=config.poll_backoff,
+            turnos=config.poll_turnos,
+            margen_turno_min=config.poll_margen_turno_min,
+            techo_turno_sec=config.poll_sec
+        )
+        self._proximo_reporte = time.monotonic() + config.metricas_sec
         # MetaParser debe ser inyectado o configurado externamente
         self.meta_parser = None  # Se recomienda inyectar desde la capa de configuración
 
@@ -35,34 +48,124 @@ class WhatsAppMonitor:
             return
         try:
             with self.wa_client as wa_client:
+                marcar("lanzamiento")
                 self.logger.info("Inicializando cliente de WhatsApp...")
                 wa_client.initialize()
+                marcar("login")
+                chats = self.config.chat_names or [self.config.chat_name]
+                if len(chats) > 1:
+                    self.logger.info("Modo multichat: %d chats en una sola página.", len(chats))
+                    self._run_multichat(wa_client, chats)
+                    return
                 self.logger.info("Abriendo chat: %s", self.config.chat_name)
                 wa_client.open_chat(self.config.chat_name)
+                marcar("open_chat")
 
-                while True:
-                    self.logger.debug("Obteniendo mensajes...")
-                    messages = wa_client.get_messages()
-                    self.logger.debug("Total mensajes obtenidos: %d", len(messages))
-                    for msg in messages:
-                        meta = msg.get("meta", "")
-                        _body = msg.get("body", "")
-                        meta_info = self.meta_parser.parse(meta)
-                        _fecha = meta_info["fecha"]
-                        _autor = meta_info["autor"]
-                        try:
-                            payload = self.processor.process(msg)
-                        except (ValueError, TypeError) as e:
-                            self.logger.error("Error procesando mensaje: %s", e)
-                            continue
-                        if payload:
-                            # Delegar envío a IngestService (gateway)
-                            status = self.ingest_service.send(payload)
-                            estado = status if status is not None else "ERROR_RED"
-                            # Delegar presentación/logging a Presenter externo
-                            # Ejemplo: presenter.mostrar_envio(payload, estado)
-                    time.sleep(self.config.poll_sec)
+                if self.config.push_mode and wa_client.start_push():
+                    self.logger.info("Modo push activo (barrido cada %s s).", self.config.sweep_sec)
+                    self._run_push(wa_client)
+                else:
+                    self.logger.info("Modo polling adaptativo (%s-%s s).",
+                                     self.config.poll_min_sec, self.config.poll_max_sec)
+                    self._run_poll(wa_client)
         except KeyboardInterrupt:
             self.logger.info("Monitor detenido por el usuario.")
         except (RuntimeError, ConnectionError) as e:
             self.logger.error("Error crítico en monitor: %s", e)
+
+    def metricas(self) -> dict:
+        "Métricas del polling: intervalo actual y lecturas (vacías o no)."
+        return self.poll_scheduler.metricas()
+
+    def _run_poll(self, wa_client: IWhatsAppClient):
+        "Lee el chat con un intervalo que se acorta con actividad y crece en silencio."
+        while True:
+            self.logger.debug("Obteniendo mensajes...")
+            messages = wa_client.get_new_messages()
+            self._procesar(messages)
+            intervalo = self.poll_scheduler.registrar(len(messages), datetime.now(self.config.tz_local))
+            self.logger.debug("Próxima lectura en %.1f s", intervalo)
+            time.sleep(intervalo)
+
+    def _run_multichat(self, wa_client: IWhatsAppClient, chats: list[str]):
+        """Lee varios chats alternando en la misma página, según su actividad.
+        WhatsApp Web mantiene una sola pestaña activa por sesión: cambiar de chat es más
+        barato que abrir un contexto por chat y la memoria no crece con la cantidad de chats."""
+        scheduler = ChatScheduler(
+            chats,
+            min_sec=self.config.multichat_min_sec,
+            max_sec=self.config.multichat_max_sec
+        )
+        while True:
+            chat, espera = scheduler.siguiente()
+            if espera:
+                time.sleep(espera)
+            if getattr(wa_client, "chat_actual", None) != chat:
+                self.logger.debug("Cambiando al chat: %s", chat)
+                wa_client.open_chat(chat)
+            messages = wa_client.get_new_messages()
+            self._procesar(messages, chat)
+            scheduler.registrar(chat, len(messages))
+            self.logger.debug("Chat %s: %d nuevos, próxima lectura en %.1f s",
+                              chat, len(messages), scheduler.intervalo(chat))
+
+    def _run_push(self, wa_client: IWhatsAppClient):
+        "Espera burbujas del MutationObserver y hace un barrido periódico de consistencia."
+        self._procesar(wa_client.get_new_messages())
+        proximo_barrido = time.monotonic() + self.config.sweep_sec
+        while True:
+            espera = max(0.0, proximo_barrido - time.monotonic())
+            messages = wa_client.wait_for_messages(espera)
+            if messages:
+                self._procesar(messages)
+            if time.monotonic() >= proximo_barrido:
+                self.logger.debug("Barrido periódico de consistencia...")
+                self._procesar(wa_client.get_new_messages())
+                # Reinyecta el observer por si WhatsApp re-renderizó el panel del chat
+                if not wa_client.start_push():
+                    self.logger.warning("Observer no disponible; continuando en modo polling.")
+                    self._run_poll(wa_client)
+                proximo_barrido = time.monotonic() + self.config.sweep_sec
+
+    def _reportar_metricas(self):
+        "Registra periódicamente las métricas del polling y de la caché del parser."
+        if time.monotonic() < self._proximo_reporte:
+            return
+        self._proximo_reporte = time.monotonic() + self.config.metricas_sec
+        self.logger.info("Polling: %s", self.metricas())
+        if isinstance(self.processor.parser, CachedParser):
+            self.processor.parser.reportar()
+
+    def _procesar(self, messages: list, chat: str = ""):
+        "Procesa y envía los mensajes obtenidos (chat: origen, solo en modo multichat)."
+        marcar("primer_mensaje")
+        self._reportar_metricas()
+        self.logger.debug("Total mensajes obtenidos: %d", len(messages))
+        try:
+            payloads = self.processor.process_batch(messages, chat)
+        except (ValueError, TypeError, KeyError) as e:
+            self.logger.error("Error procesando lote, se procesa mensaje a mensaje: %s", e)
+            payloads = [self._procesar_uno(msg, chat) for msg in messages]
+        envios = []
+        for msg, payload in zip(messages, payloads):
+            meta = msg.get("meta", "")
+            _body = msg.get("body", "")
+            meta_info = self.meta_parser.parse(meta)
+            _fecha = meta_info["fecha"]
+            _autor = meta_info["autor"]
+            if payload:
+                envios.append(payload)
+        if envios:
+            # Delegar envío a IngestService (gateway), en bloque
+            for payload, status in zip(envios, self.ingest_service.send_many(envios)):
+                estado = status if status is not None else "ERROR_RED"
+                # Delegar presentación/logging a Presenter externo
+                # Ejemplo: presenter.mostrar_envio(payload, estado)
+
+    def _procesar_uno(self, msg: dict, chat: str = "") -> dict | None:
+        "Procesa un único mensaje, registrando el error si falla."
+        try:
+            return self.processor.process(msg, chat)
+        except (ValueError, TypeError, KeyError) as e:
+            self.logger.error("Error procesando mensaje: %s", e)
+            return None
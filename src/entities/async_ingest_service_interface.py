@@ -0,0 +1,17 @@
+"""
+Path: src/entities/async_ingest_service_interface.py
+"""
+# pylint: disable=unnecessary-pass
+
+from abc import ABC, abstractmethod
+
+class IAsyncIngestService(ABC):
+    "Interfaz asíncrona para el servicio de ingestión de datos"
+    @abstractmethod
+    async def send(self, payload: dict) -> str:
+        "Envía un payload al servicio de ingestión."
+        pass
+
+    async def send_many(self, payloads) -> list[str]:
+        "Envía varios payloads y retorna el estado de cada uno, en orden."
+        return [await self.send(payload) for payload in payloads]
@@ -0,0 +1,36 @@
+"""
+Path: src/entities/async_whatsapp_client_interface.py
+"""
+# pylint: disable=unnecessary-pass
+
+from abc import ABC, abstractmethod
+
+class IAsyncWhatsAppClient(ABC):
+    "Interfaz asíncrona para el cliente de WhatsApp (varios chats en una misma sesión)"
+    @abstractmethod
+    async def initialize(self):
+        "Inicializa el cliente de WhatsApp."
+        pass
+
+    @abstractmethod
+    async def open_chat(self, chat_name: str):
+        "Abre un chat en WhatsApp."
+        pass
+
+    @abstractmethod
+    async def get_messages(self, chat_name: str) -> list:
+        "Obtiene los mensajes renderizados del chat."
+        pass
+
+    @abstractmethod
+    async def get_new_messages(self, chat_name: str) -> list:
+        "Obtiene los mensajes del chat posteriores a la última lectura."
+        pass
+
+    @abstractmethod
+    async def __aenter__(self):
+        pass
+
+    @abstractmethod
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
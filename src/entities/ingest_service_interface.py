@@ -11,3 +11,7 @@ class IIngestService(ABC):
     def send(self, payload: dict) -> str:
         "Envía un payload al servicio de ingestión."
         pass
+
+    def send_many(self, payloads) -> list[str]:
+        "Envía varios payloads y retorna el estado de cada uno, en orden."
+        return [self.send(payload) for payload in payloads]
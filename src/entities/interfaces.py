@@ -11,9 +11,17 @@ class IMessageParser(ABC):
         """Parsea un mensaje y retorna un diccionario con los datos extraídos."""
         pass  # pylint: disable=unnecessary-pass
 
+    def parse_many(self, texts) -> list[dict]:
+        """Parsea un lote (lista o iterador) de mensajes y retorna los resultados en orden."""
+        return [self.parse(text) for text in texts]
+
 class IMessageProcessor(ABC):
     "Interfaz para el procesamiento de mensajes"
     @abstractmethod
-    def process(self, message: dict) -> dict:
-        """Procesa un mensaje y retorna un diccionario con los datos procesados."""
+    def process(self, message: dict, chat: str = "") -> dict:
+        """Procesa un mensaje del chat indicado y retorna un diccionario con los datos procesados."""
         pass  # pylint: disable=unnecessary-pass
+
+    def process_batch(self, messages, chat: str = "") -> list:
+        """Procesa un lote de mensajes y retorna los resultados en orden (None si se descarta)."""
+        return [self.process(message, chat) for message in messages]
@@ -41,11 +41,26 @@ class MessageParser(IMessageParser):
         )
         # Turno: turno tarde, turno mañana, etc.
         self.p_turno = re.compile(r"turno\s+(mañana|tarde|noche)", re.I)
-        # Almacena el texto original del mensaje para observaciones
-        self._texto_original = ""
         # Patrones para tareas pendientes y finalizadas
         self.p_tarea_pendiente = re.compile(r"\b(hay que|pendiente|falta|para mañana|por hacer|debe|debería|recordar|no olvidar)\b", re.I)
         self.p_tarea_finalizada = re.compile(r"\b(terminado|finalizado|listo|completado|hecho|resuelto|cerrado|solucionado|ok|realizado)\b", re.I)
+        # Escáner fusionado: máquina, formato, turno, personas y tareas en una sola pasada.
+        # Replica los patrones anteriores con grupos con nombre; sus coincidencias no se solapan
+        # entre sí, por lo que la primera de cada grupo es la misma que daría su search().
+        self.p_fusionado = re.compile(
+            r"(?:maquina|máquina|producción de maquina|producción de máquina)\s+"
+            r"(?:de\s+)?(?P<maquina>bolsas|manijas)"
+            r"|\b(?P<formato>\d{2}x\d{2}x\d{2})\b"
+            r"|turno\s+(?P<turno>mañana|tarde|noche)"
+            r"|(?:con\s+|\btrabajamos\s+con\s+)"
+            r"(?P<personas>\d+|uno|dos|tres|cuatro|cinco|seis|siete|ocho|nueve|diez)\s+personas\b"
+            r"|\b(?P<finalizada>terminado|finalizado|listo|completado|hecho|resuelto|cerrado|"
+            r"solucionado|ok|realizado)\b"
+            r"|\b(?P<pendiente>hay que|pendiente|falta|para mañana|por hacer|debe|debería|"
+            r"recordar|no olvidar)\b",
+            re.I
+        )
+        self._grupos_fusionados = len(self.p_fusionado.groupindex)
 
     @staticmethod
     def norm_int(num_str: str) -> int:
@@ -60,43 +75,48 @@ class MessageParser(IMessageParser):
     def parse(self, text: str) -> dict:
         "Parses a WhatsApp message and extracts relevant information."
         t = " ".join(text.split())
-        self._texto_original = text  # Guarda el texto original para observaciones
+        campos = {}
+        for m in self.p_fusionado.finditer(t):
+            nombre = m.lastgroup
+            if nombre not in campos:
+                campos[nombre] = m.group(nombre)
+                if len(campos) == self._grupos_fusionados:
+                    break
+        # La cantidad se escanea aparte: sus números se solapan con el formato (22x10x30)
+        cantidades = [self.norm_int(x) for x in self.p_cant_ctx.findall(t)]
+
         out = {}
-        if m := self.p_maq.search(t):
-            out["maquina"] = m.group(1).lower()
-        if m := self.p_formato.search(t):
-            out["formato"] = m.group(1)
-        if m := self.p_turno.search(t):
-            out["turno"] = m.group(1).lower()
-        if m := self.p_personas.search(t):
-            val = m.group(1)
-            out["personas"] = self.norm_int(val)
+        if "maquina" in campos:
+            out["maquina"] = campos["maquina"].lower()
+        if "formato" in campos:
+            out["formato"] = campos["formato"]
+        if "turno" in campos:
+            out["turno"] = campos["turno"].lower()
+        if "personas" in campos:
+            out["personas"] = self.norm_int(campos["personas"])
 
-        obs = self._detectar_observaciones()
+        obs = self._detectar_observaciones(campos, bool(cantidades))
         if obs:
             out["obs"] = "; ".join(obs)
 
-        cantidades = [self.norm_int(x) for x in self.p_cant_ctx.findall(t)]
         if cantidades:
             out["cantidad"] = max(cantidades)
 
         return out if any(out) else {}
 
-    def _detectar_observaciones(self) -> list:
-        "Detecta observaciones usando el texto original del mensaje."
-        texto = getattr(self, "_texto_original", "")
-        t = " ".join(texto.split())
+    @staticmethod
+    def _detectar_observaciones(campos: dict, tiene_cantidad: bool) -> list:
+        "Detecta observaciones a partir de los campos ya escaneados del mensaje."
         observaciones = []
         # Detectar tarea finalizada
-        if self.p_tarea_finalizada.search(t):
+        if "finalizada" in campos:
             observaciones.append("Tarea Finalizada")
         # Detectar tarea pendiente (permite ambas en el mismo mensaje)
-        if self.p_tarea_pendiente.search(t):
+        if "pendiente" in campos:
             observaciones.append("Tarea Pendiente")
         # Si no se detecta ninguna categoría relevante, asigna 'Sin clasificar'
-        tiene_maquina = bool(self.p_maq.search(t))
-        tiene_formato = bool(self.p_formato.search(t))
-        tiene_cantidad = bool(self.p_cant_ctx.search(t))
+        tiene_maquina = "maquina" in campos
+        tiene_formato = "formato" in campos
         if not (tiene_maquina or tiene_formato or tiene_cantidad) and not observaciones:
             observaciones.append("Sin clasificar")
         return observaciones
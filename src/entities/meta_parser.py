@@ -3,6 +3,11 @@ Path: src_old/domain/meta_parser.py
 """
 import re
 
+from src.entities.records import MetaInfo
+
+# Resultado para metas sin formato reconocible (inmutable: se comparte)
+META_VACIA = MetaInfo("", "")
+
 class MetaParser:
     "Parser para extraer información del campo meta de mensajes de WhatsApp"
     META_REGEX = re.compile(r"\[(.+?),\s*(.+?)\]\s*(.+?):")
@@ -14,15 +19,9 @@ class MetaParser:
         "Devuelve el cargo del autor, o 'Sin definir' si no está en el diccionario."
         return self._author_roles.get(autor, "Sin definir")
 
-    def parse(self, meta: str) -> dict:
-        """Extrae fecha y autor del campo meta. Retorna dict con 'fecha' y 'autor'."""
+    def parse(self, meta: str) -> MetaInfo:
+        """Extrae fecha y autor del campo meta. Retorna MetaInfo (accesible como meta['fecha'])."""
         m = self.META_REGEX.match(meta)
         if m:
-            return {
-                "fecha": m.group(2),
-                "autor": m.group(3)
-            }
-        return {
-            "fecha": "",
-            "autor": ""
-        }
+            return MetaInfo(m.group(2), m.group(3))
+        return META_VACIA
@@ -0,0 +1,102 @@
+"""
+Path: src/entities/records.py
+"""
+
+class _Registro:
+    """Base de los registros inmutables con __slots__ (sin __dict__ por instancia).
+    Se leen por atributo y también por clave (registro["body"], registro.get("obs")) para
+    que el código escrito contra dicts siga funcionando; to_dict() serializa en la ingesta."""
+    __slots__ = ()
+    CAMPOS = ()
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"{type(self).__name__} es inmutable")
+
+    def __delattr__(self, name):
+        raise AttributeError(f"{type(self).__name__} es inmutable")
+
+    def __getitem__(self, campo: str):
+        if campo not in self.CAMPOS:
+            raise KeyError(campo)
+        return getattr(self, campo)
+
+    def get(self, campo: str, default=None):
+        "Valor del campo, o `default` si el registro no lo tiene."
+        return getattr(self, campo) if campo in self.CAMPOS else default
+
+    def __contains__(self, campo) -> bool:
+        return campo in self.CAMPOS
+
+    def to_dict(self) -> dict:
+        "Copia del registro como dict (para serializar)."
+        return {campo: getattr(self, campo) for campo in self.CAMPOS}
+
+    def _valores(self) -> tuple:
+        return tuple(getattr(self, campo) for campo in self.CAMPOS)
+
+    def __eq__(self, other):
+        if type(other) is type(self):
+            return self._valores() == other._valores()
+        if isinstance(other, dict):
+            return self.to_dict() == other
+        return NotImplemented
+
+    def __hash__(self):
+        return hash(self._valores())
+
+    def __reduce__(self):
+        return (type(self), self._valores())
+
+    def __repr__(self):
+        campos = ", ".join(f"{campo}={getattr(self, campo)!r}" for campo in self.CAMPOS)
+        return f"{type(self).__name__}({campos})"
+
+
+class RawMessage(_Registro):
+    "Mensaje crudo del chat: meta (data-pre-plain-text), cuerpo e id de la burbuja."
+    __slots__ = ("meta", "body", "id")
+    CAMPOS = __slots__
+
+    def __init__(self, meta: str, body: str, id: str = ""):  # pylint: disable=redefined-builtin
+        object.__setattr__(self, "meta", meta)
+        object.__setattr__(self, "body", body)
+        object.__setattr__(self, "id", id)
+
+
+class MetaInfo(_Registro):
+    "Fecha y autor extraídos del meta de un mensaje."
+    __slots__ = ("fecha", "autor")
+    CAMPOS = __slots__
+
+    def __init__(self, fecha: str, autor: str):
+        object.__setattr__(self, "fecha", fecha)
+        object.__setattr__(self, "autor", autor)
+
+
+class IngestPayload(_Registro):
+    "Datos de producción de un mensaje, listos para enviar a la ingesta (chat: origen, en multichat)."
+    __slots__ = ("fecha", "maquina", "formato", "cantidad", "turno", "personas", "obs", "chat")
+    CAMPOS = __slots__
+
+    def __init__(self, fecha: str, maquina: str = "", formato: str = "", cantidad=0,
+                 turno: str = "", personas="", obs: str = "", chat: str = ""):
+        object.__setattr__(self, "fecha", fecha)
+        object.__setattr__(self, "maquina", maquina)
+        object.__setattr__(self, "formato", formato)
+        object.__setattr__(self, "cantidad", cantidad)
+        object.__setattr__(self, "turno", turno)
+        object.__setattr__(self, "personas", personas)
+        object.__setattr__(self, "obs", obs)
+        object.__setattr__(self, "chat", chat)
+
+    def to_dict(self) -> dict:
+        "Copia como dict; chat solo se incluye en multichat, así un solo chat envía lo de siempre."
+        datos = super().to_dict()
+        if not self.chat:
+            del datos["chat"]
+        return datos
+
+
+def a_dict(registro) -> dict:
+    "Punto único de serialización en la ingesta: los registros pasan a dict, los dicts quedan igual."
+    return registro.to_dict() if isinstance(registro, _Registro) else registro
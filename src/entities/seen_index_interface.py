@@ -0,0 +1,18 @@
+"""
+Path: src/entities/seen_index_interface.py
+"""
+# pylint: disable=unnecessary-pass
+
+from abc import ABC, abstractmethod
+
+class ISeenIndex(ABC):
+    "Interfaz para el índice de mensajes ya procesados (deduplicación)"
+    @abstractmethod
+    def __contains__(self, key: str) -> bool:
+        "Indica si la clave ya fue vista."
+        pass
+
+    @abstractmethod
+    def add(self, key: str):
+        "Registra una clave como vista."
+        pass
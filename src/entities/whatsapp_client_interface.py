@@ -2,6 +2,7 @@
 Path: src/entities/whatsapp_client_interface.py
 """
 
+import time
 from abc import ABC, abstractmethod
 
 class IWhatsAppClient(ABC):
@@ -21,6 +22,30 @@ class IWhatsAppClient(ABC):
         "Obtiene los mensajes del chat actual."
         pass
 
+    def get_new_messages(self) -> list:
+        """Obtiene solo los mensajes posteriores a la última lectura.
+        Por defecto relee el chat completo; las implementaciones pueden extraer solo la cola."""
+        return self.get_messages()
+
+    def iter_history(self, hasta=None, max_mensajes: int | None = None):
+        """Entrega el historial en lotes, del más nuevo al más viejo.
+        Por defecto entrega un único lote con los mensajes disponibles."""
+        messages = self.get_messages()
+        if max_mensajes is not None:
+            messages = messages[-max_mensajes:] if max_mensajes > 0 else []
+        if messages:
+            yield messages
+
+    def start_push(self) -> bool:
+        "Activa la recepción de mensajes por eventos. Retorna False si no está soportado."
+        return False
+
+    def wait_for_messages(self, timeout: float) -> list:
+        """Espera mensajes nuevos hasta timeout segundos.
+        Por defecto duerme y hace una lectura incremental."""
+        time.sleep(timeout)
+        return self.get_new_messages()
+
     @abstractmethod
     def __enter__(self):
         pass
@@ -0,0 +1,337 @@
+"""
+Path: src/infrastructure/outbox.py
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+from collections import deque
+from pathlib import Path
+
+from src.entities.ingest_service_interface import IIngestService
+from src.entities.records import a_dict
+
+class Outbox:
+    """Outbox write-ahead en disco: log de segmentos append-only con los payloads y un log de
+    confirmaciones (acks). Los fsync se agrupan cada fsync_every registros o fsync_sec segundos.
+    Los segmentos totalmente confirmados se eliminan. Cada pendiente guarda su segmento y
+    posición, así el reenvío lee cada registro una sola vez."""
+    def __init__(self, directory: str, segment_bytes: int = 8 * 2**20, fsync_every: int = 100,
+                 fsync_sec: float = 1.0):
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self.segment_bytes = segment_bytes
+        self.fsync_every = fsync_every
+        self.fsync_sec = fsync_sec
+        self.logger = logging.getLogger("wa_reader.outbox")
+        self._lock = threading.Lock()
+        self._pendientes = set()
+        # Pendientes que un envío directo tiene en curso: el reenvío no debe tomarlos
+        self._en_vuelo = set()
+        # seq pendiente -> (segmento, byte donde empieza su registro)
+        self._ubicacion = {}
+        # seq en orden de alta; los ya confirmados se descartan del frente
+        self._orden = deque()
+        # Primer seq de cada segmento vivo, en orden
+        self._segmentos = []
+        self._recuperar()
+        self._archivo = None
+        self._bytes_segmento = 0
+        self._acks = open(self.directory / "acks.log", "a", encoding="utf-8")
+        self._sin_fsync = 0
+        self._ultimo_fsync = time.monotonic()
+
+    def _ruta_segmento(self, inicio: int) -> Path:
+        return self.directory / f"segment-{inicio:012d}.log"
+
+    def _recuperar(self):
+        "Reconstruye los seq pendientes a partir de los segmentos y el log de acks."
+        confirmados = set()
+        ruta_acks = self.directory / "acks.log"
+        if ruta_acks.exists():
+            with open(ruta_acks, encoding="utf-8") as f:
+                confirmados = {int(linea) for linea in f if linea.strip().isdigit()}
+        self._segmentos = sorted(
+            int(p.stem.split("-")[1]) for p in self.directory.glob("segment-*.log")
+        )
+        self._proximo_seq = 0
+        for inicio in self._segmentos:
+            for seq, _payload, posicion in self._leer_segmento(inicio):
+                self._proximo_seq = max(self._proximo_seq, seq + 1)
+                if seq not in confirmados:
+                    self._pendientes.add(seq)
+                    self._ubicacion[seq] = (inicio, posicion)
+        self._orden.extend(sorted(self._pendientes))
+        self._proximo_seq = max(self._proximo_seq, max(confirmados, default=-1) + 1)
+        # Compacta: descarta segmentos confirmados y reescribe los acks que siguen vigentes
+        for inicio in list(self._segmentos[:-1]):
+            self._eliminar_si_confirmado(inicio)
+        minimo = self._segmentos[0] if self._segmentos else self._proximo_seq
+        self._escribir_acks(sorted(seq for seq in confirmados if seq >= minimo))
+        if self._pendientes:
+            self.logger.info("Outbox: %d payloads pendientes de envío.", len(self._pendientes))
+
+    def _leer_segmento(self, inicio: int):
+        "Recorre los registros (seq, payload, posición) de un segmento; ignora una última línea truncada."
+        with open(self._ruta_segmento(inicio), "rb") as f:
+            posicion = 0
+            for linea in f:
+                inicio_linea = posicion
+                posicion += len(linea)
+                try:
+                    registro = json.loads(linea)
+                except ValueError:
+                    continue
+                yield registro["seq"], registro["payload"], inicio_linea
+
+    def __len__(self) -> int:
+        return len(self._pendientes)
+
+    def append(self, payloads: list[dict], en_vuelo: bool = False) -> list[int]:
+        """Registra los payloads antes de enviarlos. Retorna sus seq.
+        Con en_vuelo quedan reservados para quien los envía hasta liberar()."""
+        with self._lock:
+            if self._archivo is None or self._bytes_segmento >= self.segment_bytes:
+                self._rotar()
+            segmento = self._segmentos[-1]
+            seqs = []
+            for payload in payloads:
+                seq = self._proximo_seq
+                self._proximo_seq += 1
+                linea = (json.dumps({"seq": seq, "payload": a_dict(payload)},
+                                    ensure_ascii=False) + "\n").encode("utf-8")
+                self._archivo.write(linea)
+                self._ubicacion[seq] = (segmento, self._bytes_segmento)
+                self._bytes_segmento += len(linea)
+                self._pendientes.add(seq)
+                self._orden.append(seq)
+                seqs.append(seq)
+            if en_vuelo:
+                self._en_vuelo.update(seqs)
+            self._sin_fsync += len(payloads)
+            self._fsync_si_corresponde()
+            return seqs
+
+    def ack(self, seqs: list[int]):
+        "Marca los seq como enviados y elimina los segmentos que quedaron confirmados."
+        if not seqs:
+            return
+        with self._lock:
+            self._acks.writelines(f"{seq}\n" for seq in seqs)
+            self._pendientes.difference_update(seqs)
+            for seq in seqs:
+                self._ubicacion.pop(seq, None)
+            while self._orden and self._orden[0] not in self._pendientes:
+                self._orden.popleft()
+            self._sin_fsync += len(seqs)
+            self._fsync_si_corresponde()
+            eliminados = 0
+            for inicio in list(self._segmentos[:-1]):
+                if not self._eliminar_si_confirmado(inicio):
+                    break
+                eliminados += 1
+            if eliminados:
+                self._compactar_acks()
+
+    def liberar(self, seqs: list[int]):
+        "Termina la reserva de los seq: los que no se confirmaron vuelven al reenvío."
+        with self._lock:
+            self._en_vuelo.difference_update(seqs)
+
+    def pendientes(self, limite: int) -> list[tuple[int, dict]]:
+        """Retorna hasta `limite` registros pendientes y no reservados por un envío en curso,
+        del más antiguo al más nuevo."""
+        with self._lock:
+            self._flush()
+            elegidos = []
+            for seq in self._orden:
+                if len(elegidos) >= limite:
+                    break
+                if seq in self._pendientes and seq not in self._en_vuelo:
+                    elegidos.append((seq, *self._ubicacion[seq]))
+        # Los elegidos no están reservados: solo quien los reenvía puede confirmarlos, así que
+        # sus segmentos no se eliminan mientras se leen
+        registros = []
+        archivos = {}
+        try:
+            for seq, inicio, posicion in elegidos:
+                if inicio not in archivos:
+                    archivos[inicio] = open(self._ruta_segmento(inicio), "rb")
+                archivo = archivos[inicio]
+                archivo.seek(posicion)
+                registros.append((seq, json.loads(archivo.readline())["payload"]))
+        finally:
+            for archivo in archivos.values():
+                archivo.close()
+        return registros
+
+    def flush(self):
+        "Fuerza el fsync de lo escrito."
+        with self._lock:
+            self._flush()
+
+    def close(self):
+        "Sincroniza y cierra los archivos."
+        with self._lock:
+            self._flush()
+            if self._archivo is not None:
+                self._archivo.close()
+            self._acks.close()
+
+    def _rotar(self):
+        "Abre un segmento nuevo."
+        if self._archivo is not None:
+            self._flush()
+            self._archivo.close()
+        inicio = self._proximo_seq
+        self._archivo = open(self._ruta_segmento(inicio), "ab")
+        self._bytes_segmento = self._archivo.seek(0, os.SEEK_END)
+        if not self._segmentos or self._segmentos[-1] != inicio:
+            self._segmentos.append(inicio)
+
+    def _fsync_si_corresponde(self):
+        if (self._sin_fsync >= self.fsync_every
+                or time.monotonic() - self._ultimo_fsync >= self.fsync_sec):
+            self._flush()
+
+    def _flush(self):
+        for archivo in (self._archivo, self._acks):
+            if archivo is not None and not archivo.closed:
+                archivo.flush()
+                os.fsync(archivo.fileno())
+        self._sin_fsync = 0
+        self._ultimo_fsync = time.monotonic()
+
+    def _eliminar_si_confirmado(self, inicio: int) -> bool:
+        "Elimina el segmento si no le quedan seq pendientes. No aplica al segmento actual."
+        i = self._segmentos.index(inicio)
+        fin = self._segmentos[i + 1] if i + 1 < len(self._segmentos) else self._proximo_seq
+        if any(inicio <= seq < fin for seq in self._pendientes):
+            return False
+        self._ruta_segmento(inicio).unlink(missing_ok=True)
+        self._segmentos.remove(inicio)
+        return True
+
+    def _compactar_acks(self):
+        """Reescribe acks.log con los acks de los segmentos vivos: los de segmentos eliminados
+        ya no hacen falta y, sin compactar, el log crecería indefinidamente."""
+        minimo = self._segmentos[0]
+        self._acks.close()
+        self._escribir_acks(seq for seq in range(minimo, self._proximo_seq)
+                            if seq not in self._pendientes)
+        self._acks = open(self.directory / "acks.log", "a", encoding="utf-8")
+
+    def _escribir_acks(self, seqs):
+        "Reemplaza acks.log por los seq indicados, vía archivo temporal y rename."
+        ruta_tmp = self.directory / "acks.log.tmp"
+        with open(ruta_tmp, "w", encoding="utf-8") as f:
+            f.writelines(f"{seq}\n" for seq in seqs)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(ruta_tmp, self.directory / "acks.log")
+
+
+class OutboxIngestService(IIngestService):
+    """Ingesta con outbox: cada payload se registra en disco antes de enviarse y se confirma
+    al recibir respuesta. Si el envío falla, lo pendiente se reenvía en segundo plano en lotes
+    grandes con backoff exponencial; mientras tanto los payloads nuevos solo se registran."""
+    def __init__(self, ingest_service: IIngestService, outbox: Outbox, batch_size: int = 500,
+                 backoff_min: float = 1.0, backoff_max: float = 300.0):
+        self.ingest_service = ingest_service
+        self.outbox = outbox
+        self.batch_size = batch_size
+        self.backoff_min = backoff_min
+        self.backoff_max = backoff_max
+        self.logger = logging.getLogger("wa_reader.outbox")
+        self._caido = len(outbox) > 0
+        self._estado_lock = threading.Lock()
+        self._despertar = threading.Event()
+        # Se activa al terminar cada envío directo (el reenvío espera los que están en curso)
+        self._liberado = threading.Event()
+        self._detener = threading.Event()
+        self._hilo = None
+
+    def start(self):
+        "Inicia el hilo de reenvío."
+        self._hilo = threading.Thread(target=self._reenviar, name="outbox-replay", daemon=True)
+        self._hilo.start()
+        if self._caido:
+            self._despertar.set()
+
+    def send(self, payload: dict) -> str:
+        return self.send_many([payload])[0]
+
+    def send_many(self, payloads) -> list[str]:
+        "Registra los payloads en el outbox y los envía, salvo durante una caída."
+        payloads = list(payloads)
+        with self._estado_lock:
+            if self._caido:
+                self.outbox.append(payloads)
+                return ["Encolado en outbox"] * len(payloads)
+            seqs = self.outbox.append(payloads, en_vuelo=True)
+        try:
+            estados = self.ingest_service.send_many(payloads)
+            self.outbox.ack([seq for seq, estado in zip(seqs, estados) if self._ok(estado)])
+        finally:
+            self.outbox.liberar(seqs)
+            self._liberado.set()
+        if not all(self._ok(estado) for estado in estados):
+            self.logger.warning("Fallo de ingesta: los pendientes se reenviarán desde el outbox.")
+            self._caido = True
+            self._despertar.set()
+        return estados
+
+    def close(self):
+        "Detiene el reenvío y sincroniza el outbox."
+        self._detener.set()
+        self._despertar.set()
+        self._liberado.set()
+        if self._hilo is not None:
+            self._hilo.join()
+        self.outbox.close()
+
+    @staticmethod
+    def _ok(estado) -> bool:
+        return estado is not None and not str(estado).startswith("Error")
+
+    def _reenviar(self):
+        "Drena el outbox en lotes mientras haya pendientes, con backoff exponencial ante errores."
+        espera = self.backoff_min
+        while not self._detener.is_set():
+            self._despertar.wait()
+            self._despertar.clear()
+            while self._caido and not self._detener.is_set():
+                self._liberado.clear()
+                lote = self.outbox.pendientes(self.batch_size)
+                if not lote:
+                    with self._estado_lock:
+                        vacio = len(self.outbox) == 0
+                        if vacio:
+                            self._caido = False
+                    if vacio:
+                        self.logger.info("Outbox vacío: se reanuda el envío directo.")
+                        break
+                    # Solo quedan envíos directos en curso: se espera a que terminen
+                    self._liberado.wait()
+                    continue
+                estados = self.ingest_service.send_many([payload for _seq, payload in lote])
+                confirmados = [seq for (seq, _p), estado in zip(lote, estados) if self._ok(estado)]
+                self.outbox.ack(confirmados)
+                if len(confirmados) == len(lote):
+                    espera = self.backoff_min
+                    self.logger.info("Outbox: %d reenviados, %d pendientes.",
+                                     len(confirmados), len(self.outbox))
+                    continue
+                self.logger.warning("Reenvío fallido; reintento en %.0f s (%d pendientes).",
+                                    espera, len(self.outbox))
+                self._detener.wait(espera)
+                espera = min(espera * 2, self.backoff_max)
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
@@ -0,0 +1,71 @@
+"""
+Path: src/interface_adapters/gateways/async_ingest_service.py
+"""
+
+import asyncio
+import gzip
+import json
+
+import aiohttp
+from src.entities.async_ingest_service_interface import IAsyncIngestService
+from src.entities.records import a_dict
+from src.interface_adapters.gateways.ingest_protocol import mapear_estados
+
+class AsyncIngestService(IAsyncIngestService):
+    "Servicio de Ingesta asíncrono (aiohttp), con conexiones keep-alive y envío en bloque"
+    def __init__(self, endpoint: str, batch_endpoint: str | None = None, batch_size: int = 100,
+                 compress: bool = False, pool_size: int = 10, timeout: float = 30):
+        self.endpoint = endpoint
+        # Endpoint que recibe un array JSON de payloads (None = envío de a uno a endpoint)
+        self.batch_endpoint = batch_endpoint
+        self.batch_size = batch_size
+        self.compress = compress
+        self.pool_size = pool_size
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.session = None
+
+    async def __aenter__(self):
+        self.session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(limit=self.pool_size),
+            timeout=self.timeout
+        )
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.session.close()
+
+    async def send(self, payload: dict) -> str:
+        "Envía un payload al servicio de ingesta. Retorna el id o mensaje de respuesta."
+        try:
+            async with self.session.post(self.endpoint, json=a_dict(payload)) as response:
+                response.raise_for_status()
+                return await response.text()
+        except Exception as e:
+            return f"Error: {e}"
+
+    async def send_many(self, payloads) -> list[str]:
+        """Envía los payloads como arrays JSON de hasta batch_size elementos.
+        Sin batch_endpoint los envía de a uno, concurrentes dentro del pool de conexiones."""
+        payloads = list(payloads)
+        if self.batch_endpoint is None:
+            return list(await asyncio.gather(*(self.send(payload) for payload in payloads)))
+        estados = []
+        for inicio in range(0, len(payloads), self.batch_size):
+            estados.extend(await self._send_batch(payloads[inicio:inicio + self.batch_size]))
+        return estados
+
+    async def _send_batch(self, lote: list[dict]) -> list[str]:
+        "Envía un lote en un único POST."
+        cuerpo = json.dumps([a_dict(payload) for payload in lote], ensure_ascii=False).encode("utf-8")
+        headers = {"Content-Type": "application/json"}
+        if self.compress:
+            cuerpo = gzip.compress(cuerpo)
+            headers["Content-Encoding"] = "gzip"
+        try:
+            async with self.session.post(self.batch_endpoint, data=cuerpo,
+                                         headers=headers) as response:
+                response.raise_for_status()
+                texto = await response.text()
+        except Exception as e:
+            return [f"Error: {e}"] * len(lote)
+        return mapear_estados(texto, len(lote))
@@ -0,0 +1,169 @@
+"""
+Path: src/interface_adapters/gateways/async_whatsapp_client.py
+"""
+
+import re
+import asyncio
+import logging
+from playwright.async_api import async_playwright
+from playwright.async_api import Error
+from src.entities.async_whatsapp_client_interface import IAsyncWhatsAppClient
+from src.entities.records import RawMessage
+from src.interface_adapters.gateways.chat_selectors import selector_encabezado, selector_titulo
+from src.interface_adapters.gateways.whatsapp_client import (
+    SELECTOR_LISTO,
+    SELECTOR_BURBUJAS,
+    JS_EXTRAER_BURBUJAS,
+    JS_EXTRAER_DESDE_ANCLA,
+    TIPOS_BLOQUEADOS_LEAN,
+    RE_MEDIA_LEAN,
+    ARGS_LEAN,
+)
+
+class AsyncWhatsAppClient(IAsyncWhatsAppClient):
+    """Cliente de WhatsApp asíncrono (playwright.async_api).
+    WhatsApp Web mantiene activa una sola pestaña por sesión, así que todos los chats comparten
+    una página: cada lectura toma un lock, cambia de chat si hace falta y lee solo la cola
+    posterior al ancla de ese chat."""
+    def __init__(self, user_data_dir: str, headless: bool = True, chat_archived: bool = False,
+                 lean: bool = False):
+        self.user_data_dir = user_data_dir
+        self.headless = headless
+        self.chat_archived = chat_archived
+        # Modo liviano: sin imágenes, media ni fuentes, y flags de Chromium de bajo consumo
+        self.lean = lean
+        self.playwright = None
+        self.context = None
+        self.page = None
+        self._lock = asyncio.Lock()
+        self._chat_actual = None
+        self._anchors = {}
+        self.logger = logging.getLogger("wa_reader.async_whatsapp_client")
+
+    async def __aenter__(self):
+        self.logger.info("Iniciando Playwright (async) y contexto de navegador...")
+        self.playwright = await async_playwright().start()
+        self.context = await self.playwright.chromium.launch_persistent_context(
+            user_data_dir=self.user_data_dir,
+            headless=self.headless,
+            args=ARGS_LEAN if self.lean and self.headless else None
+        )
+        if self.lean:
+            await self.context.route("**/*", self._filtrar_recurso)
+        self.page = self.context.pages[0] if self.context.pages else await self.context.new_page()
+        return self
+
+    @staticmethod
+    async def _filtrar_recurso(route):
+        "Modo liviano: aborta imágenes, media, fuentes y descargas de avatares/adjuntos."
+        request = route.request
+        if request.resource_type in TIPOS_BLOQUEADOS_LEAN or RE_MEDIA_LEAN.match(request.url):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        self.logger.info("Cerrando contexto y Playwright...")
+        try:
+            if self.context:
+                await self.context.close()
+        except Exception as e:
+            self.logger.warning("Error cerrando contexto: %s", e)
+        try:
+            if self.playwright:
+                await self.playwright.stop()
+        except Exception as e:
+            self.logger.warning("Error cerrando Playwright: %s", e)
+
+    async def initialize(self, login_timeout: int = 120):
+        "Navega a WhatsApp Web y espera la interfaz (cualquiera de los selectores de login)."
+        await self.page.goto("https://web.whatsapp.com")
+        self.logger.info("Por favor espere mientras se carga la interfaz de WhatsApp Web...")
+        try:
+            await self.page.wait_for_selector(SELECTOR_LISTO,
+                                              timeout=login_timeout * 1000)
+        except Error as e:
+            raise RuntimeError("No se pudo detectar la interfaz de WhatsApp Web") from e
+        self.logger.info("Login exitoso en WhatsApp Web.")
+
+    async def open_chat(self, chat_name: str):
+        "Abre un chat (o verifica que exista) y registra su ancla de lectura."
+        async with self._lock:
+            await self._activar(chat_name)
+
+    async def get_messages(self, chat_name: str) -> list[dict]:
+        "Obtiene todos los mensajes renderizados del chat."
+        async with self._lock:
+            try:
+                await self._activar(chat_name)
+                raw = await self.page.eval_on_selector_all(SELECTOR_BURBUJAS, JS_EXTRAER_BURBUJAS)
+            except Error as e:
+                self.logger.warning("Error extrayendo mensajes de %s: %s", chat_name, e)
+                return []
+        return [self._normalizar(item) for item in raw]
+
+    async def get_new_messages(self, chat_name: str) -> list[dict]:
+        "Obtiene solo los mensajes del chat posteriores a su última burbuja vista."
+        async with self._lock:
+            try:
+                await self._activar(chat_name)
+                raw = await self.page.eval_on_selector_all(
+                    SELECTOR_BURBUJAS, JS_EXTRAER_DESDE_ANCLA, self._anchors.get(chat_name)
+                )
+            except Error as e:
+                # Re-render o navegación durante la lectura: el ancla no cambia y se reintenta
+                # en la próxima vuelta
+                self.logger.warning("Error extrayendo mensajes de %s: %s", chat_name, e)
+                return []
+        messages = [self._normalizar(item) for item in raw["items"]]
+        if messages:
+            ultimo = messages[-1]
+            self._anchors[chat_name] = {
+                "id": ultimo["id"],
+                "firma": ultimo["meta"] + "\n" + ultimo["body"],
+            }
+        return messages
+
+    @staticmethod
+    def _normalizar(item: dict) -> RawMessage:
+        return RawMessage(item["meta"], item["body"].strip(), item["id"])
+
+    async def _activar(self, chat_name: str):
+        "Cambia la página al chat indicado si no es el actual. Requiere tener el lock."
+        if self._chat_actual == chat_name:
+            return
+        self.logger.debug("Cambiando al chat: %s", chat_name)
+        if not await self._buscar_y_abrir(chat_name):
+            if not self.chat_archived:
+                raise RuntimeError(f"No se pudo encontrar el chat '{chat_name}' en WhatsApp Web.")
+            archivados = self.page.locator(
+                "//span[contains(text(), 'Archivados') or contains(text(), 'Archived')]")
+            if await archivados.count() == 0 or not await self._abrir_archivado(archivados,
+                                                                                chat_name):
+                raise RuntimeError(f"No se pudo encontrar el chat '{chat_name}' en WhatsApp Web.")
+        self._chat_actual = chat_name
+        self._anchors.setdefault(chat_name, None)
+
+    async def _abrir_archivado(self, archivados, chat_name: str) -> bool:
+        "Abre la sección de archivados y busca el chat allí."
+        await archivados.first.click()
+        return await self._buscar_y_abrir(chat_name)
+
+    async def _buscar_y_abrir(self, chat_name: str, timeout_ms: int = 5000) -> bool:
+        """Escribe el nombre en el buscador, hace clic en el resultado exacto y espera el
+        encabezado del chat: hasta entonces el panel puede mostrar las burbujas del anterior."""
+        try:
+            textbox = self.page.get_by_role("textbox", name=re.compile("Buscar|Search", re.I))
+            await textbox.click()
+            await textbox.fill(chat_name)
+            chat = self.page.locator(selector_titulo(chat_name)).first
+            await chat.wait_for(timeout=timeout_ms)
+            await chat.click()
+        except Error as e:
+            self.logger.debug("Chat '%s' no encontrado: %s", chat_name, e)
+            return False
+        try:
+            await self.page.locator(selector_encabezado(chat_name)).first.wait_for(timeout=timeout_ms)
+        except Error:
+            self.logger.warning("No se confirmó el encabezado del chat '%s'.", chat_name)
+        return True
@@ -0,0 +1,23 @@
+"""
+Path: src/interface_adapters/gateways/chat_selectors.py
+Selectores CSS por nombre de chat, compartidos por los clientes sync y async.
+"""
+
+
+def cadena_css(texto: str) -> str:
+    """Literal de cadena CSS entre comillas dobles. Solo se escapan la barra invertida, las
+    comillas y los saltos de línea: los acentos y emojis van tal cual (un `\\u00f3` en CSS
+    no es un escape unicode sino una "u" literal)."""
+    escapado = (texto.replace("\\", "\\\\").replace('"', '\\"')
+                .replace("\n", "\\a ").replace("\r", "\\d "))
+    return f'"{escapado}"'
+
+
+def selector_titulo(chat_name: str) -> str:
+    "Elemento con el título exacto del chat (resultado de búsqueda o fila de la lista)."
+    return f"span[title={cadena_css(chat_name)}]"
+
+
+def selector_encabezado(chat_name: str) -> str:
+    "Encabezado de la conversación abierta con ese título."
+    return f"#main header {selector_titulo(chat_name)}"
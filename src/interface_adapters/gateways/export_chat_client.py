@@ -0,0 +1,188 @@
+"""
+Path: src/interface_adapters/gateways/export_chat_client.py
+"""
+
+import re
+import mmap
+import logging
+from contextlib import contextmanager
+from datetime import date
+from pathlib import Path
+
+from src.entities.whatsapp_client_interface import IWhatsAppClient
+from src.entities.records import RawMessage
+
+# Encabezado de mensaje en exportaciones de Android ("11/8/25, 13:47 - Autor: texto")
+# y de iOS ("[11/8/25, 13:47:03] Autor: texto")
+RE_ENCABEZADO = re.compile(
+    r"^\u200e?\[?(?P<fecha>\d{1,2}/\d{1,2}/\d{2,4}),?\s+"
+    r"(?P<hora>\d{1,2}:\d{2}(?::\d{2})?(?:\s*[ap]\.?\s*m\.?)?)"
+    r"(?:\]\s*|\s+-\s+)(?P<resto>.*)$",
+    re.I
+)
+
+# Nombres de archivo que genera "Exportar chat" según idioma y plataforma
+NOMBRES_EXPORTACION = (
+    "Chat de WhatsApp con {chat}.txt",
+    "WhatsApp Chat with {chat}.txt",
+    "WhatsApp Chat - {chat}.txt",
+)
+
+class ExportChatClient(IWhatsAppClient):
+    """Cliente sin navegador que lee archivos .txt de "Exportar chat" de WhatsApp.
+    Produce los mismos registros RawMessage que WhatsAppClient, con el meta en el formato
+    de data-pre-plain-text ("[13:47, 11/8/2025] Autor: ") que entiende MetaParser."""
+    def __init__(self, path: str, lote: int = 1000):
+        self.path = Path(path)
+        # Mensajes por lote de iter_history
+        self.lote = lote
+        self.chat_path = None
+        self.logger = logging.getLogger("wa_reader.export_chat_client")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+    def initialize(self):
+        "No requiere inicialización: no hay navegador ni red."
+        self.logger.debug("Leyendo exportación de chat desde: %s", self.path)
+
+    def open_chat(self, chat_name: str):
+        "Resuelve el archivo del chat: la ruta indicada o el export del chat dentro del directorio."
+        if self.path.is_file():
+            self.chat_path = self.path
+        elif self.path.is_dir():
+            candidatos = [self.path / n.format(chat=chat_name) for n in NOMBRES_EXPORTACION]
+            candidatos.append(self.path / "_chat.txt")
+            self.chat_path = next((c for c in candidatos if c.is_file()), None)
+        if self.chat_path is None:
+            raise RuntimeError(f"No se encontró la exportación del chat '{chat_name}' en {self.path}")
+        self.logger.info("Leyendo chat exportado: %s", self.chat_path)
+
+    def get_messages(self) -> list[dict]:
+        "Obtiene todos los mensajes del archivo exportado."
+        messages = list(self.iter_messages())
+        self.logger.info("Total mensajes extraídos: %d", len(messages))
+        return messages
+
+    def iter_messages(self):
+        """Recorre el archivo línea por línea (memory-mapped) y entrega cada mensaje.
+        Las líneas sin encabezado se agregan al mensaje anterior (mensajes multilínea);
+        los avisos del sistema (sin autor) se descartan."""
+        with self._mapear() as mm:
+            if mm is None:
+                return
+            # Encabezado (meta, primera línea) del mensaje en curso y sus líneas siguientes
+            actual = None
+            lineas = []
+            for linea in iter(mm.readline, b""):
+                texto = linea.decode("utf-8", errors="replace").rstrip("\r\n").lstrip("\ufeff")
+                m = RE_ENCABEZADO.match(texto)
+                if m is None:
+                    if actual is not None:
+                        lineas.append(texto)
+                    continue
+                if actual is not None:
+                    yield self._crear_mensaje(actual, lineas)
+                # Los avisos del sistema dejan actual en None y sus líneas se ignoran
+                actual = self._encabezado(m)
+                lineas = []
+            if actual is not None:
+                yield self._crear_mensaje(actual, lineas)
+
+    def iter_history(self, hasta: date | None = None, max_mensajes: int | None = None):
+        """Entrega lotes de hasta `lote` mensajes, del más nuevo al más viejo y cada lote en orden
+        cronológico, como WhatsAppClient. Lee el archivo desde el final: se detiene en mensajes
+        anteriores a `hasta` o al alcanzar `max_mensajes` sin recorrer el resto, y solo mantiene
+        en memoria el lote en curso."""
+        lote = []
+        total = 0
+        for fecha, message in self._iter_desde_el_final():
+            if hasta is not None and fecha is not None and fecha < hasta:
+                break
+            if max_mensajes is not None and total >= max_mensajes:
+                break
+            lote.append(message)
+            total += 1
+            if len(lote) >= self.lote:
+                yield lote[::-1]
+                lote = []
+        if lote:
+            yield lote[::-1]
+        self.logger.info("Total mensajes extraídos: %d", total)
+
+    def _iter_desde_el_final(self):
+        "Entrega (fecha, mensaje) del último mensaje al primero."
+        with self._mapear() as mm:
+            if mm is None:
+                return
+            # Líneas de continuación del mensaje en curso, de la última a la primera
+            lineas = []
+            for linea in self._lineas_desde_el_final(mm):
+                texto = linea.decode("utf-8", errors="replace").rstrip("\r\n").lstrip("\ufeff")
+                m = RE_ENCABEZADO.match(texto)
+                if m is None:
+                    lineas.append(texto)
+                    continue
+                encabezado = self._encabezado(m)
+                # Los avisos del sistema descartan sus líneas, igual que en iter_messages
+                if encabezado is not None:
+                    yield self._fecha(m), self._crear_mensaje(encabezado, lineas[::-1])
+                lineas = []
+
+    @staticmethod
+    def _lineas_desde_el_final(mm: mmap.mmap):
+        "Recorre las líneas del archivo de la última a la primera (sin el salto de línea)."
+        fin = len(mm)
+        if mm[fin - 1:fin] == b"\n":
+            fin -= 1
+        while fin >= 0:
+            inicio = mm.rfind(b"\n", 0, fin) + 1
+            yield mm[inicio:fin]
+            fin = inicio - 1
+
+    @contextmanager
+    def _mapear(self):
+        "Abre el archivo del chat memory-mapped (None si está vacío)."
+        if self.chat_path is None:
+            raise RuntimeError("Debe llamarse a open_chat antes de leer mensajes.")
+        with open(self.chat_path, "rb") as f:
+            if self.chat_path.stat().st_size == 0:
+                yield None
+                return
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                yield mm
+
+    @staticmethod
+    def _crear_mensaje(encabezado: tuple, lineas: list) -> RawMessage:
+        "Arma el mensaje con su primera línea y las siguientes (mensajes multilínea)."
+        meta, body = encabezado
+        if lineas:
+            body = "\n".join([body, *lineas])
+        return RawMessage(meta, body)
+
+    @staticmethod
+    def _fecha(m: re.Match) -> date | None:
+        "Fecha del encabezado (día/mes/año), o None si no es una fecha válida."
+        dia, mes, anio = m.group("fecha").split("/")
+        if len(anio) == 2:
+            anio = "20" + anio
+        try:
+            return date(int(anio), int(mes), int(dia))
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _encabezado(m: re.Match) -> tuple | None:
+        "Extrae (meta, primera línea) del encabezado. None si es aviso del sistema."
+        autor, separador, body = m.group("resto").partition(": ")
+        if not separador:
+            return None
+        dia, mes, anio = m.group("fecha").split("/")
+        if len(anio) == 2:
+            anio = "20" + anio
+        autor = autor.strip("\u200e")
+        meta = f"[{m.group('hora')}, {dia}/{mes}/{anio}] {autor}: "
+        return meta, body.strip("\u200e")
@@ -0,0 +1,28 @@
+"""
+Path: src/interface_adapters/gateways/ingest_protocol.py
+"""
+
+import json
+
+
+def mapear_estados(texto: str, cantidad: int) -> list[str]:
+    """Asigna a cada payload de un envío en bloque su estado: si el servidor responde una lista
+    (o {"results": [...]}) del mismo largo, un elemento por payload; si no, la respuesta completa
+    para todos."""
+    try:
+        datos = json.loads(texto)
+    except ValueError:
+        datos = None
+    if isinstance(datos, dict):
+        datos = datos.get("results")
+    if not isinstance(datos, list) or len(datos) != cantidad:
+        return [texto] * cantidad
+    estados = []
+    for item in datos:
+        if isinstance(item, dict) and item.get("error"):
+            estados.append(f"Error: {item['error']}")
+        elif isinstance(item, dict):
+            estados.append(str(item.get("id", item.get("status", ""))))
+        else:
+            estados.append(str(item))
+    return estados
@@ -2,20 +2,63 @@
 Path: src/interface_adapters/gateways/ingest_service.py
 """
 
+import gzip
+import json
+
 import requests
+from requests.adapters import HTTPAdapter
 from src.entities.ingest_service_interface import IIngestService
+from src.entities.records import a_dict
+from src.interface_adapters.gateways.ingest_protocol import mapear_estados
 
 class IngestService(IIngestService):
     "Servicio de Ingesta"
-    def __init__(self, endpoint: str):
+    def __init__(self, endpoint: str, batch_endpoint: str | None = None, batch_size: int = 100,
+                 compress: bool = False, pool_size: int = 10, timeout: float = 30):
         self.endpoint = endpoint
+        # Endpoint que recibe un array JSON de payloads (None = envío de a uno a endpoint)
+        self.batch_endpoint = batch_endpoint
+        self.batch_size = batch_size
+        self.compress = compress
+        self.timeout = timeout
+        # Sesión con conexiones keep-alive reutilizables
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
     def send(self, payload: dict) -> str:
         "Envía un payload al servicio de ingesta. Retorna el id o mensaje de respuesta."
         try:
-            response = requests.post(self.endpoint, json=payload)
+            response = self.session.post(self.endpoint, json=a_dict(payload), timeout=self.timeout)
             response.raise_for_status()
             return response.text
         except Exception as e:
             return f"Error: {e}"
 
+    def send_many(self, payloads) -> list[str]:
+        """Envía los payloads como arrays JSON de hasta batch_size elementos (gzip opcional).
+        Sin batch_endpoint los envía de a uno con send(). Retorna un estado por payload, en orden."""
+        payloads = list(payloads)
+        if self.batch_endpoint is None:
+            return [self.send(payload) for payload in payloads]
+        estados = []
+        for inicio in range(0, len(payloads), self.batch_size):
+            estados.extend(self._send_batch(payloads[inicio:inicio + self.batch_size]))
+        return estados
+
+    def _send_batch(self, lote: list[dict]) -> list[str]:
+        "Envía un lote en un único POST."
+        cuerpo = json.dumps([a_dict(payload) for payload in lote], ensure_ascii=False).encode("utf-8")
+        headers = {"Content-Type": "application/json"}
+        if self.compress:
+            cuerpo = gzip.compress(cuerpo)
+            headers["Content-Encoding"] = "gzip"
+        try:
+            response = self.session.post(
+                self.batch_endpoint, data=cuerpo, headers=headers, timeout=self.timeout
+            )
+            response.raise_for_status()
+        except Exception as e:
+            return [f"Error: {e}"] * len(lote)
+        return mapear_estados(response.text, len(lote))
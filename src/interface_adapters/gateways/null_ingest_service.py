@@ -0,0 +1,19 @@
+"""
+Path: src/interface_adapters/gateways/null_ingest_service.py
+"""
+
+from src.entities.ingest_service_interface import IIngestService
+
+class NullIngestService(IIngestService):
+    "Ingesta que no envía nada: para los modos que solo muestran (CLI, resumen)."
+    def send(self, payload: dict) -> str:
+        return "Sin envío"
+
+    def send_many(self, payloads) -> list[str]:
+        return ["Sin envío" for _payload in payloads]
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
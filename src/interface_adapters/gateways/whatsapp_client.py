@@ -3,18 +3,231 @@ Path: src/Infrastructure/WhatsAppClient.py
 """
 
 
+import os
 import re
+import json
+import time
+import queue
 import logging
+from datetime import date, datetime
 from playwright.sync_api import sync_playwright  # noqa: E402
 from playwright.sync_api import Error  # noqa: E402
 from src.entities.whatsapp_client_interface import IWhatsAppClient
+from src.entities.meta_parser import MetaParser
+from src.entities.records import RawMessage
+from src.interface_adapters.gateways.chat_selectors import selector_encabezado, selector_titulo
+from src.shared.process_metrics import rss_arbol
+
+# Múltiples selectores para mayor compatibilidad con cambios en la interfaz
+SELECTORES_LOGIN = [
+    "div[title='Buscar o empezar un chat'], div[title='Search or start new chat']",
+    "[data-testid='chat-list-search']",  # Selector alternativo para el buscador
+    "[data-icon='search']",  # Icono de búsqueda
+    ".two, .three",  # Selectores para los paneles de WhatsApp Web
+    "._1Flk2, ._13NKt"  # Clases comunes del campo de búsqueda
+]
+SELECTOR_LISTA_CHATS = "[data-testid='chat-list']"
+SELECTOR_QR = "canvas[aria-label='Scan me!']"
+# Todos los indicadores de interfaz lista en un único selector: una sola espera, gana el primero
+SELECTOR_LISTO = ", ".join(SELECTORES_LOGIN + [SELECTOR_LISTA_CHATS])
+# Marca en el perfil persistente: la última vez la sesión quedó iniciada
+MARCA_SESION = "wa_reader_sesion"
+# Ruta (principal o archivados) por la que se llegó a cada chat, guardada en el perfil
+RUTAS_CHATS = "wa_reader_rutas.json"
+SELECTOR_ARCHIVADOS = "//span[contains(text(), 'Archivados') or contains(text(), 'Archived')]"
+# Espera máxima del resultado de búsqueda y del encabezado de la conversación
+TIMEOUT_BUSQUEDA_MS = 5000
+
+# Modo liviano: tipos de recurso que no hacen falta para leer texto y data-pre-plain-text
+TIPOS_BLOQUEADOS_LEAN = frozenset({"image", "media", "font"})
+# Avatares (pps) y adjuntos cifrados (mmg, media-*.cdn) que WhatsApp descarga por fetch
+RE_MEDIA_LEAN = re.compile(r"^https://(?:pps|mmg|media[\w.-]*)\.whatsapp\.net/")
+# Flags de Chromium que reducen memoria y trabajo de GPU/compositor en headless
+ARGS_LEAN = [
+    "--disable-gpu",
+    "--disable-software-rasterizer",
+    "--disable-dev-shm-usage",
+    "--disable-extensions",
+    "--disable-background-networking",
+    "--disable-component-update",
+    "--disable-default-apps",
+    "--disable-sync",
+    "--mute-audio",
+    "--no-first-run",
+    "--renderer-process-limit=1",
+    "--disable-features=Translate,MediaRouter,OptimizationHints,BackForwardCache",
+    "--blink-settings=imagesEnabled=false",
+]
+
+# Selector de las burbujas de mensaje dentro del chat abierto
+SELECTOR_BURBUJAS = "div[role='row'] div.copyable-text"
+
+# Extrae meta, cuerpo e id estable de todas las burbujas en una sola evaluación en la página
+JS_EXTRAER_BURBUJAS = """
+(nodes) => nodes.map((el) => {
+    const row = el.closest("[data-id]");
+    return {
+        meta: el.getAttribute("data-pre-plain-text") || "",
+        body: el.innerText || "",
+        id: row ? row.getAttribute("data-id") || "" : ""
+    };
+})
+"""
+
+# Recorre las burbujas desde la última hacia atrás hasta encontrar el ancla y extrae solo la cola
+JS_EXTRAER_DESDE_ANCLA = """
+(nodes, anchor) => {
+    const items = [];
+    let found = false;
+    for (let i = nodes.length - 1; i >= 0; i--) {
+        const el = nodes[i];
+        const row = el.closest("[data-id]");
+        const id = row ? row.getAttribute("data-id") || "" : "";
+        const meta = el.getAttribute("data-pre-plain-text") || "";
+        if (anchor && anchor.id && id === anchor.id) {
+            found = true;
+            break;
+        }
+        const body = el.innerText || "";
+        if (anchor && !anchor.id && meta + "\\n" + body.trim() === anchor.firma) {
+            found = true;
+            break;
+        }
+        items.push({meta: meta, body: body, id: id});
+    }
+    items.reverse();
+    return {found: found, items: items};
+}
+"""
+
+# Recorre las burbujas desde la primera hacia abajo hasta el ancla y extrae solo las más antiguas
+JS_EXTRAER_HASTA_ANCLA = """
+(nodes, anchor) => {
+    const items = [];
+    let found = false;
+    for (const el of nodes) {
+        const row = el.closest("[data-id]");
+        const id = row ? row.getAttribute("data-id") || "" : "";
+        const meta = el.getAttribute("data-pre-plain-text") || "";
+        if (anchor && anchor.id && id === anchor.id) {
+            found = true;
+            break;
+        }
+        const body = el.innerText || "";
+        if (anchor && !anchor.id && meta + "\\n" + body.trim() === anchor.firma) {
+            found = true;
+            break;
+        }
+        items.push({meta: meta, body: body, id: id});
+    }
+    return {found: found, items: items};
+}
+"""
+
+# Lleva al tope el contenedor con scroll del chat para que WhatsApp cargue mensajes anteriores
+JS_SCROLL_ARRIBA = """
+(selector) => {
+    const first = document.querySelector(selector);
+    let el = first ? first.parentElement : null;
+    while (el && el !== document.body) {
+        const estilo = getComputedStyle(el).overflowY;
+        if ((estilo === "auto" || estilo === "scroll") && el.scrollHeight > el.clientHeight) {
+            el.scrollTop = 0;
+            return true;
+        }
+        el = el.parentElement;
+    }
+    return false;
+}
+"""
+
+# Verdadero cuando la primera burbuja renderizada ya no es la del ancla
+JS_HAY_ANTERIORES = """
+([selector, anchor]) => {
+    const first = document.querySelector(selector);
+    if (!first) {
+        return false;
+    }
+    const row = first.closest("[data-id]");
+    const id = row ? row.getAttribute("data-id") || "" : "";
+    if (anchor.id) {
+        return id !== anchor.id;
+    }
+    const meta = first.getAttribute("data-pre-plain-text") || "";
+    return meta + "\\n" + (first.innerText || "").trim() !== anchor.firma;
+}
+"""
+
+# Nombre de la función expuesta a la página para recibir burbujas nuevas
+BINDING_PUSH = "__waReaderPush"
+
+# Observa el panel del chat y envía a Python cada burbuja nueva apenas se agrega al DOM
+JS_OBSERVAR_CHAT = """
+(binding) => {
+    if (window.__waReaderObserver) {
+        window.__waReaderObserver.disconnect();
+    }
+    const pane = document.querySelector("#main");
+    if (!pane) {
+        return false;
+    }
+    const enviados = new WeakSet();
+    const observer = new MutationObserver((mutations) => {
+        const items = [];
+        for (const mutation of mutations) {
+            for (const node of mutation.addedNodes) {
+                if (node.nodeType !== Node.ELEMENT_NODE) {
+                    continue;
+                }
+                const bubbles = node.matches("div.copyable-text")
+                    ? [node]
+                    : node.querySelectorAll("div.copyable-text");
+                for (const el of bubbles) {
+                    if (enviados.has(el) || !el.closest("div[role='row']")) {
+                        continue;
+                    }
+                    enviados.add(el);
+                    const row = el.closest("[data-id]");
+                    items.push({
+                        meta: el.getAttribute("data-pre-plain-text") || "",
+                        body: el.innerText || "",
+                        id: row ? row.getAttribute("data-id") || "" : ""
+                    });
+                }
+            }
+        }
+        if (items.length) {
+            window[binding](items);
+        }
+    });
+    observer.observe(pane, {childList: true, subtree: true});
+    window.__waReaderObserver = observer;
+    return true;
+}
+"""
 
 class WhatsAppClient(IWhatsAppClient):
     "Cliente de WhatsApp"
-    def __init__(self, user_data_dir: str, headless: bool = True, chat_archived: bool = False):
+    def __init__(self, user_data_dir: str, headless: bool = True, chat_archived: bool = False,
+                 bulk_extract: bool = True, lean: bool = False):
         self.user_data_dir = user_data_dir
         self.headless = headless
         self.chat_archived = chat_archived
+        # Modo liviano: sin imágenes, media ni fuentes, y flags de Chromium de bajo consumo
+        self.lean = lean
+        self.recursos_bloqueados = 0
+        self.carga_sec = None
+        self.listo_sec = None
+        self._lanzado = None
+        # Extracción masiva (un solo round trip); si falla se usa la lectura por elemento
+        self.bulk_extract = bulk_extract
+        # Última burbuja vista de cada chat (por data-id o, si no hay, por meta + cuerpo)
+        self._anchors = {}
+        self.chat_actual = None
+        self._rutas = self._cargar_rutas()
+        # Burbujas recibidas desde el MutationObserver (modo push)
+        self._push_queue = queue.Queue()
+        self._push_expuesto = False
         self.playwright = None
         self.context = None
         self.page = None
@@ -22,19 +235,43 @@ class WhatsAppClient(IWhatsAppClient):
 
     def __enter__(self):
         self.logger.info("Iniciando Playwright y contexto de navegador...")
+        self._lanzado = time.perf_counter()
         self.playwright = sync_playwright().start()
         self.context = self.playwright.chromium.launch_persistent_context(
             user_data_dir=self.user_data_dir,
-            headless=self.headless
+            headless=self.headless,
+            args=ARGS_LEAN if self.lean and self.headless else None
         )
+        if self.lean:
+            self.context.route("**/*", self._filtrar_recurso)
         self.page = self.context.new_page()
         self.logger.debug(
-            "Contexto lanzado con user_data_dir=%s, headless=%s",
+            "Contexto lanzado con user_data_dir=%s, headless=%s, lean=%s",
             self.user_data_dir,
-            self.headless
+            self.headless,
+            self.lean
         )
         return self
 
+    def _filtrar_recurso(self, route):
+        "Modo liviano: aborta imágenes, media, fuentes y descargas de avatares/adjuntos."
+        request = route.request
+        if request.resource_type in TIPOS_BLOQUEADOS_LEAN or RE_MEDIA_LEAN.match(request.url):
+            self.recursos_bloqueados += 1
+            route.abort()
+        else:
+            route.continue_()
+
+    def metricas(self) -> dict:
+        "RSS del navegador (proceso actual y descendientes), tiempo de carga y recursos bloqueados."
+        rss = rss_arbol()
+        return {
+            "lean": self.lean,
+            "rss_mb": rss / 2**20 if rss is not None else None,
+            "carga_sec": self.carga_sec,
+            "recursos_bloqueados": self.recursos_bloqueados,
+        }
+
     def __exit__(self, exc_type, exc_val, exc_tb):
         self.logger.info("Cerrando contexto y Playwright...")
         try:
@@ -52,13 +289,30 @@ class WhatsAppClient(IWhatsAppClient):
         "Inicializa el cliente de WhatsApp. login_timeout en segundos."
         self.logger.debug("Navegando a WhatsApp Web...")
 
+        # Perfil con sesión iniciada: no hace falta esperar el evento load para buscar la interfaz
+        espera_carga = "commit" if self._sesion_recordada() else "load"
         for attempt in range(1, retry_count + 1):
             try:
-                self.page.goto("https://web.whatsapp.com")
+                inicio = time.perf_counter()
+                if attempt == 1:
+                    self.page.goto("https://web.whatsapp.com", wait_until=espera_carga)
+                else:
+                    self.page.reload(wait_until=espera_carga)
                 self.logger.debug("Esperando login de usuario (intento %d de %d)...",
                                  attempt, retry_count)
                 self._wait_for_login(timeout=login_timeout)
+                self.carga_sec = time.perf_counter() - inicio
+                if self._lanzado is not None:
+                    self.listo_sec = time.perf_counter() - self._lanzado
                 self.logger.info("Login exitoso en WhatsApp Web.")
+                metricas = self.metricas()
+                self.logger.info(
+                    "WhatsApp Web listo en %.1f s (%.1f s desde el lanzamiento; lean=%s, "
+                    "RSS %s MiB, %d recursos bloqueados).",
+                    self.carga_sec, self.listo_sec or self.carga_sec, self.lean,
+                    f"{metricas['rss_mb']:.0f}" if metricas["rss_mb"] is not None else "?",
+                    self.recursos_bloqueados
+                )
                 return
             except KeyboardInterrupt:
                 self.logger.warning("Interrupción por el usuario durante el login.")
@@ -66,11 +320,7 @@ class WhatsAppClient(IWhatsAppClient):
                 raise
             except RuntimeError as e:
                 if attempt < retry_count:
-                    self.logger.warning(
-                        "Intento %d fallido. Reintentando en 5 segundos...", attempt
-                    )
-                    self.page.wait_for_timeout(5000)  # Esperar 5 segundos
-                    self.page.reload()  # Recargar la página
+                    self.logger.warning("Intento %d fallido. Recargando...", attempt)
                 else:
                     self.logger.error(
                         "Timeout de login superado después de %d intentos: %s", 
@@ -89,25 +339,22 @@ class WhatsAppClient(IWhatsAppClient):
             self.logger.debug("Playwright detenido por %s.", reason)
 
     def _wait_for_login(self, timeout: int = 120):
-        "Espera a que el usuario inicie sesión. timeout en segundos."
-        # Múltiples selectores para mayor compatibilidad con cambios en la interfaz
-        selectors = [
-            "div[title='Buscar o empezar un chat'], div[title='Search or start new chat']",
-            "[data-testid='chat-list-search']",  # Selector alternativo para el buscador
-            "[data-icon='search']",  # Icono de búsqueda
-            ".two, .three",  # Selectores para los paneles de WhatsApp Web
-            "._1Flk2, ._13NKt"  # Clases comunes del campo de búsqueda
-        ]
+        """Espera a que el usuario inicie sesión. timeout en segundos.
+        Todos los indicadores (buscador, paneles, lista de chats y QR) se esperan a la vez."""
         self.logger.info("Por favor espere mientras se carga la interfaz de WhatsApp Web...")
-        for selector in selectors:
-            try:
-                self.logger.debug("Intentando selector: %s", selector)
-                self.page.wait_for_selector(selector, timeout=10000)  # 10 segundos por selector
-                self.logger.info("Login exitoso en WhatsApp Web (selector: %s).", selector)
-                return
-            except Error:
-                self.logger.debug("Selector no encontrado: %s", selector)
-                continue
+        limite = time.monotonic() + timeout
+        try:
+            self.page.wait_for_selector(f"{SELECTOR_LISTO}, {SELECTOR_QR}", timeout=timeout * 1000)
+            if self.page.locator(SELECTOR_LISTO).count() == 0:
+                self.logger.warning(
+                    "Se detectó un código QR. Por favor escanee el código con su teléfono.")
+                self._olvidar_sesion()
+                restante_ms = max(0.0, limite - time.monotonic()) * 1000
+                self.page.wait_for_selector(SELECTOR_LISTO, timeout=restante_ms)
+            self._recordar_sesion()
+            return
+        except Error as e:
+            self.logger.debug("Interfaz no detectada: %s", e)
         self.logger.error(
             "No se pudo detectar la interfaz de WhatsApp Web después de %d segundos.",
             timeout
@@ -119,82 +366,313 @@ class WhatsAppClient(IWhatsAppClient):
         except Error as e:
             self.logger.error("No se pudo guardar screenshot: %s", e)
 
-        # Verificar si hay QR o ya está en la interfaz
-        try:
-            if self.page.locator("canvas[aria-label='Scan me!']").count() > 0:
-                self.logger.error(
-                    "Se detectó un código QR. Por favor escanee el código con su teléfono.")
-            elif self.page.locator("[data-testid='chat-list']").count() > 0:
-                self.logger.warning(
-                    "Se detectó la lista de chats pero no el buscador. Intentando continuar...")
-                return
-        except Error:
-            pass
-
         self.logger.error("¿WhatsApp Web está cargado correctamente? Verifique la pantalla.")
         raise RuntimeError("No se pudo detectar la interfaz de WhatsApp Web")
 
+    def _sesion_recordada(self) -> bool:
+        "Indica si el perfil quedó con la sesión iniciada en la última ejecución."
+        return os.path.exists(os.path.join(self.user_data_dir, MARCA_SESION))
+
+    def _recordar_sesion(self):
+        "Marca el perfil como logueado para usar el camino rápido en el próximo arranque."
+        try:
+            with open(os.path.join(self.user_data_dir, MARCA_SESION), "w", encoding="utf-8") as f:
+                f.write(datetime.now().isoformat())
+        except OSError as e:
+            self.logger.debug("No se pudo guardar la marca de sesión: %s", e)
+
+    def _olvidar_sesion(self):
+        "Borra la marca de sesión (WhatsApp pidió escanear el QR)."
+        try:
+            os.remove(os.path.join(self.user_data_dir, MARCA_SESION))
+        except OSError:
+            pass
+
     def open_chat(self, chat_name: str):
-        "Abre un chat en WhatsApp, buscando en la lista principal y en archivados si es necesario."
+        """Abre un chat en WhatsApp, buscando en la lista principal y en archivados si es necesario.
+        Empieza por la ruta que funcionó la última vez y espera el resultado y el encabezado
+        de la conversación en lugar de pausas fijas."""
+        if (self.chat_actual == chat_name
+                and self.page.locator(selector_encabezado(chat_name)).count() > 0):
+            self.logger.debug("El chat '%s' ya está abierto.", chat_name)
+            return
         self.logger.info("Buscando y abriendo chat: %s", chat_name)
+        rutas = ["principal", "archivados"] if self.chat_archived else ["principal"]
+        if self._rutas.get(chat_name) == "archivados" and self.chat_archived:
+            rutas.reverse()
+        for ruta in rutas:
+            if ruta == "archivados" and not self._abrir_archivados():
+                continue
+            if self._buscar_y_abrir(chat_name):
+                self.logger.info("Leyendo chat%s: %s",
+                                 " archivado" if ruta == "archivados" else "", chat_name)
+                # Cada chat conserva su ancla: al volver a él solo se lee lo nuevo
+                self.chat_actual = chat_name
+                if self._rutas.get(chat_name) != ruta:
+                    self._rutas[chat_name] = ruta
+                    self._guardar_rutas()
+                return
+            self.logger.info("Chat '%s' no encontrado en %s.", chat_name,
+                             "archivados" if ruta == "archivados" else "la lista principal")
+        if not self.chat_archived:
+            self.logger.info("No se buscará en archivados porque chat_archived=False.")
+
+        # Si llega aquí, no se encontró el chat
+        self.logger.error("No se pudo encontrar el chat '%s'. Deteniendo ejecución.", chat_name)
+        raise RuntimeError(f"No se pudo encontrar el chat '{chat_name}' en WhatsApp Web.")
+
+    def _buscar_y_abrir(self, chat_name: str, timeout_ms: int = TIMEOUT_BUSQUEDA_MS) -> bool:
+        "Escribe el nombre en el buscador de una vez, espera el resultado exacto y lo abre."
         try:
-            # Buscar el textbox y limpiar antes de escribir
             textbox = self.page.get_by_role("textbox", name=re.compile("Buscar|Search", re.I))
             textbox.click()
-            textbox.fill("")  # Limpiar campo
-            textbox.type(chat_name, delay=50)
-            self.page.wait_for_timeout(1000)  # Esperar resultados
+            textbox.fill(chat_name)
         except Error:
             self.logger.warning("No se pudo interactuar con el textbox de búsqueda, intentando continuar...")
+        resultado = self.page.locator(selector_titulo(chat_name)).first
+        try:
+            resultado.wait_for(timeout=timeout_ms)
+            resultado.click()
+        except Error as e:
+            self.logger.debug("Chat '%s' no encontrado: %s", chat_name, e)
+            return False
+        try:
+            self.page.locator(selector_encabezado(chat_name)).first.wait_for(timeout=timeout_ms)
+        except Error:
+            self.logger.warning("No se confirmó el encabezado del chat '%s'.", chat_name)
+        return True
 
-        # Buscar el chat por nombre exacto
-        chat_locator = self.page.locator(f"//span[@title='{chat_name}']")
-        if chat_locator.count() > 0:
-            chat_locator.first.click()
-            self.logger.info("Leyendo chat: %s", chat_name)
-            return
+    def _abrir_archivados(self) -> bool:
+        "Abre la sección de archivados."
+        archivados = self.page.locator(SELECTOR_ARCHIVADOS)
+        try:
+            archivados.first.wait_for(timeout=TIMEOUT_BUSQUEDA_MS)
+            archivados.first.click()
+        except Error:
+            self.logger.error("No se encontró la sección de archivados en WhatsApp Web.")
+            return False
+        self.logger.info("Sección de archivados abierta.")
+        return True
 
-        self.logger.info("Chat '%s' no encontrado en la lista principal.", chat_name)
-        # Buscar en archivados si corresponde
-        if self.chat_archived:
-            self.logger.info("Buscando en archivados...")
-            archived_locator = self.page.locator(
-                "//span[contains(text(), 'Archivados') or contains(text(), 'Archived')]")
-            if archived_locator.count() > 0:
-                archived_locator.first.click()
-                self.logger.info("Sección de archivados abierta.")
-                self.page.wait_for_timeout(1000)
-                # Repetir búsqueda en archivados
-                try:
-                    textbox = self.page.get_by_role("textbox", name=re.compile("Buscar|Search", re.I))
-                    textbox.click()
-                    textbox.fill("")
-                    textbox.type(chat_name, delay=50)
-                    self.page.wait_for_timeout(1000)
-                except Error:
-                    self.logger.warning("No se pudo usar el textbox en archivados.")
-                archived_chat_locator = self.page.locator(f"//span[@title='{chat_name}']")
-                if archived_chat_locator.count() > 0:
-                    archived_chat_locator.first.click()
-                    self.logger.info("Leyendo chat archivado: %s", chat_name)
-                    return
-                else:
-                    self.logger.error("El chat '%s' no se encuentra en archivados.", chat_name)
-            else:
-                self.logger.error("No se encontró la sección de archivados en WhatsApp Web.")
-        else:
-            self.logger.info("No se buscará en archivados porque chat_archived=False.")
+    def _cargar_rutas(self) -> dict:
+        "Lee del perfil la ruta por la que se abrió cada chat."
+        try:
+            with open(os.path.join(self.user_data_dir, RUTAS_CHATS), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
 
-        # Si llega aquí, no se encontró el chat
-        self.logger.error("No se pudo encontrar el chat '%s'. Deteniendo ejecución.", chat_name)
-        raise RuntimeError(f"No se pudo encontrar el chat '{chat_name}' en WhatsApp Web.")
+    def _guardar_rutas(self):
+        "Guarda en el perfil la ruta por la que se abrió cada chat."
+        try:
+            with open(os.path.join(self.user_data_dir, RUTAS_CHATS), "w", encoding="utf-8") as f:
+                json.dump(self._rutas, f, ensure_ascii=False)
+        except OSError as e:
+            self.logger.debug("No se pudo guardar las rutas de chats: %s", e)
 
     def get_messages(self) -> list[dict]:
-        # Cambiar todos los mensajes self.logger.info a self.logger.debug en este archivo
         "Obtiene los mensajes del chat."
-        self.logger.info("Extrayendo mensajes del chat...")
+        self.logger.debug("Extrayendo mensajes del chat...")
+        messages = None
+        if self.bulk_extract:
+            messages = self._get_messages_bulk()
+        if messages is None:
+            messages = self._get_messages_por_elemento()
+        self.logger.info("Total mensajes extraídos: %d", len(messages))
+        return messages
+
+    def get_new_messages(self) -> list[dict]:
+        "Obtiene solo los mensajes posteriores a la última burbuja vista."
+        messages = None
+        if self.bulk_extract:
+            messages = self._get_new_messages_bulk()
+        if messages is None:
+            messages = self._cola_desde_ancla(self._get_messages_por_elemento())
+        if messages:
+            self._anchor = self._crear_ancla(messages[-1])
+        self.logger.debug("Mensajes nuevos desde el ancla: %d", len(messages))
+        return messages
+
+    def iter_history(self, hasta: date | None = None, max_mensajes: int | None = None,
+                     espera_ms: int = 3000, reintentos: int = 3):
+        """Recorre el chat hacia arriba y entrega lotes de mensajes, del más nuevo al más viejo.
+        Cada lote está en orden cronológico. Se detiene al llegar al inicio del chat, a mensajes
+        anteriores a `hasta` o al alcanzar `max_mensajes`. Solo mantiene en memoria el lote previo."""
+        anchor = None
+        claves_prev = set()
+        total = 0
+        sin_cambios = 0
+        while True:
+            lote = self._get_messages_hasta_ancla(anchor)
+            lote = [m for m in lote if (m["meta"], m["body"]) not in claves_prev]
+            if lote:
+                sin_cambios = 0
+                anchor = self._crear_ancla(lote[0])
+                claves_prev = {(m["meta"], m["body"]) for m in lote}
+                corte = False
+                if hasta is not None:
+                    recientes = [m for m in lote if not self._anterior_a(m["meta"], hasta)]
+                    corte = len(recientes) < len(lote)
+                    lote = recientes
+                if max_mensajes is not None and total + len(lote) >= max_mensajes:
+                    lote = lote[len(lote) - (max_mensajes - total):]
+                    corte = True
+                total += len(lote)
+                self.logger.debug("Lote de historial: %d mensajes (total %d)", len(lote), total)
+                if lote:
+                    yield lote
+                if corte:
+                    return
+            elif anchor is None:
+                return
+            else:
+                sin_cambios += 1
+                if sin_cambios > reintentos:
+                    self.logger.info("Inicio del chat alcanzado (%d mensajes).", total)
+                    return
+            self._scroll_arriba(anchor, espera_ms)
+
+    def _get_messages_hasta_ancla(self, anchor: dict | None) -> list[dict]:
+        "Extrae las burbujas renderizadas por encima del ancla."
+        try:
+            raw = self.page.eval_on_selector_all(SELECTOR_BURBUJAS, JS_EXTRAER_HASTA_ANCLA, anchor)
+        except Error as e:
+            self.logger.warning("Error extrayendo historial: %s", e)
+            return []
+        return [
+            RawMessage(item["meta"], item["body"].strip(), item["id"])
+            for item in raw["items"]
+        ]
+
+    def _scroll_arriba(self, anchor: dict, espera_ms: int):
+        "Desplaza el chat al tope y espera a que se rendericen mensajes anteriores al ancla."
+        try:
+            if not self.page.evaluate(JS_SCROLL_ARRIBA, SELECTOR_BURBUJAS):
+                self.logger.debug("No se encontró el contenedor con scroll del chat.")
+            self.page.wait_for_function(
+                JS_HAY_ANTERIORES, arg=[SELECTOR_BURBUJAS, anchor], timeout=espera_ms
+            )
+        except Error:
+            self.logger.debug("Sin mensajes anteriores tras %d ms.", espera_ms)
+
+    @staticmethod
+    def _anterior_a(meta: str, hasta: date) -> bool:
+        "Indica si la fecha del meta (d/m/aaaa) es anterior a `hasta`."
+        m = MetaParser.META_REGEX.match(meta)
+        if not m:
+            return False
+        try:
+            return datetime.strptime(m.group(2).strip(), "%d/%m/%Y").date() < hasta
+        except ValueError:
+            return False
+
+    def start_push(self) -> bool:
+        "Inyecta un MutationObserver en el chat abierto. Retorna False si no es posible."
+        try:
+            if not self._push_expuesto:
+                self.page.expose_function(BINDING_PUSH, self._recibir_push)
+                self._push_expuesto = True
+            activo = bool(self.page.evaluate(JS_OBSERVAR_CHAT, BINDING_PUSH))
+        except Error as e:
+            self.logger.warning("No se pudo activar el modo push: %s", e)
+            return False
+        if not activo:
+            self.logger.warning("No se encontró el panel del chat para observar.")
+        return activo
+
+    def wait_for_messages(self, timeout: float) -> list[dict]:
+        "Bloquea hasta recibir burbujas nuevas del observer o hasta agotar timeout (segundos)."
+        limite = time.monotonic() + timeout
+        while self._push_queue.empty():
+            restante = limite - time.monotonic()
+            if restante <= 0:
+                return []
+            # Con la API sync, Playwright solo despacha los bindings mientras se espera en él
+            self.page.wait_for_timeout(min(100, restante * 1000))
         messages = []
-        bubbles = self.page.locator("div[role='row'] div.copyable-text")
+        while not self._push_queue.empty():
+            messages.extend(self._push_queue.get_nowait())
+        if messages:
+            self._anchor = self._crear_ancla(messages[-1])
+        self.logger.debug("Mensajes recibidos por push: %d", len(messages))
+        return messages
+
+    def _recibir_push(self, items: list[dict]):
+        "Callback invocado desde la página con las burbujas nuevas."
+        self._push_queue.put([
+            RawMessage(item["meta"], item["body"].strip(), item["id"])
+            for item in items
+        ])
+
+    def reset_anchor(self):
+        "Olvida la última burbuja vista; la próxima lectura incremental trae todo el chat."
+        self._anchor = None
+
+    @property
+    def _anchor(self) -> dict | None:
+        "Ancla del chat abierto."
+        return self._anchors.get(self.chat_actual)
+
+    @_anchor.setter
+    def _anchor(self, anchor: dict | None):
+        self._anchors[self.chat_actual] = anchor
+
+    @staticmethod
+    def _crear_ancla(message: dict) -> dict:
+        "Construye el ancla a partir del último mensaje leído."
+        return {
+            "id": message.get("id", ""),
+            "firma": message["meta"] + "\n" + message["body"],
+        }
+
+    def _cola_desde_ancla(self, messages: list[dict]) -> list[dict]:
+        "Retorna los mensajes posteriores al ancla dentro de una lectura completa."
+        if self._anchor is None:
+            return messages
+        for i in range(len(messages) - 1, -1, -1):
+            msg = messages[i]
+            if self._anchor["id"]:
+                encontrado = msg.get("id") == self._anchor["id"]
+            else:
+                encontrado = msg["meta"] + "\n" + msg["body"] == self._anchor["firma"]
+            if encontrado:
+                return messages[i + 1:]
+        self.logger.debug("Ancla no encontrada en el chat renderizado; se relee todo.")
+        return messages
+
+    def _get_new_messages_bulk(self) -> list[dict] | None:
+        "Extrae en una única evaluación solo las burbujas posteriores al ancla."
+        try:
+            raw = self.page.eval_on_selector_all(
+                SELECTOR_BURBUJAS, JS_EXTRAER_DESDE_ANCLA, self._anchor
+            )
+        except Error as e:
+            self.logger.warning("Extracción incremental fallida, usando lectura por elemento: %s", e)
+            return None
+        if self._anchor is not None and not raw["found"]:
+            self.logger.debug("Ancla no encontrada en el chat renderizado; se relee todo.")
+        return [
+            RawMessage(item["meta"], item["body"].strip(), item["id"])
+            for item in raw["items"]
+        ]
+
+    def _get_messages_bulk(self) -> list[dict] | None:
+        "Extrae todas las burbujas en una única evaluación. Retorna None si falla."
+        try:
+            raw = self.page.eval_on_selector_all(SELECTOR_BURBUJAS, JS_EXTRAER_BURBUJAS)
+        except Error as e:
+            self.logger.warning("Extracción masiva fallida, usando lectura por elemento: %s", e)
+            return None
+        self.logger.debug("Cantidad de burbujas encontradas: %d", len(raw))
+        return [
+            RawMessage(item["meta"], item["body"].strip(), item["id"])
+            for item in raw
+        ]
+
+    def _get_messages_por_elemento(self) -> list[dict]:
+        "Extrae las burbujas una por una (varios round trips por mensaje)."
+        messages = []
+        bubbles = self.page.locator(SELECTOR_BURBUJAS)
         count = bubbles.count()
         self.logger.debug("Cantidad de burbujas encontradas: %d", count)
 
@@ -203,10 +681,9 @@ class WhatsAppClient(IWhatsAppClient):
                 element = bubbles.nth(i)
                 meta = element.get_attribute("data-pre-plain-text") or ""
                 body = element.inner_text().strip()
-                messages.append({"meta": meta, "body": body})
+                messages.append(RawMessage(meta, body))
                 self.logger.debug("Mensaje extraído: meta=%s, body=%s", meta, body[:30])
             except (Error, RuntimeError) as e:
                 self.logger.warning("Error extrayendo mensaje en posición %d: %s", i, e)
                 continue
-        self.logger.info("Total mensajes extraídos: %d", len(messages))
         return messages
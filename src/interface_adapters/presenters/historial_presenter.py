@@ -2,57 +2,161 @@
 Path: src/interface_adapters/presenters/historial_presenter.py
 """
 
-from tabulate import tabulate
+import re
+import sys
+
+try:
+    from wcwidth import wcwidth
+except ImportError:
+    def wcwidth(_caracter):
+        "Ancho visual aproximado cuando wcwidth no está instalado"
+        return 1
 from src.entities.meta_parser import MetaParser
+from src.uses_cases.resumen_produccion import COLUMNAS_RESUMEN
+
+# Ancho visual por carácter ya calculado (los textos del chat repiten pocos caracteres)
+_ANCHOS = {}
+# Caracteres que pueden no ocupar una columna: fuera de ASCII imprimible y del latín
+# (U+00A0-U+02FF, acentos y eñes incluidos) hay que medirlos uno por uno
+RE_ANCHO_VARIABLE = re.compile(r"[^\x20-\x7e\xa0-\u02ff]")
+# Filas que se acumulan antes de cada escritura en la salida
+FILAS_POR_ESCRITURA = 1000
+# Celdas de fecha y autor ya ajustadas que se conservan como máximo
+MAX_CELDAS_CACHE = 10_000
+
+
+def ancho_caracter(caracter: str) -> int:
+    "Ancho visual del carácter en la terminal (0 para los de control), con caché."
+    ancho = _ANCHOS.get(caracter)
+    if ancho is None:
+        ancho = _ANCHOS[caracter] = max(wcwidth(caracter), 0)
+    return ancho
+
+
+def ajustar(texto, ancho: int) -> str:
+    "Trunca (con '...') o rellena el texto al ancho visual indicado."
+    texto = str(texto) if texto is not None else ""
+    if "\n" in texto:
+        texto = texto.replace("\n", " | ")
+    if (texto.isascii() and texto.isprintable()) or not RE_ANCHO_VARIABLE.search(texto):
+        # Camino rápido: en ASCII imprimible y en latín cada carácter ocupa una columna
+        if len(texto) > ancho:
+            return texto[:ancho - 3] + "..."
+        return texto.ljust(ancho)
+    total = 0
+    corte = None
+    for i, caracter in enumerate(texto):
+        ancho_c = _ANCHOS.get(caracter)
+        if ancho_c is None:
+            ancho_c = ancho_caracter(caracter)
+        if corte is None and total + ancho_c > ancho - 3:
+            corte = (i, total)
+        total += ancho_c
+        if total > ancho:
+            i, visible = corte
+            return texto[:i] + "..." + " " * (ancho - 3 - visible)
+    return texto + " " * (ancho - total)
 
 class HistorialPresenter:
     "Presenta el historial de mensajes en CLI"
-    def __init__(self, meta_parser: MetaParser):
+    def __init__(self, meta_parser: MetaParser, salida=None, filas_por_pagina: int = 0):
         self.meta_parser = meta_parser
+        self._salida = salida
+        # Paginado: cada filas_por_pagina filas se repite el encabezado (0 = sin paginar)
+        self.filas_por_pagina = filas_por_pagina
+        self._filas_en_pagina = 0
+        self._celdas_fecha = {}
+        self._celdas_autor = {}
+        anchos = (self.ANCHO_FECHA, self.ANCHO_AUTOR, self.ANCHO_MENSAJE)
+        self._encabezado = (
+            "| " + " | ".join(ajustar(h, a) for h, a in zip(("Fecha", "Autor", "Mensaje"), anchos))
+            + " |\n|" + "|".join("-" * (a + 2) for a in anchos) + "|\n"
+        )
+
+    ANCHO_FECHA = 12
+    ANCHO_AUTOR = 30
+    ANCHO_MENSAJE = 40
+
+    @property
+    def salida(self):
+        "Destino de la tabla (por defecto la salida estándar vigente)."
+        return self._salida or sys.stdout
 
     def mostrar_tabla_autor_cargo(self, tabla_prev, chat_name):
         "Muestra la tabla con columnas: Fecha, Autor, Mensaje (truncado y ancho fijo)"
-        ANCHO_FECHA = 12
-        ANCHO_AUTOR = 30
-        ANCHO_MENSAJE = 40
-        try:
-            from wcwidth import wcswidth
-        except ImportError:
-            def wcswidth(text):
-                return len(text)
-        def ajustar(texto, ancho):
-            texto = str(texto) if texto is not None else ""
-            texto = texto.replace('\n', ' | ')
-            visual = wcswidth(texto)
-            if visual > ancho:
-                acc = ''
-                total = 0
-                for c in texto:
-                    w = wcswidth(c)
-                    if total + w > ancho - 3:
-                        break
-                    acc += c
-                    total += w
-                return acc + '...'
-            pad = ' ' * (ancho - visual)
-            return texto + pad
-        filas = []
+        self.mostrar_encabezado_autor_cargo(chat_name)
+        self.mostrar_filas_autor_cargo(tabla_prev)
+        self.salida.write("\n\n")
+        self.salida.flush()
+
+    def mostrar_encabezado_autor_cargo(self, chat_name, titulo: str = "Tabla datos crudos"):
+        "Muestra el título y el encabezado de la tabla Fecha, Autor, Mensaje"
+        self.salida.write(f"\n{titulo}: {chat_name}\n\n" if chat_name else f"\n{titulo}:\n\n")
+        self.salida.write(self._encabezado)
+        self._filas_en_pagina = 0
+
+    def mostrar_filas_autor_cargo(self, tabla_prev):
+        """Muestra filas de la tabla Fecha, Autor, Mensaje a medida que llegan (lista o iterador).
+        Escribe por bloques de FILAS_POR_ESCRITURA y, si hay paginado, repite el encabezado."""
+        bloque = []
+        # Fechas y autores se repiten: su celda ya ajustada se reutiliza
+        fechas = self._celdas_fecha
+        autores = self._celdas_autor
         for fila in tabla_prev:
-            if len(fila) >= 3:
-                fecha, autor, mensaje = fila[:3]
-            else:
-                fecha, autor, mensaje = (fila + ["", "", ""])[:3]
-            fecha = ajustar(fecha, ANCHO_FECHA)
-            autor = ajustar(autor, ANCHO_AUTOR)
-            mensaje = ajustar(mensaje, ANCHO_MENSAJE)
-            filas.append([fecha, autor, mensaje])
-        headers = ["Fecha", "Autor", "Mensaje"]
-        print(f"\nTabla datos crudos: {chat_name}\n")
-        print("| " + " | ".join([ajustar(h, a) for h, a in zip(headers, [ANCHO_FECHA, ANCHO_AUTOR, ANCHO_MENSAJE])]) + " |")
-        print("|" + "|".join(["-" * (a + 2) for a in [ANCHO_FECHA, ANCHO_AUTOR, ANCHO_MENSAJE]]) + "|")
-        for fila in filas:
-            print("| " + " | ".join(fila) + " |")
-        print("\n")
+            if len(fila) < 3:
+                fila = (list(fila) + ["", "", ""])[:3]
+            fecha, autor, mensaje = fila[:3]
+            if self.filas_por_pagina and self._filas_en_pagina == self.filas_por_pagina:
+                bloque.append("\n" + self._encabezado)
+                self._filas_en_pagina = 0
+            celda_fecha = fechas.get(fecha)
+            if celda_fecha is None:
+                celda_fecha = fechas[fecha] = ajustar(fecha, self.ANCHO_FECHA)
+            celda_autor = autores.get(autor)
+            if celda_autor is None:
+                celda_autor = autores[autor] = ajustar(autor, self.ANCHO_AUTOR)
+            bloque.append(f"| {celda_fecha} | {celda_autor} | "
+                          f"{ajustar(mensaje, self.ANCHO_MENSAJE)} |\n")
+            self._filas_en_pagina += 1
+            if len(bloque) >= FILAS_POR_ESCRITURA:
+                self.salida.write("".join(bloque))
+                bloque.clear()
+                if len(fechas) + len(autores) > MAX_CELDAS_CACHE:
+                    fechas.clear()
+                    autores.clear()
+        self.salida.write("".join(bloque))
+        self.salida.flush()
+
+    @staticmethod
+    def mostrar_resumen(filas, chat_name):
+        "Muestra los totales de producción por día, máquina y turno"
+        print(f"\nResumen de producción: {chat_name}\n")
+        # Import diferido: tabulate solo hace falta para esta tabla
+        from tabulate import tabulate
+        print(tabulate(
+            filas,
+            headers=["Día", "Máquina", "Turno", "Cantidad", "Mensajes", "Persona-turnos"],
+            tablefmt="github",
+            showindex=False
+        ))
+
+    @staticmethod
+    def escribir_resumen_csv(filas, destino: str):
+        "Escribe los totales de producción en CSV ('-' = salida estándar)"
+        import csv
+        archivo = sys.stdout if destino == "-" else open(destino, "w", encoding="utf-8", newline="")
+        try:
+            writer = csv.writer(archivo)
+            writer.writerow(COLUMNAS_RESUMEN)
+            writer.writerows(filas)
+        finally:
+            if archivo is not sys.stdout:
+                archivo.close()
+
+    @staticmethod
+    def _ajustar(texto, ancho):
+        "Trunca o rellena el texto al ancho visual indicado"
+        return ajustar(texto, ancho)
 
     @staticmethod
     def truncar_mensaje(mensaje: str, max_len: int = 40) -> str:
@@ -60,42 +164,18 @@ class HistorialPresenter:
         if len(mensaje) > max_len:
             return mensaje[:max_len-3] + '...'
         return mensaje
+
     def mostrar_tabla_cruda(self, tabla_prev, _chat_name):
         "Muestra la tabla cruda de mensajes (solo Fecha, Autor, Mensaje truncado)"
-        import logging
-        logger = logging.getLogger("wa_reader.historial")
-        logger.debug("Mostrando tabla de datos crudos")
-        ANCHO_FECHA = 12
-        ANCHO_AUTOR = 30
-        ANCHO_MENSAJE = 40
-        def ajustar(texto, ancho):
-            texto = str(texto) if texto is not None else ""
-            texto = texto.replace('\n', ' | ')
-            if len(texto) > ancho:
-                return texto[:ancho-3] + "..."
-            return texto.ljust(ancho)
-        filas = []
-        for fila in tabla_prev:
-            # Mantener estructura, pero solo mostrar los primeros tres campos
-            if len(fila) >= 3:
-                fecha, autor, mensaje = fila[:3]
-            else:
-                fecha, autor, mensaje = (fila + ["", "", ""])[:3]
-            fecha = ajustar(fecha, ANCHO_FECHA)
-            autor = ajustar(autor, ANCHO_AUTOR)
-            mensaje = ajustar(mensaje, ANCHO_MENSAJE)
-            filas.append([fecha, autor, mensaje])
-        headers = ["Fecha", "Autor", "Mensaje"]
-        print("\nMensajes crudos del chat:\n")
-        print("| " + " | ".join([ajustar(h, a) for h, a in zip(headers, [ANCHO_FECHA, ANCHO_AUTOR, ANCHO_MENSAJE])]) + " |")
-        print("|" + "|".join(["-" * (a + 2) for a in [ANCHO_FECHA, ANCHO_AUTOR, ANCHO_MENSAJE]]) + "|")
-        for fila in filas:
-            print("| " + " | ".join(fila) + " |")
+        self.mostrar_encabezado_autor_cargo(None, titulo="Mensajes crudos del chat")
+        self.mostrar_filas_autor_cargo(tabla_prev)
 
     def mostrar_tabla_procesada(self, tabla, chat_name):
         "Muestra la tabla procesada de mensajes"
         fecha = tabla[0][0] if tabla and tabla[0][0] else "(sin datos)"
         print(f"\nHistorial del chat: {chat_name} - Fecha: {fecha}\n")
+        # Import diferido: tabulate solo hace falta para esta tabla
+        from tabulate import tabulate
         print(tabulate(
             tabla,
             headers=["Fecha", "Máquina", "Formato", "Cantidad", "Turno", "Personas", "Obs"],
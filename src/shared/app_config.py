@@ -8,11 +8,62 @@ class AppConfig:
     "Configuración de la aplicación"
     def __init__(self):
         self.chat_name = "Operadores de bolsa"
+        # Varios chats en el monitor: se alternan en la misma página según su actividad
+        self.chat_names = []
+        self.multichat_min_sec = 2
+        self.multichat_max_sec = 60
         self.ingest_url = "http://127.0.0.1/ingesta"
+        # Envío en bloque: arrays JSON de hasta ingest_batch_size payloads a este endpoint
+        # (None = el servidor solo acepta objetos: se envía de a uno a ingest_url)
+        self.ingest_batch_url = None
+        self.ingest_batch_size = 100
+        self.ingest_gzip = False
+        # Cola de ingesta en segundo plano: workers concurrentes y tamaño máximo (contrapresión)
+        self.ingest_workers = 2
+        self.ingest_queue_size = 1000
+        # Outbox write-ahead para no perder payloads si la ingesta falla (None = deshabilitado)
+        self.outbox_dir = "./wa_outbox"
+        self.outbox_batch_size = 500
         self.headless = False
+        # Navegador liviano: bloquea imágenes, media y fuentes (y flags de bajo consumo en headless)
+        self.lean_browser = False
         self.user_data = "./wa_profile"
+        # Polling adaptativo: poll_min_sec con actividad, backoff x poll_backoff hasta poll_max_sec
+        # en silencio; a poll_margen_turno_min minutos de un cambio de turno el techo es poll_sec
         self.poll_sec = 5
+        self.poll_min_sec = 2
+        self.poll_max_sec = 60
+        self.poll_backoff = 2.0
+        self.poll_turnos = {"mañana": 6, "tarde": 14, "noche": 22}
+        self.poll_margen_turno_min = 30
+        # Modo push: MutationObserver en la página + barrido de consistencia cada sweep_sec
+        self.push_mode = True
+        self.sweep_sec = 60
         self.tz_local = tz.gettz("America/Argentina/Buenos_Aires")
         self.chat_archived = False
         self.output_mode = "cli"
+        # Archivo (o carpeta) de "Exportar chat"; si se indica, el historial no usa navegador
+        self.export_path = None
+        # Backfill del historial: recorre el chat hacia arriba por lotes
+        self.backfill = False
+        self.backfill_hasta = None  # "AAAA-MM-DD"
+        self.backfill_max = None
+        # Parseo paralelo del historial (ProcessPoolExecutor); 1 = en el proceso actual
+        self.historial_workers = 1
+        self.historial_chunk = 2000
+        # Tabla del historial: repetir el encabezado cada historial_pagina filas (0 = sin paginar)
+        self.historial_pagina = 0
+        # Resumen de producción por día/máquina/turno en lugar de listar o enviar (CSV opcional)
+        self.resumen = False
+        self.resumen_csv = None
+        # Caché LRU de resultados del parser por cuerpo normalizado (0 = sin caché)
+        self.parse_cache_size = 50_000
+        # Monitor: cada cuántos segundos se registran las métricas (caché del parser, polling)
+        self.metricas_sec = 300
+        # Índice persistente de mensajes vistos del monitor (None = solo en memoria)
+        self.seen_index_path = "./wa_seen.sqlite3"
+        self.seen_cache_size = 100_000
+        self.seen_max_age_days = 30
+        # Sin índice persistente, usar huellas de 64 bits en lugar de un set de hashes hex
+        self.seen_compact = False
         self.author_roles_path = "./src/shared/author_roles.json"
@@ -0,0 +1,42 @@
+"""
+Path: src/shared/process_metrics.py
+"""
+
+import os
+
+def rss_arbol(pid: int | None = None) -> int | None:
+    """RSS en bytes del proceso `pid` (por defecto el actual) y todos sus descendientes.
+    Incluye el driver de Playwright y los procesos de Chromium. Solo Linux (/proc); None si no hay."""
+    pid = pid or os.getpid()
+    try:
+        hijos = {}
+        for entrada in os.listdir("/proc"):
+            if not entrada.isdigit():
+                continue
+            try:
+                with open(f"/proc/{entrada}/stat", encoding="utf-8") as f:
+                    # El nombre del proceso va entre paréntesis y puede contener espacios
+                    ppid = int(f.read().rsplit(")", 1)[1].split()[1])
+            except (OSError, ValueError, IndexError):
+                continue
+            hijos.setdefault(ppid, []).append(int(entrada))
+    except OSError:
+        return None
+    total = 0
+    pendientes = [pid]
+    while pendientes:
+        actual = pendientes.pop()
+        total += _rss_proceso(actual)
+        pendientes.extend(hijos.get(actual, ()))
+    return total
+
+def _rss_proceso(pid: int) -> int:
+    "VmRSS del proceso en bytes (0 si ya terminó)."
+    try:
+        with open(f"/proc/{pid}/status", encoding="utf-8") as f:
+            for linea in f:
+                if linea.startswith("VmRSS:"):
+                    return int(linea.split()[1]) * 1024
+    except (OSError, ValueError):
+        pass
+    return 0
@@ -0,0 +1,53 @@
+"""
+Path: src/shared/startup_profiler.py
+"""
+
+import time
+import logging
+
+# Fase con la que termina el arranque: al alcanzarla se imprime el desglose
+FASE_FINAL = "primer_mensaje"
+
+class StartupProfiler:
+    """Desglose del tiempo de arranque por fases (imports, config/roles, navegador, login,
+    open_chat, primer mensaje). Las marcas se registran siempre (solo la primera de cada fase);
+    el detalle se informa únicamente si el perfilado está activo."""
+    def __init__(self):
+        self.inicio = time.perf_counter()
+        self.activo = False
+        self.fases = []  # (fase, segundos desde la marca anterior)
+        self._ultima = self.inicio
+        self._reportado = False
+        self.logger = logging.getLogger("wa_reader.arranque")
+
+    def marcar(self, fase: str):
+        "Registra el fin de una fase; las marcas repetidas se ignoran."
+        if self._reportado or any(nombre == fase for nombre, _ in self.fases):
+            return
+        ahora = time.perf_counter()
+        self.fases.append((fase, ahora - self._ultima))
+        self._ultima = ahora
+        if self.activo:
+            self.logger.info("Arranque: %s en %.3f s (total %.3f s)",
+                             fase, self.fases[-1][1], ahora - self.inicio)
+            if fase == FASE_FINAL:
+                self.reportar()
+
+    def reportar(self):
+        "Imprime el desglose de fases (una sola vez)."
+        if not self.activo or self._reportado or not self.fases:
+            return
+        self._reportado = True
+        total = sum(segundos for _, segundos in self.fases)
+        print("\nPerfil de arranque")
+        print(f"{'fase':<16} {'segundos':>9} {'%':>6}")
+        for fase, segundos in self.fases:
+            print(f"{fase:<16} {segundos:>9.3f} {100 * segundos / total if total else 0:>6.1f}")
+        print(f"{'total':<16} {total:>9.3f}\n")
+
+# Instancia del proceso: el reloj arranca con el primer import de este módulo
+profiler = StartupProfiler()
+
+def marcar(fase: str):
+    "Registra el fin de una fase del arranque en el perfilador del proceso."
+    profiler.marcar(fase)
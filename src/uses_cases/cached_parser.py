@@ -0,0 +1,139 @@
+"""
+Path: src/uses_cases/cached_parser.py
+"""
+
+import re
+import logging
+from collections import OrderedDict
+
+from src.entities.interfaces import IMessageParser
+
+
+def firma_parser(parser) -> tuple:
+    """Identifica la estrategia y su juego de patrones: tipo de cada parser de la cadena
+    (parser, base_parser, ...) y sus expresiones regulares compiladas."""
+    partes = []
+    vistos = set()
+    pendientes = [parser]
+    while pendientes:
+        actual = pendientes.pop()
+        if id(actual) in vistos:
+            continue
+        vistos.add(id(actual))
+        atributos = vars(actual) if hasattr(actual, "__dict__") else {}
+        patrones = tuple(sorted(
+            (nombre, valor) for nombre, valor in atributos.items() if isinstance(valor, re.Pattern)
+        ))
+        partes.append((type(actual).__qualname__, patrones))
+        pendientes.extend(valor for valor in atributos.values()
+                          if hasattr(valor, "parse") and not isinstance(valor, type))
+    return tuple(partes)
+
+
+class CachedParser(IMessageParser):
+    """Caché LRU acotada de resultados del parser, por hash del cuerpo con los espacios normalizados.
+    Los mensajes repetidos ("ok", "listo", la misma línea de máquina cada turno) no vuelven
+    a pasar por las expresiones regulares. Se vacía sola si cambia la estrategia o sus patrones."""
+    def __init__(self, parser: IMessageParser, max_entradas: int = 50_000,
+                 verificar_cada: int = 1000):
+        self.parser = parser
+        self.max_entradas = max_entradas
+        # parse() individual: la firma se recalcula cada verificar_cada llamadas (parse_many, siempre)
+        self.verificar_cada = verificar_cada
+        self._desde_verificacion = 0
+        self.aciertos = 0
+        self.fallos = 0
+        self.desalojos = 0
+        self.logger = logging.getLogger("wa_reader.cached_parser")
+        self._cache = OrderedDict()
+        self._firma = hash(firma_parser(parser))
+
+    @staticmethod
+    def _clave(text: str) -> int:
+        "Hash del cuerpo con los espacios colapsados."
+        return hash(" ".join(text.split()))
+
+    def parse(self, text: str) -> dict:
+        self._desde_verificacion += 1
+        if self._desde_verificacion >= self.verificar_cada:
+            self._verificar_firma()
+        clave = self._clave(text)
+        resultado = self._cache.get(clave)
+        if resultado is not None:
+            self._cache.move_to_end(clave)
+            self.aciertos += 1
+            return dict(resultado)
+        self.fallos += 1
+        resultado = self.parser.parse(text)
+        self._guardar(clave, resultado)
+        return dict(resultado)
+
+    def parse_many(self, texts) -> list[dict]:
+        """Resuelve los aciertos desde la caché y parsea los fallos (sin repetidos) en un
+        solo parse_many del parser envuelto, que puede ser un ParallelParser."""
+        self._verificar_firma()
+        texts = list(texts)
+        claves = [self._clave(text) for text in texts]
+        resultados = [None] * len(texts)
+        faltantes = {}  # clave -> índice del primer texto con esa clave
+        for i, clave in enumerate(claves):
+            resultado = self._cache.get(clave)
+            if resultado is not None:
+                self._cache.move_to_end(clave)
+                self.aciertos += 1
+                resultados[i] = dict(resultado)
+            elif clave in faltantes:
+                self.aciertos += 1
+            else:
+                self.fallos += 1
+                faltantes[clave] = i
+        if faltantes:
+            nuevos = dict(zip(faltantes, self.parser.parse_many(
+                [texts[i] for i in faltantes.values()])))
+            for clave, resultado in nuevos.items():
+                self._guardar(clave, resultado)
+            for i, clave in enumerate(claves):
+                if resultados[i] is None:
+                    resultados[i] = dict(nuevos[clave])
+        return resultados
+
+    def _guardar(self, clave: int, resultado: dict):
+        "Agrega un resultado y descarta el menos usado si se supera max_entradas."
+        if self.max_entradas <= 0:
+            return
+        self._cache[clave] = dict(resultado)
+        if len(self._cache) > self.max_entradas:
+            self._cache.popitem(last=False)
+            self.desalojos += 1
+
+    def _verificar_firma(self):
+        "Vacía la caché si cambió la estrategia o alguno de sus patrones."
+        self._desde_verificacion = 0
+        firma = hash(firma_parser(self.parser))
+        if firma != self._firma:
+            self._firma = firma
+            self.invalidar()
+
+    def invalidar(self):
+        "Descarta todos los resultados guardados."
+        self._cache.clear()
+
+    def metricas(self) -> dict:
+        "Aciertos, fallos, tasa de aciertos, desalojos y entradas en caché."
+        total = self.aciertos + self.fallos
+        return {
+            "aciertos": self.aciertos,
+            "fallos": self.fallos,
+            "tasa_aciertos": self.aciertos / total if total else 0.0,
+            "desalojos": self.desalojos,
+            "entradas": len(self._cache),
+        }
+
+    def reportar(self):
+        "Registra las métricas en el log."
+        metricas = self.metricas()
+        self.logger.info(
+            "Caché del parser: %d aciertos, %d fallos (%.1f%% aciertos), %d desalojos, %d entradas.",
+            metricas["aciertos"], metricas["fallos"], metricas["tasa_aciertos"] * 100,
+            metricas["desalojos"], metricas["entradas"]
+        )
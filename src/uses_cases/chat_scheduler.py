@@ -0,0 +1,52 @@
+"""
+Path: src/uses_cases/chat_scheduler.py
+"""
+
+import math
+import time
+
+class ChatScheduler:
+    """Planifica la lectura de varios chats según su actividad reciente.
+    Cada chat lleva un conteo de mensajes con decaimiento exponencial (vida media `vida_media_sec`);
+    cuanto más activo, más corto su intervalo, entre `min_sec` y `max_sec`."""
+    def __init__(self, chats: list[str], min_sec: float = 2, max_sec: float = 60,
+                 vida_media_sec: float = 300, reloj=time.monotonic):
+        self.min_sec = min_sec
+        self.max_sec = max_sec
+        self._tau = vida_media_sec / math.log(2)
+        self._reloj = reloj
+        ahora = reloj()
+        # chat -> [conteo decaído, instante del conteo, próxima lectura, leído alguna vez]
+        self._estado = {chat: [0.0, ahora, ahora, False] for chat in chats}
+
+    @property
+    def chats(self) -> list[str]:
+        "Chats planificados."
+        return list(self._estado)
+
+    def siguiente(self) -> tuple[str, float]:
+        "Retorna el chat que toca leer y cuántos segundos faltan para su lectura."
+        chat = min(self._estado, key=lambda c: self._estado[c][2])
+        return chat, max(0.0, self._estado[chat][2] - self._reloj())
+
+    def registrar(self, chat: str, nuevos: int):
+        """Registra los mensajes nuevos de una lectura y reprograma el chat.
+        La primera lectura de cada chat trae el historial visible y no cuenta como actividad."""
+        estado = self._estado[chat]
+        ahora = self._reloj()
+        if not estado[3]:
+            estado[3] = True
+            nuevos = 0
+        estado[0] = estado[0] * math.exp(-(ahora - estado[1]) / self._tau) + nuevos
+        estado[1] = ahora
+        estado[2] = ahora + self.intervalo(chat)
+
+    def tasa(self, chat: str) -> float:
+        "Mensajes por minuto estimados para el chat."
+        conteo, instante, _proximo, _leido = self._estado[chat]
+        return conteo * math.exp(-(self._reloj() - instante) / self._tau) * 60 / self._tau
+
+    def intervalo(self, chat: str) -> float:
+        "Intervalo de lectura del chat según su actividad."
+        conteo = self._estado[chat][0]
+        return min(self.max_sec, max(self.min_sec, self.max_sec / (1 + conteo)))
@@ -6,35 +6,82 @@ import hashlib
 
 from src.entities.message_parser import MessageParser
 from src.entities.interfaces import IMessageProcessor
+from src.entities.records import IngestPayload
 
 
 class MessageProcessor(IMessageProcessor):
     "Procesador de mensajes de WhatsApp con soporte para estrategias"
-    def __init__(self, get_fecha_fn, parser_strategy=None):
-        "get_fecha_fn: función que retorna la fecha actual en formato string."
+    def __init__(self, get_fecha_fn, parser_strategy=None, seen_index=None):
+        """get_fecha_fn: función que retorna la fecha actual en formato string.
+        seen_index: índice de mensajes vistos (ISeenIndex); por defecto un set en memoria."""
         self.get_fecha_fn = get_fecha_fn
         # Permite inyectar una estrategia de análisis, por defecto usa MessageParser
         if parser_strategy is None:
             self.parser = MessageParser()
         else:
             self.parser = parser_strategy
-        self.seen_messages = set()
+        self.seen_messages = seen_index if seen_index is not None else set()
 
-    def process(self, message: dict) -> dict | None:
-        "Procesa un mensaje de WhatsApp."
-        key = hashlib.sha1((message["meta"] + "\n" + message["body"]).encode("utf-8")).hexdigest()
+    def process(self, message: dict, chat: str = "") -> IngestPayload | None:
+        """Procesa un mensaje de WhatsApp. Con varios chats, `chat` separa la deduplicación
+        de cada uno y queda en el payload."""
+        key = self._clave(message, chat)
         if key in self.seen_messages:
             return None
         self.seen_messages.add(key)
         parsed = self.parser.parse(message["body"])
         if not parsed:
             return None
-        return {
-            "fecha": self.get_fecha_fn(),
-            "maquina": parsed.get("maquina", ""),
-            "formato": parsed.get("formato", ""),
-            "cantidad": parsed.get("cantidad", 0),
-            "turno": parsed.get("turno", ""),
-            "personas": parsed.get("personas", ""),
-            "obs": parsed.get("obs", "")
-        }
+        return self._payload(parsed, self.get_fecha_fn(), chat)
+
+    def process_batch(self, messages, chat: str = "") -> list[IngestPayload | None]:
+        """Procesa un lote de mensajes. Deduplica todo el lote en un paso (contra lo ya visto
+        y dentro del mismo lote), parsea los nuevos con parse_many y retorna en orden,
+        con None para los descartados."""
+        messages = list(messages)
+        # Las claves se calculan antes de tocar el estado: un mensaje mal formado no deja el
+        # lote a medio registrar
+        keys = [self._clave(message, chat) for message in messages]
+        nuevos = []
+        vistos_lote = set()
+        for i, key in enumerate(keys):
+            if key in vistos_lote or key in self.seen_messages:
+                continue
+            vistos_lote.add(key)
+            nuevos.append(i)
+        resultados = [None] * len(messages)
+        if not nuevos:
+            return resultados
+        fecha = self.get_fecha_fn()
+        parsed_lote = self.parser.parse_many([messages[i]["body"] for i in nuevos])
+        # Se registran recién con el lote parseado: si parse_many falla, el reintento mensaje
+        # a mensaje no los toma como ya vistos
+        for i in nuevos:
+            self.seen_messages.add(keys[i])
+        for i, parsed in zip(nuevos, parsed_lote):
+            if parsed:
+                resultados[i] = self._payload(parsed, fecha, chat)
+        return resultados
+
+    @staticmethod
+    def _clave(message: dict, chat: str = "") -> str:
+        """Clave de deduplicación del mensaje (meta + cuerpo, precedidos por el chat si se indica).
+        Sin chat la clave es la de siempre: los índices de vistos ya guardados siguen valiendo."""
+        texto = message["meta"] + "\n" + message["body"]
+        if chat:
+            texto = chat + "\n" + texto
+        return hashlib.sha1(texto.encode("utf-8")).hexdigest()
+
+    @staticmethod
+    def _payload(parsed: dict, fecha: str, chat: str = "") -> IngestPayload:
+        "Arma el payload de ingesta a partir del resultado del parser."
+        return IngestPayload(
+            fecha,
+            maquina=parsed.get("maquina", ""),
+            formato=parsed.get("formato", ""),
+            cantidad=parsed.get("cantidad", 0),
+            turno=parsed.get("turno", ""),
+            personas=parsed.get("personas", ""),
+            obs=parsed.get("obs", ""),
+            chat=chat
+        )
@@ -0,0 +1,67 @@
+"""
+Path: src/uses_cases/parallel_parser.py
+"""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from src.entities.interfaces import IMessageParser
+
+# Parser de cada proceso worker (se recibe una sola vez al iniciar el pool)
+_parser_worker = None
+
+
+def _inicializar_worker(parser: IMessageParser):
+    "Guarda el parser en el proceso worker."
+    global _parser_worker  # pylint: disable=global-statement
+    _parser_worker = parser
+
+
+def _parsear_fragmento(texts: list[str]) -> list[dict]:
+    "Parsea un fragmento de mensajes dentro del worker."
+    return [_parser_worker.parse(text) for text in texts]
+
+
+class ParallelParser(IMessageParser):
+    """Reparte lotes grandes de mensajes entre procesos y retorna los resultados en orden.
+    Los lotes chicos (o workers <= 1) se parsean en el proceso actual."""
+    def __init__(self, parser: IMessageParser, workers: int | None = None, chunk_size: int = 2000):
+        self.parser = parser
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        self.chunk_size = chunk_size
+        self._executor = None
+
+    def parse(self, text: str) -> dict:
+        return self.parser.parse(text)
+
+    def parse_many(self, texts) -> list[dict]:
+        texts = list(texts)
+        if self.workers <= 1 or len(texts) <= self.chunk_size:
+            return self.parser.parse_many(texts)
+        fragmentos = [texts[i:i + self.chunk_size] for i in range(0, len(texts), self.chunk_size)]
+        resultados = []
+        for parte in self._pool().map(_parsear_fragmento, fragmentos):
+            resultados.extend(parte)
+        return resultados
+
+    def _pool(self) -> ProcessPoolExecutor:
+        "Crea el pool de procesos la primera vez que se necesita."
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_inicializar_worker,
+                initargs=(self.parser,)
+            )
+        return self._executor
+
+    def close(self):
+        "Detiene los procesos worker."
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
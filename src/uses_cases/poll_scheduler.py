@@ -0,0 +1,50 @@
+"""
+Path: src/uses_cases/poll_scheduler.py
+"""
+
+class PollScheduler:
+    """Intervalo de polling adaptativo.
+    Con mensajes nuevos vuelve a `min_sec`; en silencio crece por `factor` hasta `max_sec`.
+    Cerca de un cambio de turno (mañana/tarde/noche) el techo baja a `techo_turno_sec`."""
+    def __init__(self, min_sec: float = 2, max_sec: float = 60, factor: float = 2.0,
+                 turnos: dict | None = None, margen_turno_min: int = 30,
+                 techo_turno_sec: float | None = None):
+        self.min_sec = min_sec
+        self.max_sec = max_sec
+        self.factor = factor
+        # turno -> hora de inicio (0-23)
+        self.turnos = turnos or {}
+        self.margen_turno_min = margen_turno_min
+        self.techo_turno_sec = techo_turno_sec if techo_turno_sec is not None else min_sec
+        self.intervalo = min_sec
+        self.lecturas = 0
+        self.lecturas_vacias = 0
+
+    def registrar(self, nuevos: int, ahora=None) -> float:
+        "Registra el resultado de una lectura y retorna el próximo intervalo."
+        self.lecturas += 1
+        if nuevos:
+            self.intervalo = self.min_sec
+        else:
+            self.lecturas_vacias += 1
+            self.intervalo = min(self.max_sec, self.intervalo * self.factor)
+        if ahora is not None and self.turno_cercano(ahora):
+            self.intervalo = min(self.intervalo, self.techo_turno_sec)
+        return self.intervalo
+
+    def turno_cercano(self, ahora) -> str | None:
+        "Retorna el turno cuyo inicio está a menos de margen_turno_min minutos de `ahora`."
+        minuto = ahora.hour * 60 + ahora.minute
+        for turno, hora in self.turnos.items():
+            distancia = abs(minuto - hora * 60) % (24 * 60)
+            if min(distancia, 24 * 60 - distancia) <= self.margen_turno_min:
+                return turno
+        return None
+
+    def metricas(self) -> dict:
+        "Intervalo actual y contadores de lecturas."
+        return {
+            "intervalo_sec": self.intervalo,
+            "lecturas": self.lecturas,
+            "lecturas_vacias": self.lecturas_vacias,
+        }
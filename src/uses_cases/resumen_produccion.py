@@ -0,0 +1,112 @@
+"""
+Path: src/uses_cases/resumen_produccion.py
+"""
+
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Columnas categóricas (código entero + diccionario de valores) y numéricas del resumen
+CATEGORICAS = ("dia", "maquina", "formato", "turno")
+COLUMNAS_RESUMEN = ("dia", "maquina", "turno", "cantidad", "mensajes", "persona_turnos")
+
+
+def dia_iso(fecha: str) -> str:
+    "Convierte la fecha del meta de WhatsApp (d/m/aaaa) a AAAA-MM-DD; si no puede, la deja igual."
+    partes = fecha.split("/")
+    if len(partes) == 3 and all(p.isdigit() for p in partes):
+        dia, mes, anio = (int(p) for p in partes)
+        if anio < 100:
+            anio += 2000
+        return f"{anio:04d}-{mes:02d}-{dia:02d}"
+    return fecha
+
+
+class ResumenProduccion:
+    """Payloads parseados guardados por columnas: maquina, formato, turno y día como códigos
+    categóricos en arrays compactos, cantidad y personas como enteros. Los totales por
+    grupo se calculan vectorizados con NumPy (o con un recorrido en Python si no está)."""
+    def __init__(self):
+        self._valores = {col: [] for col in CATEGORICAS}
+        self._codigos = {col: {} for col in CATEGORICAS}
+        self._columnas = {col: array("i") for col in CATEGORICAS}
+        self._cantidad = array("q")
+        self._personas = array("i")
+        # Fecha cruda del meta -> código de día (evita convertir la misma fecha en cada mensaje)
+        self._dias_crudos = {}
+
+    def __len__(self) -> int:
+        return len(self._cantidad)
+
+    def _codigo(self, columna: str, valor) -> int:
+        "Código categórico del valor (lo agrega al diccionario si es nuevo)."
+        valor = valor or "s/d"
+        codigos = self._codigos[columna]
+        codigo = codigos.get(valor)
+        if codigo is None:
+            codigo = codigos[valor] = len(codigos)
+            self._valores[columna].append(valor)
+        return codigo
+
+    def agregar(self, payload: dict, dia: str = ""):
+        "Agrega un payload; `dia` es la fecha del mensaje (del meta) y si falta se usa la del payload."
+        dia = dia or payload.get("fecha") or ""
+        codigo_dia = self._dias_crudos.get(dia)
+        if codigo_dia is None:
+            codigo_dia = self._dias_crudos[dia] = self._codigo("dia", dia_iso(dia))
+        self._columnas["dia"].append(codigo_dia)
+        self._columnas["maquina"].append(self._codigo("maquina", payload.get("maquina")))
+        self._columnas["formato"].append(self._codigo("formato", payload.get("formato")))
+        self._columnas["turno"].append(self._codigo("turno", payload.get("turno")))
+        self._cantidad.append(int(payload.get("cantidad") or 0))
+        self._personas.append(int(payload.get("personas") or 0))
+
+    def agrupar(self, por: tuple = ("dia", "maquina", "turno")) -> list[tuple]:
+        """Totales por grupo: (valores de `por`..., cantidad total, mensajes, persona-turnos),
+        ordenados por los valores del grupo."""
+        if not len(self):
+            return []
+        if np is not None:
+            filas = self._agrupar_numpy(por)
+        else:
+            filas = self._agrupar_python(por)
+        return sorted(filas, key=lambda fila: tuple(str(v) for v in fila[:len(por)]))
+
+    def _agrupar_numpy(self, por: tuple) -> list[tuple]:
+        "Group-by vectorizado: una clave entera por grupo y bincount con pesos."
+        clave = np.zeros(len(self), dtype=np.int64)
+        for columna in por:
+            clave = clave * len(self._valores[columna]) + np.frombuffer(self._columnas[columna],
+                                                                        dtype=np.int32)
+        grupos, inversa = np.unique(clave, return_inverse=True)
+        cantidad = np.bincount(inversa, weights=np.frombuffer(self._cantidad, dtype=np.int64))
+        mensajes = np.bincount(inversa)
+        personas = np.bincount(inversa, weights=np.frombuffer(self._personas, dtype=np.int32))
+        filas = []
+        for i, grupo in enumerate(grupos.tolist()):
+            valores = []
+            for columna in reversed(por):
+                grupo, codigo = divmod(grupo, len(self._valores[columna]))
+                valores.append(self._valores[columna][codigo])
+            filas.append((*reversed(valores), int(cantidad[i]), int(mensajes[i]), int(personas[i])))
+        return filas
+
+    def _agrupar_python(self, por: tuple) -> list[tuple]:
+        "Group-by sin NumPy: acumula por tupla de códigos."
+        totales = {}
+        codigos = zip(*(self._columnas[columna] for columna in por))
+        for clave, cantidad, personas in zip(codigos, self._cantidad, self._personas):
+            acumulado = totales.get(clave)
+            if acumulado is None:
+                totales[clave] = [cantidad, 1, personas]
+            else:
+                acumulado[0] += cantidad
+                acumulado[1] += 1
+                acumulado[2] += personas
+        return [
+            (*(self._valores[columna][codigo] for columna, codigo in zip(por, clave)), *totales_grupo)
+            for clave, totales_grupo in totales.items()
+        ]
@@ -0,0 +1,91 @@
+"""
+Path: tests/test_async_ingest_service.py
+"""
+import gzip
+import json
+import unittest
+
+try:
+    from src.interface_adapters.gateways.async_ingest_service import AsyncIngestService
+except ImportError:
+    AsyncIngestService = None
+
+from src.entities.records import IngestPayload
+
+class RespuestaAsync:
+    "Respuesta HTTP falsa usable con async with"
+    def __init__(self, texto: str, status: int = 200):
+        self.texto = texto
+        self.status = status
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise ConnectionError(f"HTTP {self.status}")
+
+    async def text(self) -> str:
+        return self.texto
+
+class SesionAsyncFalsa:
+    "Sesión que registra cada POST y responde un id por payload"
+    def __init__(self, status: int = 200):
+        self.posts = []
+        self.status = status
+
+    def post(self, url, **kwargs):
+        post = {"url": url, "json": kwargs.get("json"), "data": kwargs.get("data"),
+                "headers": kwargs.get("headers") or {}}
+        self.posts.append(post)
+        if post["json"] is not None:
+            return RespuestaAsync(str(len(self.posts)), self.status)
+        cuerpo = post["data"]
+        if post["headers"].get("Content-Encoding") == "gzip":
+            cuerpo = gzip.decompress(cuerpo)
+        return RespuestaAsync(json.dumps([{"id": i} for i, _p in enumerate(json.loads(cuerpo))]),
+                              self.status)
+
+@unittest.skipIf(AsyncIngestService is None, "aiohttp no instalado")
+class TestAsyncIngestService(unittest.IsolatedAsyncioTestCase):
+    "Pruebas para el envío asíncrono de a uno y en bloque"
+    def setUp(self):
+        self.payloads = [IngestPayload("2025-08-11", "Bolsas", "", i, "mañana", 1, "")
+                         for i in range(5)]
+
+    def servicio(self, sesion, **kwargs):
+        servicio = AsyncIngestService("http://x/ingest", **kwargs)
+        servicio.session = sesion
+        return servicio
+
+    async def test_sin_batch_endpoint_un_post_por_payload(self):
+        "Sin endpoint de lote se hace un POST por payload y los estados conservan el orden"
+        sesion = SesionAsyncFalsa()
+        estados = await self.servicio(sesion).send_many(self.payloads)
+        self.assertEqual(estados, ["1", "2", "3", "4", "5"])
+        self.assertEqual([p["json"]["cantidad"] for p in sesion.posts], [0, 1, 2, 3, 4])
+
+    async def test_batch_endpoint_agrupa_y_comprime(self):
+        "Con endpoint de lote se envían arrays de hasta batch_size, comprimidos si se pide"
+        sesion = SesionAsyncFalsa()
+        servicio = self.servicio(sesion, batch_endpoint="http://x/batch", batch_size=2,
+                                 compress=True)
+        estados = await servicio.send_many(self.payloads)
+        self.assertEqual(estados, ["0", "1", "0", "1", "0"])
+        self.assertEqual(len(sesion.posts), 3)
+        primero = json.loads(gzip.decompress(sesion.posts[0]["data"]))
+        self.assertEqual([p["cantidad"] for p in primero], [0, 1])
+
+    async def test_error_http_por_payload(self):
+        "Un error HTTP se informa como error para cada payload del lote"
+        servicio = self.servicio(SesionAsyncFalsa(status=503), batch_endpoint="http://x/batch")
+        estados = await servicio.send_many(self.payloads[:2])
+        self.assertEqual(estados, ["Error: HTTP 503"] * 2)
+        estados = await self.servicio(SesionAsyncFalsa(status=503)).send_many(self.payloads[:2])
+        self.assertTrue(all(e.startswith("Error") for e in estados))
+
+if __name__ == "__main__":
+    unittest.main()
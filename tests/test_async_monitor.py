@@ -0,0 +1,170 @@
+"""
+Path: tests/test_async_monitor.py
+"""
+import asyncio
+import unittest
+from datetime import timezone
+
+try:
+    from src.application.async_whatsapp_monitor import AsyncWhatsAppMonitor
+except ImportError:
+    AsyncWhatsAppMonitor = None
+
+from src.entities.async_ingest_service_interface import IAsyncIngestService
+from src.entities.async_whatsapp_client_interface import IAsyncWhatsAppClient
+from src.entities.message_parser import MessageParser
+from src.entities.records import a_dict
+from src.entities.strategies import ObservacionTareaStrategy
+from src.uses_cases.message_processor import MessageProcessor
+
+def mensajes(chat: str, cantidad: int) -> list[dict]:
+    "Mensajes de producción distintos, con cantidades 100, 200, ..."
+    return [{"meta": f"[10:{i:02d}, 11/8/2025] {chat}: ",
+             "body": f"maquina de bolsas hicimos {(i + 1) * 100} bolsas"}
+            for i in range(cantidad)]
+
+class ConfigFalsa:
+    "Lo mínimo de AppConfig que usa el monitor, con intervalos cortos"
+    chat_name = "Producción"
+    poll_min_sec = 0.001
+    poll_max_sec = 0.002
+    poll_backoff = 2.0
+    poll_turnos = {}
+    poll_margen_turno_min = 30
+    poll_sec = 0.001
+    metricas_sec = 3600
+    ingest_queue_size = 100
+    ingest_workers = 1
+    ingest_batch_size = 3
+    tz_local = timezone.utc
+
+class ClienteEnMemoria(IAsyncWhatsAppClient):
+    """Cliente asíncrono que entrega cada chat de a `lote` mensajes.
+    `agotado` se activa cuando todos los chats fueron leídos por completo."""
+    def __init__(self, chats: dict, lote: int = 2, fallas: int = 0):
+        self.chats = {chat: list(messages) for chat, messages in chats.items()}
+        self.lote = lote
+        self.fallas = fallas
+        self.leidos = dict.fromkeys(self.chats, 0)
+        self.abiertos = []
+        self.agotado = asyncio.Event()
+
+    async def initialize(self, login_timeout: int = 120):
+        "No hay navegador que iniciar."
+
+    async def open_chat(self, chat_name: str):
+        self.abiertos.append(chat_name)
+
+    async def get_messages(self, chat_name: str) -> list[dict]:
+        return list(self.chats[chat_name])
+
+    async def get_new_messages(self, chat_name: str) -> list[dict]:
+        if self.fallas:
+            self.fallas -= 1
+            raise RuntimeError("chat no encontrado")
+        inicio = self.leidos[chat_name]
+        nuevos = self.chats[chat_name][inicio:inicio + self.lote]
+        self.leidos[chat_name] += len(nuevos)
+        if all(self.leidos[chat] == len(m) for chat, m in self.chats.items()):
+            self.agotado.set()
+        return nuevos
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+class IngestaRegistrada(IAsyncIngestService):
+    "Ingesta asíncrona que guarda cada lote recibido, con una demora opcional por lote"
+    def __init__(self, demora: float = 0, falla: bool = False):
+        self.lotes = []
+        self.demora = demora
+        self.falla = falla
+
+    async def send(self, payload: dict) -> str:
+        return (await self.send_many([payload]))[0]
+
+    async def send_many(self, payloads) -> list[str]:
+        await asyncio.sleep(self.demora)
+        if self.falla:
+            raise ConnectionError("servidor caído")
+        self.lotes.append([a_dict(payload) for payload in payloads])
+        return [str(i) for i in range(len(payloads))]
+
+    @property
+    def enviados(self) -> list[dict]:
+        return [payload for lote in self.lotes for payload in lote]
+
+@unittest.skipIf(AsyncWhatsAppMonitor is None, "dependencias de AppConfig no instaladas")
+class TestAsyncWhatsAppMonitor(unittest.IsolatedAsyncioTestCase):
+    "Pruebas para la cola entre lectura y envío del monitor asíncrono"
+    def monitor(self, cliente, ingesta, chats=None):
+        processor = MessageProcessor(lambda: "2025-08-11",
+                                     parser_strategy=ObservacionTareaStrategy(MessageParser()))
+        return AsyncWhatsAppMonitor(ConfigFalsa(), ingesta, cliente, processor, chats)
+
+    async def test_enviar_agrupa_hasta_batch_size(self):
+        "Toma de la cola lotes de hasta ingest_batch_size y marca cada payload como hecho"
+        ingesta = IngestaRegistrada()
+        monitor = self.monitor(ClienteEnMemoria({}), ingesta)
+        cola = asyncio.Queue()
+        for i in range(7):
+            cola.put_nowait({"cantidad": i})
+        envio = asyncio.create_task(monitor._enviar(cola))
+        try:
+            await asyncio.wait_for(cola.join(), timeout=5)
+        finally:
+            envio.cancel()
+        self.assertEqual([len(lote) for lote in ingesta.lotes], [3, 3, 1])
+        self.assertEqual([p["cantidad"] for p in ingesta.enviados], list(range(7)))
+
+    async def test_enviar_con_error_libera_la_cola(self):
+        "Si send_many falla los payloads se registran como error y la cola no queda trabada"
+        monitor = self.monitor(ClienteEnMemoria({}), IngestaRegistrada(falla=True))
+        cola = asyncio.Queue()
+        for i in range(4):
+            cola.put_nowait({"cantidad": i})
+        envio = asyncio.create_task(monitor._enviar(cola))
+        try:
+            with self.assertLogs("wa_reader.async_monitor", "WARNING") as logs:
+                await asyncio.wait_for(cola.join(), timeout=5)
+        finally:
+            envio.cancel()
+        self.assertEqual(len(logs.records), 4)
+
+    async def test_vigilar_encola_los_payloads_del_chat(self):
+        "Cada lectura se procesa y sus payloads entran a la cola en orden; un error no corta"
+        cliente = ClienteEnMemoria({"Producción": mensajes("A", 5)}, fallas=1)
+        monitor = self.monitor(cliente, IngestaRegistrada())
+        cola = asyncio.Queue()
+        with self.assertLogs("wa_reader.async_monitor", "ERROR"):
+            lectura = asyncio.create_task(monitor._vigilar(cliente, "Producción", cola))
+            try:
+                await asyncio.wait_for(cliente.agotado.wait(), timeout=5)
+            finally:
+                lectura.cancel()
+        payloads = [cola.get_nowait() for _ in range(cola.qsize())]
+        self.assertEqual([p["cantidad"] for p in payloads], [100, 200, 300, 400, 500])
+        self.assertEqual({p["chat"] for p in payloads}, {""})
+
+    async def test_run_vacia_la_cola_al_salir(self):
+        "Al cancelar el monitor se envía todo lo encolado antes de terminar"
+        chats = {"Bolsas": mensajes("A", 9), "Manijas": mensajes("B", 6)}
+        cliente = ClienteEnMemoria(chats)
+        ingesta = IngestaRegistrada(demora=0.05)
+        monitor = self.monitor(cliente, ingesta, list(chats))
+        tarea = asyncio.create_task(monitor.run())
+        await asyncio.wait_for(cliente.agotado.wait(), timeout=5)
+        self.assertLess(len(ingesta.enviados), 15)
+        tarea.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await asyncio.wait_for(tarea, timeout=5)
+        self.assertEqual(cliente.abiertos, ["Bolsas", "Manijas"])
+        self.assertTrue(all(len(lote) <= 3 for lote in ingesta.lotes))
+        for chat, messages in chats.items():
+            enviados = [p["cantidad"] for p in ingesta.enviados if p["chat"] == chat]
+            self.assertEqual(enviados, [(i + 1) * 100 for i in range(len(messages))])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,73 @@
+"""
+Path: tests/test_async_whatsapp_client.py
+"""
+import unittest
+
+try:
+    from playwright.async_api import Error
+    from src.interface_adapters.gateways.async_whatsapp_client import AsyncWhatsAppClient
+except ImportError:
+    AsyncWhatsAppClient = None
+
+def burbuja(chat: str, i: int) -> dict:
+    return {"id": f"{chat}-{i}", "meta": f"[10:{i:02d}, 11/8/2025] A: ", "body": f" {chat} {i} "}
+
+class PaginaFalsa:
+    """Página que devuelve las burbujas del chat abierto y registra el ancla recibida.
+    `fallas` lecturas seguidas lanzan Error como un re-render de WhatsApp Web."""
+    def __init__(self, burbujas: dict):
+        self.burbujas = burbujas
+        self.chat = None
+        self.anclas = []
+        self.fallas = 0
+
+    async def eval_on_selector_all(self, selector, script, arg=None):
+        if self.fallas:
+            self.fallas -= 1
+            raise Error("Execution context was destroyed")
+        self.anclas.append((self.chat, arg))
+        return {"items": self.burbujas[self.chat]}
+
+@unittest.skipIf(AsyncWhatsAppClient is None, "playwright no instalado")
+class TestAsyncWhatsAppClientAnclas(unittest.IsolatedAsyncioTestCase):
+    "Pruebas para el ancla de lectura por chat del cliente asíncrono"
+    def setUp(self):
+        self.pagina = PaginaFalsa({"Bolsas": [burbuja("Bolsas", 1), burbuja("Bolsas", 2)],
+                                   "Manijas": [burbuja("Manijas", 1)]})
+        self.cliente = AsyncWhatsAppClient(user_data_dir="")
+        self.cliente.page = self.pagina
+
+        async def buscar_y_abrir(chat_name, timeout_ms=5000):
+            self.pagina.chat = chat_name
+            return True
+        self.cliente._buscar_y_abrir = buscar_y_abrir
+
+    async def test_ancla_independiente_por_chat(self):
+        "Cada chat lee desde su propia última burbuja, aunque se alternen"
+        self.assertEqual(len(await self.cliente.get_new_messages("Bolsas")), 2)
+        await self.cliente.get_new_messages("Manijas")
+        self.pagina.burbujas["Bolsas"] = []
+        self.assertEqual(await self.cliente.get_new_messages("Bolsas"), [])
+        await self.cliente.get_new_messages("Manijas")
+        self.assertEqual(self.pagina.anclas, [
+            ("Bolsas", None),
+            ("Manijas", None),
+            ("Bolsas", {"id": "Bolsas-2", "firma": "[10:02, 11/8/2025] A: \nBolsas 2"}),
+            ("Manijas", {"id": "Manijas-1", "firma": "[10:01, 11/8/2025] A: \nManijas 1"}),
+        ])
+        # Sin burbujas nuevas el ancla se conserva
+        await self.cliente.get_new_messages("Bolsas")
+        self.assertEqual(self.pagina.anclas[-1][1]["id"], "Bolsas-2")
+
+    async def test_error_de_playwright_no_mueve_el_ancla(self):
+        "Un Error durante la lectura retorna [] y la próxima lectura usa la misma ancla"
+        await self.cliente.get_new_messages("Bolsas")
+        self.pagina.fallas = 1
+        with self.assertLogs("wa_reader.async_whatsapp_client", "WARNING"):
+            self.assertEqual(await self.cliente.get_new_messages("Bolsas"), [])
+        mensajes = await self.cliente.get_new_messages("Bolsas")
+        self.assertEqual(mensajes[-1]["body"], "Bolsas 2")
+        self.assertEqual(self.pagina.anclas[-1][1]["id"], "Bolsas-2")
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+"""
+Path: tests/test_benchmark_suite.py
+"""
+import os
+import tempfile
+import unittest
+
+from benchmarks import linea_base
+from benchmarks.corpus import generar_chat
+from benchmarks.fakes import FakeIngestService, FakeWhatsAppClient
+from src.entities.meta_parser import MetaParser
+
+class TestBenchmarkSuite(unittest.TestCase):
+    "Pruebas para el corpus, los gateways en memoria y las líneas base de la suite"
+    def test_chat_reproducible(self):
+        "El chat sintético es el mismo con la misma semilla y sus metas se parsean"
+        chat = generar_chat(200, semilla=7)
+        self.assertEqual(chat, generar_chat(200, semilla=7))
+        self.assertNotEqual(chat, generar_chat(200, semilla=8))
+        for msg in chat:
+            meta = MetaParser().parse(msg.meta)
+            self.assertRegex(meta["fecha"], r"^\d{1,2}/8/2025$")
+            self.assertTrue(meta["autor"])
+
+    def test_fake_client(self):
+        "Lecturas incrementales por lote e historial del más nuevo al más viejo"
+        chat = generar_chat(120)
+        cliente = FakeWhatsAppClient(chat, lote=50)
+        self.assertEqual([len(cliente.get_new_messages()) for _ in range(4)], [50, 50, 20, 0])
+        lotes = list(cliente.iter_history())
+        self.assertEqual(lotes[0], chat[-50:])
+        self.assertEqual(sum(lotes[::-1], []), chat)
+        with self.assertRaises(KeyboardInterrupt):
+            cliente.wait_for_messages(1)
+
+    def test_fake_ingest(self):
+        "Serializa los payloads y responde un id por payload"
+        ingesta = FakeIngestService()
+        self.assertEqual(ingesta.send({"fecha": "x"}), "1")
+        self.assertEqual(ingesta.send_many([{"fecha": "y"}, {"fecha": "z"}]), ["2", "3"])
+        self.assertEqual(len(ingesta.enviados), 3)
+
+    def test_regresiones(self):
+        "Solo se informan los casos que empeoran más que el umbral"
+        base = {"parse": 10.0, "dedup": 2.0, "nuevo": None}
+        actual = {"parse": 12.0, "dedup": 3.0, "otro": 5.0}
+        self.assertEqual([r[0] for r in linea_base.comparar(actual, base, umbral=0.25)], ["dedup"])
+        self.assertEqual(linea_base.comparar(actual, base, umbral=0.1)[0][0], "parse")
+
+    def test_guardar_y_cargar(self):
+        "La línea base se guarda en JSON y se vuelve a leer igual"
+        with tempfile.TemporaryDirectory() as tmp:
+            ruta = os.path.join(tmp, "baselines", "suite.json")
+            self.assertIsNone(linea_base.cargar(ruta))
+            linea_base.guardar({"parse": 19.13}, ruta)
+            self.assertEqual(linea_base.cargar(ruta), {"parse": 19.13})
+
+if __name__ == "__main__":
+    unittest.main()
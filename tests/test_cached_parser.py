@@ -0,0 +1,54 @@
+"""
+Path: tests/test_cached_parser.py
+"""
+import re
+import unittest
+
+from src.entities.message_parser import MessageParser
+from src.entities.strategies import ObservacionTareaStrategy
+from src.uses_cases.cached_parser import CachedParser
+
+class TestCachedParser(unittest.TestCase):
+    "Pruebas para la caché de resultados del parser"
+    def setUp(self):
+        self.estrategia = ObservacionTareaStrategy(MessageParser())
+        self.parser = CachedParser(self.estrategia, max_entradas=3)
+
+    def test_mismo_resultado_que_sin_cache(self):
+        "Los resultados con caché coinciden con los del parser envuelto"
+        textos = ["listo", "maquina 3 formato 22x10x30 hicimos 6.800 bolsas turno tarde",
+                  "listo", "  listo ", "hay que cambiar la bobina", "ok"]
+        self.assertEqual(self.parser.parse_many(textos),
+                         [self.estrategia.parse(t) for t in textos])
+        self.assertEqual(self.parser.parse("ok"), self.estrategia.parse("ok"))
+
+    def test_contadores(self):
+        "Los repetidos (aun con otros espacios) cuentan como aciertos"
+        self.parser.parse_many(["ok", "listo", "ok"])
+        self.parser.parse("listo  ")
+        metricas = self.parser.metricas()
+        self.assertEqual((metricas["aciertos"], metricas["fallos"]), (2, 2))
+
+    def test_lru_acotada(self):
+        "La caché no supera max_entradas"
+        self.parser.parse_many(["a", "b", "c", "d", "e"])
+        self.assertEqual(self.parser.metricas()["entradas"], 3)
+        self.assertEqual(self.parser.metricas()["desalojos"], 2)
+        with self.assertLogs("wa_reader.cached_parser", level="INFO") as logs:
+            self.parser.reportar()
+        self.assertIn("2 desalojos, 3 entradas", logs.output[0])
+
+    def test_resultado_no_compartido(self):
+        "Modificar un resultado no altera la caché"
+        self.parser.parse("listo")["obs"] = "otro"
+        self.assertEqual(self.parser.parse("listo"), self.estrategia.parse("listo"))
+
+    def test_invalida_si_cambian_los_patrones(self):
+        "Un cambio en los patrones del parser base vacía la caché"
+        self.parser.parse_many(["turno tarde"])
+        self.estrategia.base_parser.p_turno = re.compile(r"turno\s+(tarde)", re.I)
+        self.parser.parse_many(["turno tarde"])
+        self.assertEqual(self.parser.metricas()["fallos"], 2)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+"""
+Path: tests/test_chat_scheduler.py
+"""
+import unittest
+
+from src.uses_cases.chat_scheduler import ChatScheduler
+
+class RelojFalso:
+    "Reloj manual para las pruebas"
+    def __init__(self):
+        self.ahora = 0.0
+
+    def __call__(self):
+        return self.ahora
+
+class TestChatScheduler(unittest.TestCase):
+    "Pruebas para el planificador de chats por actividad"
+    def setUp(self):
+        self.reloj = RelojFalso()
+        self.scheduler = ChatScheduler(["a", "b"], min_sec=2, max_sec=60,
+                                       vida_media_sec=300, reloj=self.reloj)
+
+    def test_primera_lectura_no_cuenta(self):
+        "El historial visible de la primera lectura no acelera el chat"
+        self.scheduler.registrar("a", 50)
+        self.assertEqual(self.scheduler.intervalo("a"), 60)
+
+    def test_chat_activo_se_lee_mas_seguido(self):
+        "Un chat con mensajes nuevos se reprograma antes que uno inactivo"
+        self.scheduler.registrar("a", 0)
+        self.scheduler.registrar("b", 0)
+        self.reloj.ahora = 60
+        self.scheduler.registrar("a", 9)
+        self.scheduler.registrar("b", 0)
+        self.assertLess(self.scheduler.intervalo("a"), self.scheduler.intervalo("b"))
+        self.assertGreaterEqual(self.scheduler.intervalo("a"), 2)
+        chat, _espera = self.scheduler.siguiente()
+        self.assertEqual(chat, "a")
+
+    def test_actividad_decae(self):
+        "Sin mensajes nuevos la tasa estimada decae con la vida media"
+        self.scheduler.registrar("a", 0)
+        self.scheduler.registrar("a", 10)
+        tasa = self.scheduler.tasa("a")
+        self.reloj.ahora = 300
+        self.assertAlmostEqual(self.scheduler.tasa("a"), tasa / 2)
+
+    def test_siguiente_informa_espera(self):
+        "siguiente() devuelve cuánto falta para la próxima lectura"
+        self.scheduler.registrar("a", 0)
+        self.scheduler.registrar("b", 0)
+        self.reloj.ahora = 20
+        chat, espera = self.scheduler.siguiente()
+        self.assertEqual(chat, "a")
+        self.assertAlmostEqual(espera, 40)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,21 @@
+"""
+Path: tests/test_chat_selectors.py
+"""
+import unittest
+
+from src.interface_adapters.gateways.chat_selectors import cadena_css, selector_encabezado, selector_titulo
+
+class TestChatSelectors(unittest.TestCase):
+    "Pruebas para los selectores CSS por nombre de chat"
+    def test_nombre_con_acentos(self):
+        "Los caracteres no ASCII van literales, sin escapes \\uXXXX que CSS no interpreta"
+        self.assertEqual(selector_titulo("Producción Ñandú 🏭"), 'span[title="Producción Ñandú 🏭"]')
+        self.assertEqual(selector_encabezado("Producción"), '#main header span[title="Producción"]')
+
+    def test_escapes(self):
+        "Se escapan comillas, barras invertidas y saltos de línea"
+        self.assertEqual(cadena_css('Turno "A" \\ B'), '"Turno \\"A\\" \\\\ B"')
+        self.assertEqual(cadena_css("a\nb"), '"a\\a b"')
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,91 @@
+"""
+Path: tests/test_export_chat_client.py
+"""
+import os
+import tempfile
+import unittest
+from datetime import date
+
+from src.entities.meta_parser import MetaParser
+from src.interface_adapters.gateways.export_chat_client import ExportChatClient
+
+ANDROID = (
+    "\ufeff11/8/25, 13:47 - Los mensajes y las llamadas están cifrados de extremo a extremo.\n"
+    "11/8/25, 13:47 - Mariano Montenegro Madygraf: Maquina de bolsas 22x10x30\n"
+    "hicimos 6.800 bolsas\n"
+    "11/8/25, 14:02 - Nico Malo Mady: ok\n"
+)
+
+IOS = (
+    "[11/8/25, 1:47:03 p. m.] Operadores de bolsa: \u200eCreaste el grupo\n"
+    "[11/8/25, 1:48:10 p. m.] Cele Mady 2: turno tarde con 3 personas\n"
+)
+
+class TestExportChatClient(unittest.TestCase):
+    "Pruebas para la lectura de chats exportados"
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _leer(self, contenido: str, nombre: str = "chat.txt") -> list[dict]:
+        path = os.path.join(self.tmp.name, nombre)
+        with open(path, "w", encoding="utf-8") as f:
+            f.write(contenido)
+        with ExportChatClient(path) as client:
+            client.initialize()
+            client.open_chat("Operadores de bolsa")
+            return client.get_messages()
+
+    def test_android_multilinea_y_avisos(self):
+        "Une las líneas de continuación y descarta avisos del sistema"
+        messages = self._leer(ANDROID)
+        self.assertEqual(len(messages), 2)
+        self.assertEqual(messages[0]["body"], "Maquina de bolsas 22x10x30\nhicimos 6.800 bolsas")
+        meta = MetaParser().parse(messages[0]["meta"])
+        self.assertEqual(meta["fecha"], "11/8/2025")
+        self.assertEqual(meta["autor"], "Mariano Montenegro Madygraf")
+
+    def test_ios(self):
+        "Interpreta el formato de iOS con hora de 12 horas"
+        messages = self._leer(IOS)
+        self.assertEqual(len(messages), 2)
+        self.assertEqual(MetaParser().parse(messages[1]["meta"])["autor"], "Cele Mady 2")
+        self.assertEqual(messages[1]["body"], "turno tarde con 3 personas")
+
+    def test_directorio_por_nombre_de_chat(self):
+        "Encuentra el archivo exportado dentro de un directorio"
+        self._leer(ANDROID, "Chat de WhatsApp con Operadores de bolsa.txt")
+        with ExportChatClient(self.tmp.name) as client:
+            client.open_chat("Operadores de bolsa")
+            self.assertEqual(len(client.get_messages()), 2)
+
+    def _historial(self, contenido: str, lote: int = 2, **kwargs) -> list[list]:
+        path = os.path.join(self.tmp.name, "chat.txt")
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            f.write(contenido)
+        with ExportChatClient(path, lote=lote) as client:
+            client.open_chat("Operadores de bolsa")
+            return list(client.iter_history(**kwargs))
+
+    def test_historial_por_lotes_desde_el_final(self):
+        "Lotes del más nuevo al más viejo, cada uno en orden cronológico, con multilínea y CRLF"
+        contenido = ANDROID + "12/8/25, 09:00 - Ana: listo\n\n13/8/25, 10:00 - Juan: turno\nnoche"
+        esperado = self._leer(contenido)
+        self.assertEqual(len(esperado), 4)
+        lotes = self._historial(contenido)
+        self.assertEqual(lotes, [esperado[2:], esperado[:2]])
+        self.assertEqual(self._historial(contenido.replace("\n", "\r\n")), lotes)
+        self.assertEqual(lotes[0][0]["body"], "listo\n")
+
+    def test_historial_hasta_y_maximo(self):
+        "Se detiene en mensajes anteriores a `hasta` o al alcanzar max_mensajes"
+        contenido = ANDROID + "12/8/25, 09:00 - Ana: listo\n13/8/25, 10:00 - Juan: ok\n"
+        esperado = self._leer(contenido)
+        self.assertEqual(self._historial(contenido, lote=10, hasta=date(2025, 8, 12)), [esperado[2:]])
+        self.assertEqual(self._historial(contenido, lote=10, max_mensajes=3), [esperado[1:]])
+        self.assertEqual(self._historial(contenido, max_mensajes=0), [])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+"""
+Path: tests/test_historial_presenter.py
+"""
+import io
+import unittest
+
+try:
+    from wcwidth import wcswidth
+except ImportError:
+    wcswidth = None
+
+from src.entities.meta_parser import MetaParser
+from src.interface_adapters.presenters.historial_presenter import HistorialPresenter, ajustar
+
+class TestAjustar(unittest.TestCase):
+    "Pruebas para el ajuste de celdas por ancho visual"
+    def test_ascii(self):
+        "En ASCII se rellena o trunca por cantidad de caracteres"
+        self.assertEqual(ajustar("hola", 6), "hola  ")
+        self.assertEqual(ajustar("x" * 10, 8), "xxxxx...")
+        self.assertEqual(ajustar(None, 3), "   ")
+
+    @unittest.skipIf(wcswidth is None, "wcwidth no instalado")
+    def test_ancho_visual(self):
+        "Emojis y caracteres anchos cuentan dos columnas; el resultado siempre mide `ancho`"
+        for texto in ("máquina 3 👍👍👍👍👍👍", "中文字符测试中文字符测试", "ñandú\nlisto", "‎~ Lucía 🌼"):
+            for ancho in (8, 12, 30):
+                with self.subTest(texto=texto, ancho=ancho):
+                    self.assertEqual(wcswidth(ajustar(texto, ancho)), ancho)
+
+    def test_salto_de_linea(self):
+        "Los saltos de línea se reemplazan por ' | '"
+        self.assertEqual(ajustar("a\nb", 5), "a | b")
+
+class TestHistorialPresenter(unittest.TestCase):
+    "Pruebas para el renderizado de la tabla Fecha, Autor, Mensaje"
+    @unittest.skipIf(wcswidth is None, "wcwidth no instalado")
+    def test_tabla_en_streaming(self):
+        "Las filas se escriben desde un iterador, con el encabezado y el ancho fijo"
+        salida = io.StringIO()
+        presenter = HistorialPresenter(MetaParser(), salida=salida)
+        presenter.mostrar_tabla_autor_cargo(
+            (["11/8/2025", f"Autor {i}", "maquina 3 👍"] for i in range(3)), "Chat")
+        lineas = salida.getvalue().splitlines()
+        self.assertIn("Tabla datos crudos: Chat", lineas)
+        filas = [l for l in lineas if l.startswith("| 11/8/2025")]
+        self.assertEqual(len(filas), 3)
+        self.assertEqual({wcswidth(l) for l in filas}, {wcswidth(lineas[3])})
+
+    def test_paginado(self):
+        "Con filas_por_pagina el encabezado se repite en cada página"
+        salida = io.StringIO()
+        presenter = HistorialPresenter(MetaParser(), salida=salida, filas_por_pagina=2)
+        presenter.mostrar_tabla_cruda([["f", "a", str(i)] for i in range(5)], None)
+        self.assertEqual(salida.getvalue().count("| Fecha"), 3)
+
+if __name__ == "__main__":
+    unittest.main()
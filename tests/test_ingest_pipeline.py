@@ -0,0 +1,70 @@
+"""
+Path: tests/test_ingest_pipeline.py
+"""
+import threading
+import unittest
+
+from src.application.ingest_pipeline import ENCOLADO, IngestPipeline
+from src.entities.ingest_service_interface import IIngestService
+
+class IngestaRegistrada(IIngestService):
+    "Servicio de ingesta falso: registra los lotes, puede retenerlos y falla con los `error`"
+    def __init__(self):
+        self.lotes = []
+        self.en_curso = threading.Event()
+        self.continuar = threading.Event()
+        self.continuar.set()
+
+    def send(self, payload: dict) -> str:
+        return self.send_many([payload])[0]
+
+    def send_many(self, payloads) -> list[str]:
+        payloads = list(payloads)
+        self.en_curso.set()
+        self.continuar.wait(timeout=5)
+        if any(p.get("excepcion") for p in payloads):
+            raise ConnectionError("sin red")
+        self.lotes.append(payloads)
+        return ["Error: inválido" if p.get("error") else "ok" for p in payloads]
+
+class TestIngestPipeline(unittest.TestCase):
+    "Pruebas para la etapa de ingesta en segundo plano"
+    def test_close_vacia_la_cola(self):
+        "Al cerrar se envía todo lo encolado, en lotes de hasta batch_size"
+        ingesta = IngestaRegistrada()
+        with IngestPipeline(ingesta, workers=2, batch_size=100) as pipeline:
+            self.assertEqual(pipeline.send_many({"i": i} for i in range(250)), [ENCOLADO] * 250)
+        self.assertEqual(sorted(p["i"] for lote in ingesta.lotes for p in lote), list(range(250)))
+        self.assertTrue(all(len(lote) <= 100 for lote in ingesta.lotes))
+        self.assertEqual((pipeline.enviados, pipeline.fallidos), (250, 0))
+
+    def test_contrapresion(self):
+        "Con la cola llena send bloquea hasta que los workers liberan lugar"
+        ingesta = IngestaRegistrada()
+        ingesta.continuar.clear()
+        with IngestPipeline(ingesta, workers=1, maxsize=2, batch_size=1) as pipeline:
+            pipeline.send({"i": 0})
+            self.assertTrue(ingesta.en_curso.wait(timeout=5))
+            pipeline.send_many([{"i": 1}, {"i": 2}])
+            bloqueado = threading.Thread(target=pipeline.send, args=({"i": 3},))
+            bloqueado.start()
+            bloqueado.join(timeout=0.2)
+            self.assertTrue(bloqueado.is_alive())
+            ingesta.continuar.set()
+            bloqueado.join(timeout=5)
+            self.assertFalse(bloqueado.is_alive())
+        self.assertEqual(pipeline.enviados, 4)
+
+    def test_conteo_de_errores(self):
+        "Los estados de error y las excepciones del servicio cuentan como fallidos"
+        ingesta = IngestaRegistrada()
+        pipeline = IngestPipeline(ingesta, workers=1, batch_size=1)
+        pipeline.start()
+        with self.assertLogs("wa_reader.ingest_pipeline", level="WARNING") as logs:
+            pipeline.send_many([{"i": 0}, {"i": 1, "error": True}, {"i": 2, "excepcion": True}, {"i": 3}])
+            pipeline.close()
+        self.assertEqual((pipeline.enviados, pipeline.fallidos), (2, 2))
+        self.assertIn("2 enviados, 2 con error", logs.output[-1])
+
+if __name__ == "__main__":
+    unittest.main()
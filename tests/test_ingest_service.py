@@ -0,0 +1,100 @@
+"""
+Path: tests/test_ingest_service.py
+"""
+import gzip
+import json
+import unittest
+
+try:
+    from src.interface_adapters.gateways.ingest_service import IngestService
+except ImportError:
+    IngestService = None
+
+from src.entities.records import IngestPayload
+from src.interface_adapters.gateways.ingest_protocol import mapear_estados
+
+class Respuesta:
+    "Respuesta HTTP falsa"
+    def __init__(self, texto: str, status: int = 200):
+        self.text = texto
+        self.status = status
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise ConnectionError(f"HTTP {self.status}")
+
+class SesionFalsa:
+    "Sesión que registra cada POST y responde un id por payload"
+    def __init__(self, status: int = 200):
+        self.posts = []
+        self.status = status
+
+    def post(self, url, **kwargs):
+        post = {"url": url, "json": kwargs.get("json"), "data": kwargs.get("data"),
+                "headers": kwargs.get("headers") or {}}
+        self.posts.append(post)
+        if post["json"] is not None:
+            return Respuesta(str(len(self.posts)), self.status)
+        cuerpo = post["data"]
+        if post["headers"].get("Content-Encoding") == "gzip":
+            cuerpo = gzip.decompress(cuerpo)
+        return Respuesta(json.dumps([{"id": i} for i, _p in enumerate(json.loads(cuerpo))]), self.status)
+
+class TestMapearEstados(unittest.TestCase):
+    "Pruebas para el estado por payload de un envío en bloque"
+    def test_lista_del_mismo_largo(self):
+        "Un elemento por payload: id, status o error"
+        texto = json.dumps([{"id": 7}, {"status": "dup"}, {"error": "inválido"}, 9])
+        self.assertEqual(mapear_estados(texto, 4), ["7", "dup", "Error: inválido", "9"])
+        self.assertEqual(mapear_estados(json.dumps({"results": [{"id": 1}]}), 1), ["1"])
+
+    def test_respuesta_no_alineada(self):
+        "Si la respuesta no es una lista del mismo largo, es el estado de todos"
+        self.assertEqual(mapear_estados("ok", 2), ["ok", "ok"])
+        self.assertEqual(mapear_estados("[1]", 2), ["[1]", "[1]"])
+
+@unittest.skipIf(IngestService is None, "requests no instalado")
+class TestIngestService(unittest.TestCase):
+    "Pruebas para el envío uno a uno y en bloque de IngestService"
+    def payloads(self, n: int) -> list:
+        return [IngestPayload("2025-08-11", maquina="bolsas", cantidad=i) for i in range(n)]
+
+    def servicio(self, **kwargs) -> IngestService:
+        servicio = IngestService("http://ingesta/uno", **kwargs)
+        servicio.session = SesionFalsa()
+        return servicio
+
+    def test_sin_batch_endpoint_envia_de_a_uno(self):
+        "Sin endpoint de bloque, send_many hace un POST por objeto al endpoint de siempre"
+        servicio = self.servicio()
+        self.assertEqual(servicio.send_many(self.payloads(3)), ["1", "2", "3"])
+        self.assertEqual([p["url"] for p in servicio.session.posts], ["http://ingesta/uno"] * 3)
+        self.assertEqual(servicio.session.posts[0]["json"]["cantidad"], 0)
+
+    def test_en_bloque(self):
+        "Con endpoint de bloque se envían arrays de hasta batch_size payloads"
+        servicio = self.servicio(batch_endpoint="http://ingesta/lote", batch_size=2)
+        self.assertEqual(servicio.send_many(self.payloads(5)), ["0", "1", "0", "1", "0"])
+        posts = servicio.session.posts
+        self.assertEqual([len(json.loads(p["data"])) for p in posts], [2, 2, 1])
+        self.assertEqual({p["url"] for p in posts}, {"http://ingesta/lote"})
+        self.assertNotIn("Content-Encoding", posts[0]["headers"])
+
+    def test_gzip(self):
+        "Con compress el cuerpo va comprimido y con su encabezado"
+        servicio = self.servicio(batch_endpoint="http://ingesta/lote", compress=True)
+        servicio.send_many(self.payloads(2))
+        post = servicio.session.posts[0]
+        self.assertEqual(post["headers"]["Content-Encoding"], "gzip")
+        self.assertEqual(json.loads(gzip.decompress(post["data"]))[1]["cantidad"], 1)
+
+    def test_error_http(self):
+        "Un lote rechazado marca como error a todos sus payloads"
+        servicio = self.servicio(batch_endpoint="http://ingesta/lote")
+        servicio.session.status = 500
+        estados = servicio._send_batch(self.payloads(2))  # pylint: disable=protected-access
+        self.assertEqual(len(estados), 2)
+        self.assertTrue(all(e.startswith("Error: HTTP 500") for e in estados))
+
+if __name__ == "__main__":
+    unittest.main()
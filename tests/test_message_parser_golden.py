@@ -0,0 +1,24 @@
+"""
+Path: tests/test_message_parser_golden.py
+"""
+import json
+import unittest
+from pathlib import Path
+
+from src.entities.message_parser import MessageParser
+
+GOLDEN = Path(__file__).parent / "data" / "golden_message_parser.json"
+
+class TestMessageParserGolden(unittest.TestCase):
+    "Compara la salida del parser contra el corpus golden generado con el parser original"
+    def test_corpus_golden(self):
+        "Cada mensaje del corpus produce exactamente los mismos campos y en el mismo orden"
+        parser = MessageParser()
+        casos = json.loads(GOLDEN.read_text(encoding="utf-8"))
+        for caso in casos:
+            with self.subTest(texto=caso["texto"]):
+                resultado = parser.parse(caso["texto"])
+                self.assertEqual(list(resultado.items()), list(caso["esperado"].items()))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,58 @@
+"""
+Path: tests/test_message_processor.py
+"""
+import unittest
+
+from src.entities.message_parser import MessageParser
+from src.entities.strategies import ObservacionTareaStrategy
+from src.uses_cases.message_processor import MessageProcessor
+
+class TestMessageProcessorBatch(unittest.TestCase):
+    "Pruebas para el procesamiento por lotes"
+    def setUp(self):
+        estrategia = ObservacionTareaStrategy(MessageParser())
+        self.processor = MessageProcessor(lambda: "2025-08-11", parser_strategy=estrategia)
+        self.messages = [
+            {"meta": "[10:00, 11/8/2025] A: ", "body": "maquina de bolsas hicimos 6.800 bolsas"},
+            {"meta": "[10:00, 11/8/2025] A: ", "body": "maquina de bolsas hicimos 6.800 bolsas"},
+            {"meta": "[10:05, 11/8/2025] B: ", "body": "listo"},
+        ]
+
+    def test_resultados_en_orden_y_deduplicados(self):
+        "Los duplicados dentro del lote retornan None y el resto conserva el orden"
+        resultados = self.processor.process_batch(self.messages)
+        self.assertEqual(len(resultados), 3)
+        self.assertEqual(resultados[0]["cantidad"], 6800)
+        self.assertIsNone(resultados[1])
+        self.assertEqual(resultados[2]["obs"], "Tarea Finalizada")
+
+    def test_lote_equivale_a_process(self):
+        "process_batch produce lo mismo que process mensaje a mensaje"
+        otro = MessageProcessor(lambda: "2025-08-11",
+                                parser_strategy=ObservacionTareaStrategy(MessageParser()))
+        esperado = [otro.process(m) for m in self.messages]
+        self.assertEqual(self.processor.process_batch(iter(self.messages)), esperado)
+        self.assertEqual(self.processor.process_batch(self.messages), [None, None, None])
+
+    def test_deduplicacion_por_chat(self):
+        "El mismo mensaje en otro chat no es duplicado y el payload indica su chat"
+        primero = self.processor.process_batch(self.messages[:1], "Bolsas")
+        segundo = self.processor.process_batch(self.messages[:1], "Manijas")
+        self.assertEqual((primero[0]["chat"], segundo[0]["chat"]), ("Bolsas", "Manijas"))
+        self.assertEqual(self.processor.process_batch(self.messages[:1], "Bolsas"), [None])
+        self.assertEqual(self.processor.process(self.messages[0])["chat"], "")
+
+    def test_error_de_parseo_no_registra_el_lote(self):
+        "Si parse_many falla ningún mensaje queda como visto y el reintento los procesa"
+        parse_many = self.processor.parser.parse_many
+        def fallar(texts):
+            raise ValueError("texto inesperado")
+        self.processor.parser.parse_many = fallar
+        with self.assertRaises(ValueError):
+            self.processor.process_batch(self.messages)
+        self.assertEqual(len(self.processor.seen_messages), 0)
+        self.processor.parser.parse_many = parse_many
+        self.assertEqual(self.processor.process(self.messages[0])["cantidad"], 6800)
+
+if __name__ == "__main__":
+    unittest.main()
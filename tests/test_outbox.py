@@ -0,0 +1,134 @@
+"""
+Path: tests/test_outbox.py
+"""
+import tempfile
+import threading
+import unittest
+from collections import Counter
+from pathlib import Path
+
+from src.entities.ingest_service_interface import IIngestService
+from src.infrastructure.outbox import Outbox, OutboxIngestService
+
+class IngestaIntermitente(IIngestService):
+    "Servicio de ingesta falso que falla mientras `caido` esté activo"
+    def __init__(self):
+        self.caido = False
+        self.recibidos = []
+        self.enviado = threading.Event()
+
+    def send(self, payload: dict) -> str:
+        return self.send_many([payload])[0]
+
+    def send_many(self, payloads) -> list[str]:
+        payloads = list(payloads)
+        if self.caido:
+            return ["Error: sin conexión"] * len(payloads)
+        self.recibidos.extend(payloads)
+        self.enviado.set()
+        return ["ok"] * len(payloads)
+
+class IngestaLenta(IngestaIntermitente):
+    "Servicio de ingesta falso que retiene los payloads marcados `lento` hasta `continuar`"
+    def __init__(self):
+        super().__init__()
+        self.en_curso = threading.Event()
+        self.continuar = threading.Event()
+
+    def send_many(self, payloads) -> list[str]:
+        payloads = list(payloads)
+        if any(p.get("lento") for p in payloads):
+            self.en_curso.set()
+            self.continuar.wait(timeout=5)
+        return super().send_many(payloads)
+
+class TestOutbox(unittest.TestCase):
+    "Pruebas para el outbox en disco"
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_pendientes_sobreviven_reinicio(self):
+        "Lo no confirmado se recupera al reabrir y los segmentos confirmados se eliminan"
+        outbox = Outbox(self.tmp.name, segment_bytes=64)
+        seqs = outbox.append([{"i": i} for i in range(10)])
+        outbox.ack(seqs[:4])
+        outbox.close()
+        outbox = Outbox(self.tmp.name, segment_bytes=64)
+        self.assertEqual(len(outbox), 6)
+        self.assertEqual([p["i"] for _seq, p in outbox.pendientes(100)], list(range(4, 10)))
+        outbox.ack([seq for seq, _p in outbox.pendientes(100)])
+        nuevos = outbox.append([{"i": 10}])
+        self.assertEqual(nuevos, [10])
+        outbox.ack(nuevos)
+        self.assertEqual(len(outbox), 0)
+        outbox.close()
+
+    def test_acks_se_compactan(self):
+        "Al eliminar segmentos confirmados acks.log conserva solo los acks de los segmentos vivos"
+        outbox = Outbox(self.tmp.name, segment_bytes=64)
+        for i in range(50):
+            outbox.ack(outbox.append([{"i": i}, {"i": i}]))
+        vivos = sorted(Path(self.tmp.name).glob("segment-*.log"))
+        acks = (Path(self.tmp.name) / "acks.log").read_text(encoding="utf-8").split()
+        self.assertEqual(len(vivos), 1)
+        self.assertLess(len(acks), 10)
+        self.assertGreaterEqual(min(map(int, acks)), int(vivos[0].stem.split("-")[1]))
+        pendiente = outbox.append([{"i": 50}])
+        outbox.close()
+        outbox = Outbox(self.tmp.name, segment_bytes=64)
+        self.assertEqual(outbox.pendientes(100), [(pendiente[0], {"i": 50})])
+        outbox.close()
+
+    def test_linea_truncada(self):
+        "Un registro a medio escribir por una caída se ignora y el resto se lee por posición"
+        outbox = Outbox(self.tmp.name)
+        outbox.append([{"texto": "máquina ñ"}, {"texto": "ok"}])
+        outbox.close()
+        segmento = next(Path(self.tmp.name).glob("segment-*.log"))
+        with open(segmento, "ab") as f:
+            f.write(b'{"seq": 2, "payl')
+        outbox = Outbox(self.tmp.name)
+        self.assertEqual(outbox.pendientes(10), [(0, {"texto": "máquina ñ"}), (1, {"texto": "ok"})])
+        outbox.close()
+
+    def test_reenvio_tras_caida(self):
+        "Durante una caída los payloads quedan en el outbox y se reenvían al recuperarse"
+        ingesta = IngestaIntermitente()
+        ingesta.caido = True
+        service = OutboxIngestService(ingesta, Outbox(self.tmp.name), backoff_min=0.01,
+                                      backoff_max=0.02)
+        with service:
+            self.assertTrue(service.send({"i": 0}).startswith("Error"))
+            self.assertEqual(service.send_many([{"i": 1}, {"i": 2}]), ["Encolado en outbox"] * 2)
+            ingesta.caido = False
+            self.assertTrue(ingesta.enviado.wait(timeout=5))
+        self.assertEqual(sorted(p["i"] for p in ingesta.recibidos), [0, 1, 2])
+        outbox = Outbox(self.tmp.name)
+        self.assertEqual(len(outbox), 0)
+        outbox.close()
+
+    def test_reenvio_no_duplica_envios_en_curso(self):
+        "El reenvío no toma lo que otro worker está enviando directamente"
+        ingesta = IngestaLenta()
+        service = OutboxIngestService(ingesta, Outbox(self.tmp.name), backoff_min=0.01,
+                                      backoff_max=0.02)
+        with service:
+            directo = threading.Thread(target=service.send_many, args=([{"i": 0, "lento": True}],))
+            directo.start()
+            self.assertTrue(ingesta.en_curso.wait(timeout=5))
+            ingesta.caido = True
+            self.assertTrue(service.send({"i": 1}).startswith("Error"))
+            ingesta.caido = False
+            self.assertTrue(ingesta.enviado.wait(timeout=5))
+            ingesta.continuar.set()
+            directo.join()
+        self.assertEqual(Counter(p["i"] for p in ingesta.recibidos), Counter({0: 1, 1: 1}))
+        outbox = Outbox(self.tmp.name)
+        self.assertEqual(len(outbox), 0)
+        outbox.close()
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+"""
+Path: tests/test_parallel_parser.py
+"""
+import json
+import unittest
+from pathlib import Path
+
+from src.entities.message_parser import MessageParser
+from src.uses_cases.parallel_parser import ParallelParser
+
+GOLDEN = Path(__file__).parent / "data" / "golden_message_parser.json"
+
+class TestParallelParser(unittest.TestCase):
+    "Pruebas para el parseo de lotes repartido entre procesos"
+    def setUp(self):
+        self.parser = MessageParser()
+        self.texts = [caso["texto"] for caso in json.loads(GOLDEN.read_text(encoding="utf-8"))]
+
+    def test_resultados_en_orden(self):
+        "Con varios procesos los resultados coinciden con parse mensaje a mensaje, en orden"
+        esperado = [self.parser.parse(text) for text in self.texts]
+        with ParallelParser(self.parser, workers=2, chunk_size=50) as parallel:
+            self.assertEqual(parallel.parse_many(iter(self.texts)), esperado)
+            self.assertIsNotNone(parallel._executor)
+        self.assertIsNone(parallel._executor)
+
+    def test_lotes_chicos_en_el_proceso_actual(self):
+        "Con workers <= 1 o lotes de hasta chunk_size no se crea el pool"
+        esperado = [self.parser.parse(text) for text in self.texts]
+        with ParallelParser(self.parser, workers=1, chunk_size=50) as parallel:
+            self.assertEqual(parallel.parse_many(self.texts), esperado)
+            self.assertIsNone(parallel._executor)
+        with ParallelParser(self.parser, workers=2, chunk_size=len(self.texts)) as parallel:
+            self.assertEqual(parallel.parse_many(self.texts), esperado)
+            self.assertEqual(parallel.parse_many([]), [])
+            self.assertIsNone(parallel._executor)
+
+if __name__ == "__main__":
+    unittest.main()
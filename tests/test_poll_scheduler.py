@@ -0,0 +1,39 @@
+"""
+Path: tests/test_poll_scheduler.py
+"""
+import unittest
+from datetime import datetime
+
+from src.uses_cases.poll_scheduler import PollScheduler
+
+class TestPollScheduler(unittest.TestCase):
+    "Pruebas para el intervalo de polling adaptativo"
+    def setUp(self):
+        self.scheduler = PollScheduler(min_sec=2, max_sec=60, factor=2.0,
+                                       turnos={"mañana": 6, "tarde": 14, "noche": 22},
+                                       margen_turno_min=30, techo_turno_sec=5)
+
+    def test_backoff_hasta_el_techo(self):
+        "En silencio el intervalo se duplica hasta max_sec"
+        intervalos = [self.scheduler.registrar(0) for _ in range(7)]
+        self.assertEqual(intervalos, [4, 8, 16, 32, 60, 60, 60])
+        self.assertEqual(self.scheduler.metricas()["lecturas_vacias"], 7)
+
+    def test_actividad_vuelve_al_minimo(self):
+        "Un mensaje nuevo devuelve el intervalo a min_sec"
+        for _ in range(5):
+            self.scheduler.registrar(0)
+        self.assertEqual(self.scheduler.registrar(3), 2)
+        self.assertEqual(self.scheduler.metricas()["intervalo_sec"], 2)
+
+    def test_cambio_de_turno_baja_el_techo(self):
+        "Cerca del inicio de un turno el intervalo no supera techo_turno_sec"
+        for _ in range(5):
+            self.scheduler.registrar(0)
+        self.assertEqual(self.scheduler.registrar(0, datetime(2024, 5, 2, 13, 45)), 5)
+        self.assertEqual(self.scheduler.registrar(0, datetime(2024, 5, 2, 10, 0)), 10)
+        self.assertEqual(self.scheduler.turno_cercano(datetime(2024, 5, 2, 23, 50)), None)
+        self.assertEqual(self.scheduler.turno_cercano(datetime(2024, 5, 2, 21, 40)), "noche")
+
+if __name__ == "__main__":
+    unittest.main()
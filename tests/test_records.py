@@ -0,0 +1,61 @@
+"""
+Path: tests/test_records.py
+"""
+import copy
+import json
+import pickle
+import unittest
+
+from src.entities.meta_parser import MetaParser
+from src.entities.records import IngestPayload, MetaInfo, RawMessage, a_dict
+
+class TestRecords(unittest.TestCase):
+    "Pruebas para los registros inmutables de mensajes, metas y payloads"
+    def test_inmutables(self):
+        "No se pueden modificar ni agregar atributos"
+        msg = RawMessage("[10:00, 01/06/2025] Ana: ", "hola")
+        with self.assertRaises(AttributeError):
+            msg.body = "chau"
+        with self.assertRaises(AttributeError):
+            msg.extra = 1
+        self.assertFalse(hasattr(msg, "__dict__"))
+
+    def test_acceso_como_dict(self):
+        "Se leen por clave igual que los dicts que reemplazan"
+        payload = IngestPayload("01/06/2025", maquina="3", cantidad=6800)
+        self.assertEqual(payload["maquina"], "3")
+        self.assertEqual(payload.get("obs"), "")
+        self.assertIsNone(payload.get("inexistente"))
+        self.assertIn("turno", payload)
+        with self.assertRaises(KeyError):
+            _ = payload["inexistente"]
+
+    def test_igualdad_con_dict(self):
+        "Un registro es igual al dict con los mismos campos"
+        self.assertEqual(MetaInfo("01/06/2025", "Ana"), {"fecha": "01/06/2025", "autor": "Ana"})
+        self.assertEqual(MetaParser().parse("sin formato"), {"fecha": "", "autor": ""})
+
+    def test_serializacion(self):
+        "a_dict convierte registros y deja pasar los dicts (payloads reencolados del outbox)"
+        payload = IngestPayload("01/06/2025", maquina="3")
+        self.assertEqual(json.loads(json.dumps(a_dict(payload))), payload.to_dict())
+        self.assertIs(a_dict(d := {"fecha": "x"}), d)
+
+    def test_payload_sin_chat(self):
+        "Con un solo chat el payload serializa exactamente los campos de siempre"
+        campos = ["fecha", "maquina", "formato", "cantidad", "turno", "personas", "obs"]
+        self.assertEqual(list(a_dict(IngestPayload("01/06/2025", maquina="3"))), campos)
+        self.assertEqual(list(a_dict(IngestPayload("01/06/2025", chat="Bolsas"))), campos + ["chat"])
+        self.assertEqual(IngestPayload("01/06/2025", cantidad=5), {
+            "fecha": "01/06/2025", "maquina": "", "formato": "", "cantidad": 5, "turno": "",
+            "personas": "", "obs": ""})
+
+    def test_pickle_y_copia(self):
+        "Sobreviven a pickle (multiprocessing) y a copy"
+        msg = RawMessage("meta", "cuerpo", "id1")
+        self.assertEqual(pickle.loads(pickle.dumps(msg)), msg)
+        self.assertEqual(copy.deepcopy(msg), msg)
+        self.assertEqual(hash(msg), hash(RawMessage("meta", "cuerpo", "id1")))
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,60 @@
+"""
+Path: tests/test_resumen_produccion.py
+"""
+import unittest
+
+from src.uses_cases import resumen_produccion
+from src.uses_cases.resumen_produccion import ResumenProduccion, dia_iso
+
+PAYLOADS = [
+    ({"maquina": "3", "formato": "22x10x30", "turno": "tarde", "cantidad": 6800, "personas": 3},
+     "11/8/2025"),
+    ({"maquina": "3", "formato": "22x10x30", "turno": "tarde", "cantidad": 200, "personas": 2},
+     "11/8/2025"),
+    ({"maquina": "1", "formato": "", "turno": "", "cantidad": "", "personas": ""}, "11/8/2025"),
+    ({"maquina": "3", "formato": "22x10x30", "turno": "noche", "cantidad": 100, "personas": 3},
+     "12/8/2025"),
+]
+
+class TestResumenProduccion(unittest.TestCase):
+    "Pruebas para el resumen columnar de producción"
+    def setUp(self):
+        self.resumen = ResumenProduccion()
+        for payload, dia in PAYLOADS:
+            self.resumen.agregar(payload, dia)
+
+    def test_dia_iso(self):
+        "La fecha del meta se normaliza a AAAA-MM-DD"
+        self.assertEqual(dia_iso("1/8/2025"), "2025-08-01")
+        self.assertEqual(dia_iso("1/8/25"), "2025-08-01")
+        self.assertEqual(dia_iso("sin fecha"), "sin fecha")
+
+    def test_totales_por_dia_maquina_turno(self):
+        "Suma cantidad, mensajes y persona-turnos por grupo"
+        self.assertEqual(self.resumen.agrupar(), [
+            ("2025-08-11", "1", "s/d", 0, 1, 0),
+            ("2025-08-11", "3", "tarde", 7000, 2, 5),
+            ("2025-08-12", "3", "noche", 100, 1, 3),
+        ])
+
+    def test_otras_columnas(self):
+        "Se puede agrupar por cualquier subconjunto de columnas categóricas"
+        self.assertEqual(self.resumen.agrupar(por=("maquina",)),
+                         [("1", 0, 1, 0), ("3", 7100, 3, 8)])
+
+    def test_sin_numpy(self):
+        "El recorrido en Python da los mismos totales que el camino vectorizado"
+        esperado = self.resumen.agrupar()
+        np_original = resumen_produccion.np
+        resumen_produccion.np = None
+        try:
+            self.assertEqual(self.resumen.agrupar(), esperado)
+        finally:
+            resumen_produccion.np = np_original
+
+    def test_vacio(self):
+        "Sin payloads no hay grupos"
+        self.assertEqual(ResumenProduccion().agrupar(), [])
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,71 @@
+"""
+Path: tests/test_seen_index.py
+"""
+import os
+import hashlib
+import time
+import tempfile
+import unittest
+
+from src.infrastructure.seen_index import SqliteSeenIndex, FingerprintSeenIndex
+
+class TestSqliteSeenIndex(unittest.TestCase):
+    "Pruebas para el índice persistente de mensajes vistos"
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "seen.sqlite3")
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_persiste_entre_reinicios(self):
+        "Las claves vistas sobreviven al cierre y reapertura del índice"
+        with SqliteSeenIndex(self.path) as index:
+            index.add("a" * 40)
+            self.assertIn("a" * 40, index)
+        with SqliteSeenIndex(self.path) as index:
+            self.assertIn("a" * 40, index)
+            self.assertNotIn("b" * 40, index)
+
+    def test_cache_acotada(self):
+        "La caché en memoria no supera cache_size pero las claves siguen en disco"
+        with SqliteSeenIndex(self.path, cache_size=10, commit_every=5) as index:
+            for i in range(100):
+                index.add(f"{i:040d}")
+            self.assertLessEqual(len(index._cache), 10)  # pylint: disable=protected-access
+            self.assertIn(f"{0:040d}", index)
+            self.assertEqual(len(index), 100)
+
+    def test_expiracion_por_antiguedad(self):
+        "Las claves más antiguas que max_age_days se eliminan"
+        with SqliteSeenIndex(self.path) as index:
+            index.add("viejo")
+            index.flush()
+            index._conn.execute(  # pylint: disable=protected-access
+                "UPDATE seen SET ts = ?", (int(time.time()) - 10 * 86400,))
+            index._conn.commit()  # pylint: disable=protected-access
+        with SqliteSeenIndex(self.path, max_age_days=5) as index:
+            self.assertNotIn("viejo", index)
+
+class TestFingerprintSeenIndex(unittest.TestCase):
+    "Pruebas para el índice compacto de huellas de 64 bits"
+    def test_alta_y_consulta_con_crecimiento(self):
+        "Las claves se conservan al crecer la tabla"
+        index = FingerprintSeenIndex(capacidad_inicial=4)
+        keys = [hashlib.sha1(str(i).encode()).hexdigest() for i in range(5000)]
+        for key in keys:
+            index.add(key)
+        index.add(keys[0])
+        self.assertEqual(len(index), 5000)
+        self.assertTrue(all(key in index for key in keys))
+        self.assertNotIn(hashlib.sha1(b"otro").hexdigest(), index)
+
+    def test_claves_no_hex(self):
+        "Claves arbitrarias se resuelven con una huella blake2b"
+        index = FingerprintSeenIndex()
+        index.add("hola")
+        self.assertIn("hola", index)
+        self.assertNotIn("chau", index)
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,107 @@
+"""
+Path: tests/test_whatsapp_client.py
+"""
+import tempfile
+import unittest
+from datetime import date
+
+try:
+    from src.interface_adapters.gateways.whatsapp_client import WhatsAppClient
+except ImportError:
+    WhatsAppClient = None
+
+from src.entities.records import RawMessage
+
+def chat_sintetico(cantidad: int) -> list[RawMessage]:
+    "Un mensaje por hora, cinco por día desde el 1/8/2025, con data-id"
+    return [RawMessage(f"[{10 + i % 5}:00, {1 + i // 5}/8/2025] Ana: ", f"mensaje {i}", f"id{i}")
+            for i in range(cantidad)]
+
+class ChatRenderizado:
+    """Simula el scroll del chat: sin ancla devuelve las últimas `ventana` burbujas y con ancla
+    las `ventana` anteriores a ella más la propia ancla, como cuando sigue renderizada."""
+    def __init__(self, messages: list, ventana: int = 10):
+        self.messages = messages
+        self.ventana = ventana
+        self.lecturas = 0
+
+    def __call__(self, anchor):
+        self.lecturas += 1
+        if anchor is None:
+            return self.messages[-self.ventana:]
+        fin = next(i for i, m in enumerate(self.messages) if m["id"] == anchor["id"])
+        return self.messages[max(0, fin - self.ventana):fin + 1]
+
+@unittest.skipIf(WhatsAppClient is None, "playwright no instalado")
+class TestWhatsAppClientAnclas(unittest.TestCase):
+    "Pruebas para el ancla de lectura incremental y el recorte del historial"
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cliente = WhatsAppClient(user_data_dir=self.tmp.name)
+        self.chat = chat_sintetico(25)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_crear_ancla(self):
+        "El ancla guarda el data-id y la firma meta + cuerpo; sin id queda vacío"
+        self.assertEqual(WhatsAppClient._crear_ancla(self.chat[3]),
+                         {"id": "id3", "firma": "[13:00, 1/8/2025] Ana: \nmensaje 3"})
+        self.assertEqual(WhatsAppClient._crear_ancla({"meta": "m", "body": "b"}),
+                         {"id": "", "firma": "m\nb"})
+
+    def test_cola_desde_ancla(self):
+        "Retorna lo posterior al ancla; sin ancla o si no se encuentra, todo el chat"
+        self.assertEqual(self.cliente._cola_desde_ancla(self.chat), self.chat)
+        self.cliente._anchor = self.cliente._crear_ancla(self.chat[20])
+        self.assertEqual(self.cliente._cola_desde_ancla(self.chat), self.chat[21:])
+        self.cliente._anchor = self.cliente._crear_ancla(self.chat[-1])
+        self.assertEqual(self.cliente._cola_desde_ancla(self.chat), [])
+        self.cliente._anchor = {"id": "id99", "firma": ""}
+        self.assertEqual(self.cliente._cola_desde_ancla(self.chat), self.chat)
+
+    def test_cola_desde_ancla_sin_id(self):
+        "Las burbujas leídas por elemento no tienen id: el ancla se busca por su firma"
+        por_elemento = [RawMessage(m.meta, m.body) for m in self.chat]
+        self.cliente._anchor = self.cliente._crear_ancla(por_elemento[10])
+        self.assertEqual(self.cliente._anchor["id"], "")
+        self.assertEqual(self.cliente._cola_desde_ancla(por_elemento), por_elemento[11:])
+
+    def test_anterior_a(self):
+        "Compara la fecha d/m/aaaa del meta con el límite; el mismo día no es anterior"
+        hasta = date(2025, 8, 11)
+        self.assertTrue(WhatsAppClient._anterior_a("[23:59, 10/8/2025] Ana: ", hasta))
+        self.assertFalse(WhatsAppClient._anterior_a("[00:00, 11/8/2025] Ana: ", hasta))
+        self.assertFalse(WhatsAppClient._anterior_a("[10:00, 12/08/2025] Ana: ", hasta))
+        self.assertTrue(WhatsAppClient._anterior_a("[10:00, 31/12/2024] Ana: ", hasta))
+        self.assertFalse(WhatsAppClient._anterior_a("[10:00, 31/2/2025] Ana: ", hasta))
+        self.assertFalse(WhatsAppClient._anterior_a("sin meta", hasta))
+
+    def historial(self, **kwargs) -> list[list]:
+        self.cliente._get_messages_hasta_ancla = ChatRenderizado(self.chat)
+        self.cliente._scroll_arriba = lambda anchor, espera_ms: None
+        return list(self.cliente.iter_history(**kwargs))
+
+    def test_iter_history_completo(self):
+        "Lotes del más nuevo al más viejo, sin repetir la burbuja ancla del lote anterior"
+        lotes = self.historial(reintentos=0)
+        self.assertEqual([len(lote) for lote in lotes], [10, 10, 5])
+        self.assertEqual(sum(lotes[::-1], []), self.chat)
+
+    def test_iter_history_max_mensajes(self):
+        "max_mensajes conserva los más nuevos y corta sin leer más"
+        lotes = self.historial(max_mensajes=12)
+        self.assertEqual(sum(lotes[::-1], []), self.chat[-12:])
+        self.assertEqual(self.cliente._get_messages_hasta_ancla.lecturas, 2)
+        lotes = self.historial(max_mensajes=10)
+        self.assertEqual(lotes, [self.chat[-10:]])
+
+    def test_iter_history_hasta(self):
+        "Con hasta se descartan los mensajes de días anteriores y el recorrido termina"
+        lotes = self.historial(hasta=date(2025, 8, 3))
+        self.assertEqual(sum(lotes[::-1], []), self.chat[10:])
+        lotes = self.historial(hasta=date(2025, 8, 4))
+        self.assertEqual(lotes, [self.chat[15:]])
+
+if __name__ == "__main__":
+    unittest.main()